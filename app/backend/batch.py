@@ -0,0 +1,353 @@
+### batch.py
+"""
+Batch reduction of many independent bases on a process pool.
+
+Run from the app directory:
+    python -m backend.batch bases.npy --output reduced.npz --workers 8 --timeout 10
+
+The input can be any file backend.data_sources.open_source reads.
+"""
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import numpy as np
+from operations import vector_operations as vo
+from operations import lattice_operations as lo
+from backend.data_sources import BasisSource, ArraySource, open_source
+
+# Each worker runs one reduction at a time, so BLAS threads would only compete for the same cores
+SINGLE_THREAD_ENV = {
+    'OMP_NUM_THREADS': '1',
+    'OPENBLAS_NUM_THREADS': '1',
+    'MKL_NUM_THREADS': '1',
+}
+
+OK = 'ok'
+TIMEOUT = 'timeout'
+ERROR = 'error'
+
+def reduce_one(Basis, delta=0.99, algorithm='lll', timeout=None, options=None):
+    """
+    Reduces one basis and computes the angles of the original and reduced basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix. Not modified.
+        delta (float): Lovász condition parameter.
+        algorithm (str): Name in lattice_operations.REDUCTIONS.
+        timeout (float or None): Seconds after which the reduction is cancelled.
+        options (dict): Extra keyword arguments for the reduction.
+
+    Returns:
+        status (str): OK, TIMEOUT or ERROR.
+        target_Basis (np.ndarray or None): The reduced basis.
+        angles (np.ndarray or None): (2, n) angles of the original and the reduced basis.
+        seconds (float): Time spent on this basis.
+        error (str or None): Error message for TIMEOUT and ERROR.
+    """
+    start = time.perf_counter()
+    should_stop = None
+    if timeout is not None:
+        deadline = start + timeout
+        should_stop = lambda: time.perf_counter() > deadline
+    try:
+        reduction = lo.REDUCTIONS[algorithm]
+        target_Basis = reduction(np.array(Basis, copy=True), delta=delta, should_stop=should_stop, **(options or {}))
+        angles = vo.calculate_angles_with_complementary(np.stack((Basis, target_Basis)))
+    except lo.ReductionCancelled as e:
+        return TIMEOUT, None, None, time.perf_counter() - start, str(e)
+    except Exception as e:
+        return ERROR, None, None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    angles = np.nan_to_num(angles, nan=0.0, posinf=0.0, neginf=0.0)
+    return OK, target_Basis, angles, time.perf_counter() - start, None
+
+class SharedArray:
+    """
+    A numpy array backed by a named shared memory block.
+
+    Worker processes attach by name, so only (name, shape, dtype) is pickled.
+
+    Parameters:
+        shape (tuple): Array shape.
+        dtype (np.dtype): Array data type.
+        name (str or None): Attach to an existing block; None creates a new one.
+    """
+
+    def __init__(self, shape, dtype, name=None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @property
+    def spec(self):
+        return self.shm.name, self.shape, self.dtype.str
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+# Shared blocks attached by this worker process, by name
+_attached = {}
+
+def _attach(spec):
+    name, shape, dtype = spec
+    if name not in _attached:
+        _attached[name] = SharedArray(shape, dtype, name=name)
+    return _attached[name].array
+
+def _init_worker():
+    _attached.clear()
+
+def _reduce_shared_chunk(specs, start, stop, delta, algorithm, timeout, options):
+    """
+    Worker task: reduces bases start..stop of the shared input stack and writes
+    the reduced bases and angles into the shared output stacks.
+    """
+    bases, targets, angles = (_attach(spec) for spec in specs)
+    results = []
+    for index in range(start, stop):
+        status, target_Basis, pair, seconds, error = reduce_one(bases[index], delta, algorithm, timeout, options)
+        if status == OK:
+            try:
+                targets[index] = target_Basis
+                angles[index] = pair
+            except (OverflowError, TypeError, ValueError) as e:
+                # Exact backends may return Python ints that no longer fit the input dtype
+                status, error = ERROR, f"{type(e).__name__}: {e}"
+        results.append((index, status, seconds, error))
+    return results
+
+def _reduce_chunk(bases, first, delta, algorithm, timeout, options):
+    """
+    Worker task for streamed input: reduces a pickled list of bases.
+    """
+    return [(first + i,) + reduce_one(Basis, delta, algorithm, timeout, options) for i, Basis in enumerate(bases)]
+
+@contextmanager
+def _pool(workers, start_method):
+    saved = {key: os.environ.get(key) for key in SINGLE_THREAD_ENV}
+    os.environ.update(SINGLE_THREAD_ENV)
+    try:
+        context = multiprocessing.get_context(start_method)
+        pool = concurrent.futures.ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker)
+        try:
+            yield pool
+        finally:
+            # Drop queued chunks when the consumer stops early
+            pool.shutdown(wait=True, cancel_futures=True)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+def run_bounded(pool, tasks, ordered, max_pending):
+    """
+    Submits (function, args) tasks with at most max_pending in flight and yields
+    each task's list of results, in submission order or as they complete.
+    """
+    tasks = iter(tasks)
+    pending = {}
+    done = {}
+    submitted = next_out = 0
+    exhausted = False
+    while True:
+        while not exhausted and len(pending) < max_pending:
+            task = next(tasks, None)
+            if task is None:
+                exhausted = True
+                break
+            pending[pool.submit(*task)] = submitted
+            submitted += 1
+        if not pending:
+            break
+        finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in finished:
+            position = pending.pop(future)
+            if not ordered:
+                yield future.result()
+                continue
+            done[position] = future.result()
+        while next_out in done:
+            yield done.pop(next_out)
+            next_out += 1
+
+def iter_batch(bases, delta=0.99, algorithm='lll', workers=None, chunk_size=8, ordered=True, timeout=None,
+               start_method='spawn', **options):
+    """
+    Reduces many bases on a process pool and yields one result per basis.
+
+    A stack (N, n, d) with a numeric dtype is copied once into shared memory and
+    the reduced bases and angles are written back into shared output stacks, so
+    no array is pickled. Any other iterable of bases is consumed lazily and sent
+    to the workers in pickled chunks. A BasisSource stored as one stack, such as
+    a memory-mapped .npy file, takes the shared memory path.
+
+    Parameters:
+        bases (np.ndarray, BasisSource or iterable): Stack of bases, or an iterable of basis matrices.
+        delta (float): Lovász condition parameter.
+        algorithm (str): Name in lattice_operations.REDUCTIONS.
+        workers (int or None): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of bases per task.
+        ordered (bool): Yield in input order, otherwise as soon as each chunk completes.
+        timeout (float or None): Per-basis time limit in seconds, enforced through should_stop.
+        start_method (str): multiprocessing start method. 'spawn' keeps BLAS single-threaded in workers.
+        **options: Extra keyword arguments for the reduction.
+
+    Yields:
+        result (dict): index, status (OK, TIMEOUT or ERROR), target_Basis, angles_basis_complementary,
+            target_angles_basis_complementary, seconds and error.
+    """
+    if isinstance(bases, BasisSource):
+        stack = bases.as_stack()
+        bases = stack if stack is not None else iter(bases)
+    workers = workers or os.cpu_count()
+    args = (delta, algorithm, timeout, options)
+    max_pending = 2 * workers
+
+    if isinstance(bases, np.ndarray) and bases.ndim == 3 and bases.dtype != object:
+        shared = [SharedArray(bases.shape, bases.dtype), SharedArray(bases.shape, bases.dtype),
+                  SharedArray((len(bases), 2, bases.shape[1]), np.float64)]
+        try:
+            shared[0].array[...] = bases
+            specs = [s.spec for s in shared]
+            tasks = ((_reduce_shared_chunk, specs, start, min(start + chunk_size, len(bases))) + args
+                     for start in range(0, len(bases), chunk_size))
+            with _pool(workers, start_method) as pool:
+                for results in run_bounded(pool, tasks, ordered, max_pending):
+                    for index, status, seconds, error in results:
+                        ok = status == OK
+                        yield {
+                            'index': index,
+                            'status': status,
+                            'target_Basis': shared[1].array[index].copy() if ok else None,
+                            'angles_basis_complementary': shared[2].array[index, 0].copy() if ok else None,
+                            'target_angles_basis_complementary': shared[2].array[index, 1].copy() if ok else None,
+                            'seconds': seconds,
+                            'error': error,
+                        }
+        finally:
+            for s in shared:
+                s.close()
+        return
+
+    def chunks():
+        chunk, first = [], 0
+        for Basis in bases:
+            chunk.append(np.asarray(Basis))
+            if len(chunk) == chunk_size:
+                yield (_reduce_chunk, chunk, first) + args
+                chunk, first = [], first + chunk_size
+        if chunk:
+            yield (_reduce_chunk, chunk, first) + args
+
+    with _pool(workers, start_method) as pool:
+        for results in run_bounded(pool, chunks(), ordered, max_pending):
+            for index, status, target_Basis, angles, seconds, error in results:
+                yield {
+                    'index': index,
+                    'status': status,
+                    'target_Basis': target_Basis,
+                    'angles_basis_complementary': None if angles is None else angles[0],
+                    'target_angles_basis_complementary': None if angles is None else angles[1],
+                    'seconds': seconds,
+                    'error': error,
+                }
+
+def reduce_batch(bases, delta=0.99, algorithm='lll', workers=None, chunk_size=8, timeout=None,
+                 start_method='spawn', **options):
+    """
+    Reduces a stack of equally shaped bases and collects the results into stacks.
+
+    Parameters:
+        bases (np.ndarray or iterable): Stack (N, n, d) or iterable of (n, d) bases.
+        Other parameters are as in iter_batch.
+
+    Returns:
+        batch (dict): target_Basis (N, n, d), angles_basis_complementary and
+            target_angles_basis_complementary (N, n), status and error lists and
+            seconds (N,). Rows of failed items are zero.
+    """
+    results = sorted(iter_batch(bases, delta, algorithm, workers, chunk_size, ordered=False, timeout=timeout,
+                                start_method=start_method, **options), key=lambda r: r['index'])
+    first = next((r for r in results if r['status'] == OK), None)
+    shape = first['target_Basis'].shape if first is not None else (0, 0)
+    dtype = first['target_Basis'].dtype if first is not None else np.float64
+    target = np.zeros((len(results),) + shape, dtype=dtype)
+    angles = np.zeros((len(results), 2, shape[0]))
+    for r in results:
+        if r['status'] == OK:
+            target[r['index']] = r['target_Basis']
+            angles[r['index']] = (r['angles_basis_complementary'], r['target_angles_basis_complementary'])
+    return {
+        'target_Basis': target,
+        'angles_basis_complementary': angles[:, 0],
+        'target_angles_basis_complementary': angles[:, 1],
+        'status': [r['status'] for r in results],
+        'error': [r['error'] for r in results],
+        'seconds': np.array([r['seconds'] for r in results]),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Reduce a stack of bases on a process pool.')
+    parser.add_argument('input', nargs='?', help='File of bases: .npy (memory-mapped), .npz, .csv or text lattices.')
+    parser.add_argument('--format', choices=['npy', 'npz', 'csv', 'lattice'], default=None,
+                        help='Input format, by default from the file extension.')
+    parser.add_argument('--random', type=int, nargs=3, metavar=('N', 'n', 'BITS'),
+                        help='Reduce N random n x n bases with BITS-bit entries instead of a file.')
+    parser.add_argument('--output', help='Write the results to this .npz file.')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=8)
+    parser.add_argument('--timeout', type=float, default=None, help='Per-basis time limit in seconds.')
+    parser.add_argument('--delta', type=float, default=0.99)
+    parser.add_argument('--algorithm', choices=sorted(lo.REDUCTIONS), default='lll')
+    parser.add_argument('--block-size', type=int, default=None, help="Block size for --algorithm bkz.")
+    parser.add_argument('--as-completed', action='store_true', help='Report items as they finish.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.random:
+        count, n, bits = args.random
+        source = ArraySource(np.random.default_rng(args.seed).integers(0, 2 ** bits, size=(count, n, n)))
+    elif args.input:
+        source = open_source(args.input, args.format)
+    else:
+        parser.error('give an input file or --random')
+    options = {} if args.block_size is None else {'block_size': args.block_size}
+
+    start = time.perf_counter()
+    counts = {OK: 0, TIMEOUT: 0, ERROR: 0}
+    reduced = {}
+    for result in iter_batch(source, args.delta, args.algorithm, args.workers, args.chunk_size,
+                             ordered=not args.as_completed, timeout=args.timeout, **options):
+        counts[result['status']] += 1
+        if result['status'] != OK:
+            print(f"basis {result['index']}: {result['status']} after {result['seconds']:.2f}s ({result['error']})")
+        elif args.output:
+            reduced[result['index']] = result
+    elapsed = time.perf_counter() - start
+    print(f"{len(source)} bases in {elapsed:.2f}s ({len(source) / elapsed:.1f}/s): "
+          f"{counts[OK]} ok, {counts[TIMEOUT]} timed out, {counts[ERROR]} failed")
+    if args.output:
+        # Failed items keep zero rows, as in reduce_batch
+        shape = source.shape(0)
+        first = next(iter(reduced.values()), None)
+        target = np.zeros((len(source),) + tuple(shape), dtype=first['target_Basis'].dtype if first else np.float64)
+        angles = np.zeros((len(source), 2, shape[0]))
+        for index, result in reduced.items():
+            target[index] = result['target_Basis']
+            angles[index] = (result['angles_basis_complementary'], result['target_angles_basis_complementary'])
+        np.savez(args.output, target_Basis=target, angles_basis_complementary=angles[:, 0],
+                 target_angles_basis_complementary=angles[:, 1])
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,137 @@
 import numpy as np
 from operations import vector_operations as vo
 from operations import lattice_operations as lo
+from backend.result_cache import cache_key
+from backend.data_sources import RandomSource
+from backend import profiling
 
-# Example Basis (10x10 Basis Matrix)
-Basis = np.random.randint(0, 1000, size=(10,10))
+def example_basis():
+    """
+    Returns the example basis (a random 10x10 basis matrix) shown when no file is opened.
+
+    Built on demand rather than at import, so importing this module does no work.
+    """
+    return RandomSource(n=10, high=1000)[0]
 
-def init_data(Basis = Basis):
+@profiling.profiled()
+def init_data(Basis = None, progress=None, should_stop=None, trace=False, algorithm='lll', cache=None, **options):
     """
-    Initializes data by performing LLL reduction and calculating angles.
+    Initializes data by performing lattice reduction and calculating angles.
 
     Parameters:
-        Basis (np.ndarray): The original basis matrix.
+        Basis (np.ndarray): The original basis matrix, defaults to example_basis().
+        progress (callable): Optional progress(k, swaps) callback for the reduction.
+        should_stop (callable): Optional cancellation check; the reduction raises
+            lattice_operations.ReductionCancelled when it returns True.
+        trace (bool): Record the reduction steps as an LLLTrace under the 'trace' key.
+        algorithm (str): 'lll', 'deep' or 'bkz', see lattice_operations.REDUCTIONS.
+        cache (ResultCache): Optional cache of earlier results for the same basis, algorithm and options.
+        **options: Passed on to the reduction, e.g. block_size or max_time for 'bkz'.
 
     Returns:
         data (dict): Dictionary containing original and reduced basis, angles, and other parameters.
     """
-    target_Basis = lo.LLL_reduction(Basis.copy())
+    if Basis is None:
+        Basis = example_basis()
+    key = None
+    if cache is not None:
+        key = cache_key(Basis, algorithm, **options)
+        entry = cache.get(key, need_trace=trace)
+        if entry is not None:
+            angles = (entry['angles_basis_complementary'], entry['target_angles_basis_complementary'])
+            return build_data(Basis, entry['target_Basis'], entry['trace'] if trace else None, angles)
+
+    reduction_trace = lo.LLLTrace(Basis) if trace else None
+    stats = {} if profiling.PROFILER.enabled else None
+    try:
+        with profiling.span(f'reduction.{algorithm}', rows=Basis.shape[0], columns=Basis.shape[1]):
+            target_Basis = lo.REDUCTIONS[algorithm](Basis.copy(), progress=progress, should_stop=should_stop,
+                                                    trace=reduction_trace, stats=stats, **options)
+    finally:
+        for name, value in (stats or {}).items():
+            if name != 'backend':
+                profiling.count(f'{algorithm}.{name}', value)
+    data = build_data(Basis, target_Basis, reduction_trace)
+    if cache is not None:
+        cache.put(key, target_Basis, data['angles_basis_complementary'], data['target_angles_basis_complementary'],
+                  reduction_trace)
+    return data
+
+@profiling.profiled()
+def init_edit_data(Basis, edits, session=None, reduced=None, progress=None, should_stop=None):
+    """
+    Edits the basis and re-reduces it with LLL from the first affected row after
+    each edit, see lattice_operations.IncrementalLLL.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix before the edits.
+        edits (list): Edits applied in order, each the arguments of lattice_operations.edit_basis,
+            e.g. {'action': 'append', 'values': v}.
+        session (IncrementalLLL): The session holding Basis, reused when its basis is still Basis.
+        reduced (np.ndarray): An LLL-reduced basis of Basis, seeds a new session instead of a full reduction.
+        progress (callable): Optional progress(k, swaps) callback for the reduction.
+        should_stop (callable): Optional cancellation check, see init_data.
+
+    Returns:
+        data (dict): Dictionary in the format returned by init_data for the edited basis, without a trace.
+        session (IncrementalLLL): The session holding the edited basis.
+    """
+    if session is None or not np.array_equal(session.Basis, Basis):
+        session = lo.IncrementalLLL(Basis, reduced=reduced, progress=progress, should_stop=should_stop)
+    target_Basis = session.reduced
+    for edit in edits:
+        action = edit['action']
+        if action not in ('append', 'delete', 'modify'):
+            raise ValueError("Unsupported edit. Use 'append', 'delete' or 'modify'.")
+        arguments = {name: value for name, value in edit.items() if name != 'action'}
+        rows, columns = session.Basis.shape
+        try:
+            with profiling.span(f'reduction.incremental.{action}', rows=rows, columns=columns):
+                target_Basis = getattr(session, action)(progress=progress, should_stop=should_stop, **arguments)
+        finally:
+            for name, value in session.stats.items():
+                if name not in ('backend', 'resumed_at'):
+                    profiling.count(f'incremental.{name}', value)
+    return build_data(session.Basis, target_Basis), session
+
+def init_preview_data(Basis = None):
+    """
+    Builds the same data as init_data without reducing, using the original basis as
+    its own target, so the UI can show the basis while the reduction is running.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix, defaults to example_basis().
+
+    Returns:
+        data (dict): Dictionary in the format returned by init_data.
+    """
+    if Basis is None:
+        Basis = example_basis()
+    return build_data(Basis, Basis.copy())
+
+def build_data(Basis, target_Basis, trace=None, angles=None):
+    """
+    Computes the angles and view parameters for a basis and its reduced target.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        target_Basis (np.ndarray): The reduced basis matrix.
+        trace (LLLTrace): Optional recorded reduction steps.
+        angles (tuple): Optional precomputed (basis, target) complementary angles, e.g. from a cache.
+
+    Returns:
+        data (dict): Dictionary in the format returned by init_data.
+    """
     vec_dimension = np.arange(1, Basis.shape[1] + 1)
     scale = 100  # Adjusted for smoother interpolation
     method = 'cubicspline'
     total_frames = 100  # Number of animation frames
+    easing = 'linear'  # Frame easing, see backend.frame_engine.EASINGS
 
-    angles_basis_complementary = vo.calculate_angles_with_complementary(Basis)
-    target_angles_basis_complementary = vo.calculate_angles_with_complementary(target_Basis)
+    if angles is None:
+        with profiling.span('calculate_angles', rows=Basis.shape[0], columns=Basis.shape[1]):
+            angles = vo.calculate_angles_with_complementary(np.stack((Basis, target_Basis)))
+    angles_basis_complementary, target_angles_basis_complementary = angles
 
     # Ensure angles are finite
     angles_basis_complementary = np.nan_to_num(
@@ -35,12 +144,15 @@ def init_data(Basis = Basis):
 
     return {
         'target_Basis': np.abs(target_Basis),
+        'reduced_Basis': target_Basis,  # Signed, for the projection view and basis edits
         'vec_dimension': vec_dimension,
         'scale': scale,
         'method': method,
         'angles_basis_complementary': angles_basis_complementary,
         'target_angles_basis_complementary': target_angles_basis_complementary,
-        'total_frames': total_frames
+        'total_frames': total_frames,
+        'easing': easing,
+        'trace': trace
     }
 
 def init_angle(ax, i, angle_deg, radius=0.4, offset=(0, 0)):
@@ -0,0 +1,333 @@
+"""
+Sources of bases: .npy and .npz stacks, bracketed text lattice files and CSV.
+
+A source behaves like a read-only sequence of basis matrices. Nothing is read
+until a basis is requested: .npy files and uncompressed .npz members are
+memory-mapped, and text formats are indexed by byte offset in one streaming
+pass, so a multi-GB collection can be browsed without loading it into RAM.
+"""
+import os
+import re
+import zipfile
+import numpy as np
+
+def _parse_number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def _rows_to_array(rows):
+    """
+    Stacks parsed rows into a basis. Integers beyond int64 give an object array of Python ints.
+    """
+    lengths = {len(row) for row in rows}
+    if len(lengths) > 1:
+        raise ValueError(f"Rows of a basis must have equal length, got lengths {sorted(lengths)}")
+    array = np.array(rows)
+    if array.dtype.kind not in 'iufO':
+        raise ValueError(f"Could not read numeric entries, got dtype {array.dtype}")
+    return array
+
+class BasisSource:
+    """
+    Read-only sequence of bases. Subclasses implement __len__ and _load(index).
+
+    Parameters:
+        path (str or None): File the bases are read from.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def _load(self, index):
+        raise NotImplementedError
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Basis index {index} out of range for {len(self)} bases")
+        return self._load(index % len(self))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._load(index)
+
+    def label(self, index):
+        ''' Short description of one basis, for pickers '''
+        return f"{os.path.basename(self.path) if self.path else 'basis'} [{index}]"
+
+    def shape(self, index):
+        ''' Shape of one basis, by default by loading it '''
+        return self[index].shape
+
+    def as_stack(self):
+        ''' The whole source as one (N, n, d) array if it is stored that way, otherwise None '''
+        return None
+
+    def close(self):
+        pass
+
+class ArraySource(BasisSource):
+    """
+    Bases held in an array: one (n, d) basis or an (N, n, d) stack, e.g. a memory map.
+
+    Parameters:
+        array (np.ndarray): The basis or stack of bases.
+        path (str or None): File the array came from.
+    """
+
+    def __init__(self, array, path=None):
+        super().__init__(path)
+        if array.ndim not in (2, 3):
+            raise ValueError(f"Expected a basis (n, d) or a stack (N, n, d), got shape {array.shape}")
+        self.array = array[None] if array.ndim == 2 else array
+
+    def __len__(self):
+        return len(self.array)
+
+    def _load(self, index):
+        # Copy out of the memory map so the basis can be reduced in place
+        return np.array(self.array[index])
+
+    def shape(self, index):
+        return self.array.shape[1:]
+
+    def as_stack(self):
+        return self.array
+
+class RandomSource(BasisSource):
+    """
+    Reproducible random bases with entries in [0, high), generated on access.
+
+    Parameters:
+        count (int): Number of bases.
+        n (int): Rows per basis.
+        d (int): Columns per basis, defaults to n.
+        high (int): Exclusive upper bound of the entries.
+        seed (int or None): Base seed; basis i uses seed + i. None gives fresh bases on every access.
+    """
+
+    def __init__(self, count=1, n=10, d=None, high=1000, seed=None):
+        super().__init__()
+        self.count = count
+        self.n = n
+        self.d = d or n
+        self.high = high
+        self.seed = seed
+
+    def __len__(self):
+        return self.count
+
+    def _load(self, index):
+        rng = np.random.default_rng(None if self.seed is None else self.seed + index)
+        return rng.integers(0, self.high, size=(self.n, self.d))
+
+    def label(self, index):
+        return f"random {self.n}x{self.d} [{index}]"
+
+    def shape(self, index):
+        return (self.n, self.d)
+
+class NpzSource(BasisSource):
+    """
+    Bases stored in an .npz archive, one per 2-D member or one per slice of a 3-D member.
+
+    Members stored without compression (np.savez) are memory-mapped in place;
+    compressed members are read when one of their bases is requested.
+
+    Parameters:
+        path (str): The .npz file.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._arrays = {}
+        self._entries = []
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.filename.endswith('.npy'):
+                    continue
+                name = info.filename[:-len('.npy')]
+                shape = self._member_shape(archive, info)
+                if len(shape) == 2:
+                    self._entries.append((name, None))
+                elif len(shape) == 3:
+                    self._entries.extend((name, i) for i in range(shape[0]))
+
+    @staticmethod
+    def _read_header(f):
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            return np.lib.format.read_array_header_1_0(f)
+        return np.lib.format.read_array_header_2_0(f)
+
+    def _member_shape(self, archive, info):
+        with archive.open(info) as f:
+            shape, _, _ = self._read_header(f)
+        return shape
+
+    def _member(self, name):
+        if name in self._arrays:
+            return self._arrays[name]
+        with zipfile.ZipFile(self.path) as archive:
+            info = archive.getinfo(name + '.npy')
+            array = None
+            if info.compress_type == zipfile.ZIP_STORED:
+                with open(self.path, 'rb') as f:
+                    # Data starts after the 30-byte local file header, the file name and the extra field
+                    f.seek(info.header_offset + 26)
+                    name_length, extra_length = np.frombuffer(f.read(4), dtype='<u2')
+                    f.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+                    shape, fortran_order, dtype = self._read_header(f)
+                    offset = f.tell()
+                if dtype != object:
+                    array = np.memmap(self.path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                                      order='F' if fortran_order else 'C')
+            if array is None:
+                with archive.open(info) as f:
+                    array = np.lib.format.read_array(f, allow_pickle=False)
+        self._arrays[name] = array
+        return array
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self, index):
+        name, i = self._entries[index]
+        array = self._member(name)
+        return np.array(array if i is None else array[i])
+
+    def label(self, index):
+        name, i = self._entries[index]
+        return name if i is None else f"{name} [{i}]"
+
+    def close(self):
+        self._arrays.clear()
+
+class TextSource(BasisSource):
+    """
+    Bases in a text file, indexed by byte range in one streaming pass and parsed on access.
+
+    Subclasses implement _scan(f), yielding (start, end) byte ranges of the bases,
+    and _rows(lines), yielding the rows parsed from the lines of one range.
+
+    Parameters:
+        path (str): The text file.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        with open(path, 'rb') as f:
+            self._ranges = list(self._scan(f))
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def _lines(self, index):
+        start, end = self._ranges[index]
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            position = start
+            for line in f:
+                if position >= end:
+                    break
+                # A range may end mid-line, before the next basis on the same line
+                text = line[:end - position]
+                position += len(line)
+                yield text.decode()
+
+    def _load(self, index):
+        return _rows_to_array(list(self._rows(self._lines(index))))
+
+class LatticeTextSource(TextSource):
+    """
+    fpylll/Magma-style bracketed lattices, e.g. `[[1 0 3]\\n[0 1 5]]` or `[[1, 0, 3], [0, 1, 5]]`.
+
+    Every top-level bracket group holding nested rows is one basis. A file of
+    bare row groups `[1 0 3]\\n[0 1 5]` is read as a single basis.
+    """
+    TOKEN = re.compile(rb'[\[\]]')
+    NUMBER = re.compile(r'\[|\]|[-+]?(?:\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)')
+
+    def _scan(self, f):
+        ranges = []
+        depth = max_depth = 0
+        position = start = 0
+        for line in f:
+            for match in self.TOKEN.finditer(line):
+                if match.group() == b'[':
+                    if depth == 0:
+                        start = position + match.start()
+                        max_depth = 0
+                    depth += 1
+                    max_depth = max(max_depth, depth)
+                elif depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        ranges.append((start, position + match.end(), max_depth))
+            position += len(line)
+        if ranges and all(group_depth == 1 for _, _, group_depth in ranges):
+            return [(ranges[0][0], ranges[-1][1])]
+        return [(s, e) for s, e, group_depth in ranges if group_depth > 1]
+
+    def _rows(self, lines):
+        row = []
+        for line in lines:
+            for token in self.NUMBER.findall(line):
+                if token == '[':
+                    continue
+                if token == ']':
+                    if row:
+                        yield row
+                        row = []
+                    continue
+                row.append(_parse_number(token))
+
+class CsvSource(TextSource):
+    """
+    Comma-separated rows; blank lines separate bases and lines starting with # are ignored.
+    """
+
+    def _scan(self, f):
+        position = 0
+        start = None
+        for line in f:
+            data = line.strip() and not line.lstrip().startswith(b'#')
+            if data and start is None:
+                start = position
+            elif not line.strip() and start is not None:
+                yield start, position
+                start = None
+            position += len(line)
+        if start is not None:
+            yield start, position
+
+    def _rows(self, lines):
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield [_parse_number(token) for token in line.split(',')]
+
+SOURCES = {
+    '.npz': NpzSource,
+    '.csv': CsvSource,
+}
+
+def open_source(path, fmt=None):
+    """
+    Opens a file of bases, choosing the reader from the extension unless fmt is given.
+
+    Parameters:
+        path (str): .npy (memory-mapped), .npz, .csv or any other extension for bracketed text lattices.
+        fmt (str or None): One of 'npy', 'npz', 'csv' or 'lattice'.
+
+    Returns:
+        source (BasisSource): The opened source.
+    """
+    extension = '.' + fmt if fmt else os.path.splitext(path)[1].lower()
+    if extension == '.npy':
+        return ArraySource(np.load(path, mmap_mode='r', allow_pickle=False), path)
+    return SOURCES.get(extension, LatticeTextSource)(path)
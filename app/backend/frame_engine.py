@@ -0,0 +1,195 @@
+### frame_engine.py
+from collections import OrderedDict
+import numpy as np
+from backend.data_manager import smoothstep
+
+EASINGS = {
+    'linear': lambda t: t,
+    'smoothstep': smoothstep,
+}
+
+class FrameState(dict):
+    """
+    State of one frame: series name -> array. Derived series are computed on
+    first access and kept with the frame, so they never exist for a whole chunk.
+    """
+
+    def __init__(self, values, derived=None):
+        super().__init__(values)
+        self.derived = derived or {}
+
+    def __missing__(self, name):
+        if name not in self.derived:
+            raise KeyError(name)
+        value = self[name] = self.derived[name](self)
+        return value
+
+class FrameEngine:
+    """
+    Precomputes the morph animation between a start and an end state.
+
+    Every series is a pair of equally shaped arrays (start, end). Frames are
+    evaluated in chunks of `chunk_size` frames as one (frames, *shape) tensor,
+    so looking up a frame is a slice of an already computed chunk. Derived
+    series are functions of a frame's state, computed per frame on first use.
+
+    For large bases, dtype=np.float32 halves the stored series and chunk_size=1
+    with a small max_chunks evaluates frames lazily, so only a couple of frames
+    are held at a time. A finite start array that already has the dtype is kept
+    without copying, so views can share one buffer.
+
+    Parameters:
+        series (dict): Mapping of name -> (start, end) arrays.
+        total_frames (int): Total number of frames in the animation.
+        easing (str or callable): Name in EASINGS or a function mapping [0, 1] to [0, 1].
+        chunk_size (int): Number of frames evaluated together.
+        max_chunks (int or None): Number of chunks kept in memory. None keeps every chunk.
+        dtype (np.dtype): Floating type of the stored series and the evaluated frames.
+        derived (dict): Optional mapping of name -> function(state) for series computed per frame.
+    """
+
+    def __init__(self, series, total_frames, easing='linear', chunk_size=25, max_chunks=None,
+                 dtype=np.float64, derived=None):
+        self.total_frames = total_frames
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.dtype = np.dtype(dtype)
+        self.derived = derived or {}
+        self.series = {}
+        for name, (start, end) in series.items():
+            start = _finite(start, self.dtype)
+            end = _finite(end, self.dtype)
+            self.series[name] = (start, end - start)
+        self._chunks = OrderedDict()
+
+    def nbytes(self):
+        """
+        Returns the memory held by the engine.
+
+        Returns:
+            nbytes (dict): 'series' for the stored start and delta arrays, 'chunks' for the evaluated frames.
+        """
+        series = sum(start.nbytes + delta.nbytes for start, delta in self.series.values())
+        chunks = sum(tensor.nbytes for chunk in self._chunks.values() for tensor in chunk.values())
+        return {'series': series, 'chunks': chunks}
+
+    def alphas(self, frames):
+        """
+        Returns the eased blend factor for each frame index.
+        """
+        frames = np.asarray(frames, dtype=np.float64)
+        if self.total_frames > 1:
+            t = frames / (self.total_frames - 1)
+        else:
+            t = np.ones_like(frames)
+        return self.easing(np.clip(t, 0.0, 1.0))
+
+    def bounds(self, name, axis=None):
+        """
+        Returns the (min, max) values a series takes over the whole animation,
+        or of component `axis` of its last dimension, e.g. the x of 2-D points.
+        """
+        start, delta = self.series[name]
+        end = start + delta
+        if axis is not None:
+            start, end = start[..., axis], end[..., axis]
+        return min(start.min(), end.min()), max(start.max(), end.max())
+
+    def precompute(self):
+        """
+        Evaluates every chunk up front.
+        """
+        for chunk in range(0, self.total_frames, self.chunk_size):
+            self._chunk(chunk // self.chunk_size)
+
+    def frame(self, frame):
+        """
+        Returns the state of the given frame.
+
+        Returns:
+            state (dict): Mapping of series name -> array of that series' shape.
+        """
+        frame = min(max(int(frame), 0), self.total_frames - 1)
+        chunk = self._chunk(frame // self.chunk_size)
+        offset = frame % self.chunk_size
+        return FrameState({name: tensor[offset] for name, tensor in chunk.items()}, self.derived)
+
+    def _chunk(self, index):
+        if index in self._chunks:
+            self._chunks.move_to_end(index)
+            return self._chunks[index]
+
+        first = index * self.chunk_size
+        frames = np.arange(first, min(first + self.chunk_size, self.total_frames))
+        chunk = self._evaluate(frames)
+
+        self._chunks[index] = chunk
+        if self.max_chunks is not None and len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def _evaluate(self, frames):
+        alpha = self.alphas(frames).astype(self.dtype)
+        chunk = {}
+        for name, (start, delta) in self.series.items():
+            t = alpha.reshape((-1,) + (1,) * start.ndim)
+            chunk[name] = start + t * delta
+        return chunk
+
+class TrajectoryFrameEngine(FrameEngine):
+    """
+    Frame engine that replays the recorded steps of an LLL reduction instead of
+    blending the start and end bases.
+
+    Frame f shows the basis after round(easing(t) * len(trace)) steps, rebuilt
+    through the trace's checkpoints, so memory depends on the checkpoint spacing
+    and the chunk size rather than on the number of steps.
+
+    Parameters:
+        trace (LLLTrace): The recorded reduction.
+        build (callable): Maps a stack of bases (frames, n, d) to a dict of series name -> tensor.
+        total_frames (int): Total number of frames in the animation.
+        easing (str or callable): Name in EASINGS or a function mapping [0, 1] to [0, 1].
+        chunk_size (int): Number of frames evaluated together.
+        max_chunks (int or None): Number of chunks kept in memory. None keeps every chunk.
+        dtype (np.dtype): Floating type the built series are stored in.
+        derived (dict): Optional mapping of name -> function(state) for series computed per frame.
+    """
+
+    def __init__(self, trace, build, total_frames, easing='linear', chunk_size=25, max_chunks=None,
+                 dtype=np.float64, derived=None):
+        super().__init__({}, total_frames, easing=easing, chunk_size=chunk_size, max_chunks=max_chunks,
+                         dtype=dtype, derived=derived)
+        self.trace = trace
+        self.build = build
+
+    def steps(self, frames):
+        """
+        Returns the trace step shown by each frame index.
+        """
+        return np.round(self.alphas(frames) * len(self.trace)).astype(int)
+
+    def bounds(self, name, axis=None):
+        """
+        Returns the (min, max) values a series takes over the whole animation,
+        or of component `axis` of its last dimension.
+        """
+        low, high = np.inf, -np.inf
+        for index in range(-(-self.total_frames // self.chunk_size)):
+            values = self._chunk(index)[name]
+            if axis is not None:
+                values = values[..., axis]
+            low, high = min(low, values.min()), max(high, values.max())
+        return low, high
+
+    def _evaluate(self, frames):
+        bases = np.stack([self.trace.basis_at(step) for step in self.steps(frames)])
+        return {name: tensor.astype(self.dtype, copy=False) for name, tensor in self.build(bases).items()}
+
+def _finite(values, dtype):
+    # Converts to dtype, copying only when the conversion or non-finite entries require it
+    values = np.asarray(values, dtype=dtype)
+    if not np.isfinite(values).all():
+        values = np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
+    return values
@@ -0,0 +1,194 @@
+"""
+Lightweight instrumentation: named spans and counters, exported as a JSON
+summary or in the Chrome trace event format.
+
+Profiling is off by default. While it is off, span() returns a shared no-op
+context manager and count() returns after one flag check, so instrumented code
+pays about one function call. Turn it on with enable(), from the Profile menu
+of the window, or by setting LLL_PROFILE to a file path, which also writes a
+Chrome trace there when the process exits (open it in chrome://tracing or
+https://ui.perfetto.dev).
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+# Events kept per profiling session; later ones are dropped and counted under 'profiling.dropped'
+MAX_EVENTS = 1_000_000
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """
+    Context manager that records its duration on exit, see Profiler.span.
+    """
+    __slots__ = ('profiler', 'name', 'args', 'start')
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_span(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+class Profiler:
+    """
+    Collects spans (name, start, duration, thread, arguments) and named counters.
+
+    Appending an event is atomic under the GIL, so spans can be recorded from the
+    reduction worker and the GUI thread at once; counters take a lock.
+
+    Parameters:
+        max_events (int): Maximum number of span and counter events kept.
+    """
+
+    def __init__(self, max_events=MAX_EVENTS):
+        self.enabled = False
+        self.max_events = max_events
+        self.spans = []
+        self.counters = Counter()
+        self.counter_events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.spans = []
+            self.counters = Counter()
+            self.counter_events = []
+            self._origin = time.perf_counter_ns()
+
+    def span(self, name, **args):
+        """
+        Times a block: `with profiler.span('init_data', rows=n): ...`.
+
+        Parameters:
+            name (str): Span name, spans with the same name are aggregated in summary().
+            **args: Shown with the span in the trace viewer.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def add_span(self, name, start, duration, args=None):
+        """
+        Records a span measured elsewhere, with start and duration in perf_counter nanoseconds.
+        """
+        if len(self.spans) < self.max_events:
+            self.spans.append((name, start, duration, threading.get_ident(), args))
+        else:
+            self.count('profiling.dropped')
+
+    def count(self, name, n=1):
+        """
+        Adds n to a named counter, e.g. count('lll.swaps', reducer.swaps).
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] += n
+            if len(self.counter_events) < self.max_events:
+                self.counter_events.append((name, time.perf_counter_ns(), self.counters[name]))
+
+    def summary(self):
+        """
+        Aggregates the spans by name.
+
+        Returns:
+            summary (dict): 'spans' maps names to count, total, mean and max seconds, 'counters' to totals.
+        """
+        spans = {}
+        for name, _, duration, _, _ in list(self.spans):
+            entry = spans.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += duration / 1e9
+            entry['max'] = max(entry['max'], duration / 1e9)
+        for entry in spans.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return {'spans': spans, 'counters': dict(self.counters)}
+
+    def chrome_trace(self):
+        """
+        Returns the events in the Chrome trace event format: complete ('X') events
+        for spans and counter ('C') events, with timestamps in microseconds.
+        """
+        pid = os.getpid()
+        events = []
+        for name, start, duration, tid, args in list(self.spans):
+            event = {'name': name, 'ph': 'X', 'ts': (start - self._origin) / 1e3, 'dur': duration / 1e3,
+                     'pid': pid, 'tid': tid}
+            if args:
+                event['args'] = {key: _jsonable(value) for key, value in args.items()}
+            events.append(event)
+        for name, timestamp, value in list(self.counter_events):
+            events.append({'name': name, 'ph': 'C', 'ts': (timestamp - self._origin) / 1e3, 'pid': pid,
+                           'args': {name: value}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path, fmt='chrome'):
+        """
+        Writes the recorded events to a JSON file.
+
+        Parameters:
+            path (str): Output file.
+            fmt (str): 'chrome' for a trace viewer file, 'summary' for summary().
+        """
+        if fmt not in ('chrome', 'summary'):
+            raise ValueError("Unsupported profile format. Use 'chrome' or 'summary'.")
+        data = self.chrome_trace() if fmt == 'chrome' else self.summary()
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+def _jsonable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+PROFILER = Profiler()
+
+# Module-level shortcuts to the process-wide profiler
+span = PROFILER.span
+count = PROFILER.count
+
+def profiled(name=None):
+    """
+    Decorator that wraps every call of the function in a span named after it.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with Span(PROFILER, label, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+if os.environ.get('LLL_PROFILE'):
+    PROFILER.enable()
+    atexit.register(PROFILER.export, os.environ['LLL_PROFILE'])
@@ -0,0 +1,216 @@
+"""
+Content-addressed cache of reduction results.
+
+Entries are keyed by a hash of the basis bytes, dtype and shape, the reduction
+algorithm and options and lattice_operations.REDUCTION_VERSION. They are kept in
+a small in-memory LRU and as one .npz file per entry on disk, where the least
+recently used files are evicted once the directory exceeds its size limit.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
+from operations import lattice_operations as lo
+
+DEFAULT_MAX_BYTES = 512 * 2 ** 20
+DEFAULT_MEMORY_ENTRIES = 8
+
+def default_cache_dir():
+    """
+    Returns $LLL_CACHE_DIR, or lll-visualization under the user cache directory.
+    """
+    if os.environ.get('LLL_CACHE_DIR'):
+        return os.environ['LLL_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lll-visualization')
+
+def _basis_bytes(Basis):
+    Basis = np.asarray(Basis)
+    if Basis.dtype == object:
+        # Python ints from the exact backends have no fixed-width buffer
+        return repr(Basis.tolist()).encode()
+    return np.ascontiguousarray(Basis).tobytes()
+
+def cache_key(Basis, algorithm='lll', **options):
+    """
+    Returns the hex digest identifying a reduction of Basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix.
+        algorithm (str): Name in lattice_operations.REDUCTIONS.
+        **options: Reduction options such as delta or block_size.
+
+    Returns:
+        key (str): SHA-256 hex digest.
+    """
+    Basis = np.asarray(Basis)
+    h = hashlib.sha256()
+    h.update(f"v{lo.REDUCTION_VERSION}|{algorithm}|{Basis.dtype.str}|{Basis.shape}|".encode())
+    for name in sorted(options):
+        value = options[name]
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        h.update(f"{name}={value!r}|".encode())
+    h.update(_basis_bytes(Basis))
+    return h.hexdigest()
+
+def _pack(array):
+    # np.savez would pickle object arrays, store big integers as decimal strings instead
+    array = np.asarray(array)
+    if array.dtype == object:
+        return np.array([str(v) for v in array.ravel()]).reshape(array.shape), True
+    return array, False
+
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def _unpack(array, is_object):
+    if not is_object:
+        return array
+    values = np.empty(array.size, dtype=object)
+    values[:] = [_parse_number(v) for v in array.ravel().tolist()]
+    return values.reshape(array.shape)
+
+class ResultCache:
+    """
+    Two-tier LRU cache of reduced bases, their angles and optionally the reduction trace.
+
+    Parameters:
+        directory (str or None): Directory for the .npz files, None keeps entries in memory only.
+        max_bytes (int): Size limit of the directory, enforced after every put.
+        memory_entries (int): Number of entries held in memory.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES, memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key, need_trace=False):
+        """
+        Looks up an entry, first in memory and then on disk.
+
+        Parameters:
+            key (str): Key from cache_key.
+            need_trace (bool): Treat entries stored without a trace as missing.
+
+        Returns:
+            entry (dict or None): target_Basis, angles_basis_complementary,
+                target_angles_basis_complementary and trace (LLLTrace or None).
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None and self.directory is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None or (need_trace and entry['trace'] is None):
+            return None
+        return entry
+
+    def put(self, key, target_Basis, angles_basis_complementary, target_angles_basis_complementary, trace=None):
+        """
+        Stores a result in memory and on disk, then evicts old files over the size limit.
+        """
+        entry = {
+            'target_Basis': target_Basis,
+            'angles_basis_complementary': angles_basis_complementary,
+            'target_angles_basis_complementary': target_angles_basis_complementary,
+            'trace': trace,
+        }
+        self._remember(key, entry)
+        if self.directory is not None:
+            self._save(key, entry)
+            self.evict()
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _save(self, key, entry):
+        arrays = {
+            'angles_basis_complementary': entry['angles_basis_complementary'],
+            'target_angles_basis_complementary': entry['target_angles_basis_complementary'],
+        }
+        objects = []
+        fields = {'target_Basis': entry['target_Basis']}
+        if entry['trace'] is not None:
+            fields.update({'trace_' + name: value for name, value in entry['trace'].to_arrays().items()})
+        for name, value in fields.items():
+            arrays[name], is_object = _pack(value)
+            if is_object:
+                objects.append(name)
+        arrays['object_fields'] = np.array(objects, dtype=str)
+        # Write to a temporary file and rename, so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(suffix='.npz.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                objects = set(data['object_fields'].tolist())
+                fields = {name: _unpack(data[name], name in objects) for name in data.files if name != 'object_fields'}
+            os.utime(path)  # Recency for LRU eviction
+        except (OSError, KeyError, ValueError):
+            return None
+        trace_fields = {name[len('trace_'):]: value for name, value in fields.items() if name.startswith('trace_')}
+        return {
+            'target_Basis': fields['target_Basis'],
+            'angles_basis_complementary': fields['angles_basis_complementary'],
+            'target_angles_basis_complementary': fields['target_angles_basis_complementary'],
+            'trace': lo.LLLTrace.from_arrays(trace_fields) if trace_fields else None,
+        }
+
+    def evict(self):
+        """
+        Deletes the least recently used files until the directory is within max_bytes.
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npz'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """
+        Drops every entry from memory and disk.
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.directory is not None:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.npz'):
+                    os.unlink(entry.path)
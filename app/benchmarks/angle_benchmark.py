@@ -0,0 +1,39 @@
+### angle_benchmark.py
+"""
+Times complementary-subspace angles for a stack of bases, one basis at a time
+versus a single batched call.
+
+Run from the app directory:
+    python -m benchmarks.angle_benchmark --batch 500 --sizes 10 20 40
+"""
+import argparse
+import time
+import numpy as np
+from operations import vector_operations as vo
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 40])
+    parser.add_argument('--batch', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>5} {'batch':>6} {'per-basis (s)':>14} {'batched (s)':>12} {'speedup':>8}")
+    for n in args.sizes:
+        stack = rng.integers(0, 1000, size=(args.batch, n, n))
+
+        start = time.perf_counter()
+        looped = np.array([vo.calculate_angles_with_complementary(b) for b in stack])
+        t_loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = vo.calculate_angles_with_complementary(stack)
+        t_batch = time.perf_counter() - start
+
+        # Both paths round to whole degrees, so allow one degree of rounding slack
+        assert np.allclose(looped, batched, atol=1.0)
+        print(f"{n:>5} {args.batch:>6} {t_loop:>14.4f} {t_batch:>12.4f} {t_loop / t_batch:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+### backend_benchmark.py
+"""
+Times each LLL arithmetic backend over a sweep of dimensions and entry bit-sizes,
+and checks that the output is LLL-reduced and spans the same lattice.
+
+Run from the app directory:
+    python -m benchmarks.backend_benchmark --sizes 10 40 80 --bits 10 30 60 100
+
+High-dimensional bases with small entries (--small-entry-sizes) are timed as well,
+since entry size rather than dimension alone decides when exact arithmetic pays off.
+"""
+import argparse
+import random
+import time
+import numpy as np
+from operations import lattice_operations as lo
+
+def random_basis(n, bits, rng):
+    """
+    Returns an n x n basis with uniform `bits`-bit entries, as int64 when it fits.
+    """
+    Basis = np.array([[rng.getrandbits(bits) for _ in range(n)] for _ in range(n)], dtype=object)
+    return Basis.astype(np.int64) if bits <= 62 else Basis
+
+def abs_det(Basis):
+    """
+    Exact |det| by fraction-free (Bareiss) elimination on Python ints.
+    """
+    M = [[int(x) for x in row] for row in Basis]
+    n = len(M)
+    prev = 1
+    for k in range(n - 1):
+        if M[k][k] == 0:
+            pivot = next((i for i in range(k + 1, n) if M[i][k]), None)
+            if pivot is None:
+                return 0
+            M[k], M[pivot] = M[pivot], M[k]
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                M[i][j] = (M[i][j] * M[k][k] - M[i][k] * M[k][j]) // prev
+        prev = M[k][k]
+    return abs(M[-1][-1])
+
+def is_reduced(Basis, delta, eta=0.51):
+    """
+    Checks size reduction and the Lovász condition on a float64 Gram-Schmidt of the output.
+    """
+    _, B, mu = lo.gram_schmidt_qr(np.array(Basis, dtype=np.float64))
+    if len(B) > 1 and np.abs(np.tril(mu, -1)).max() > eta + 1e-6:
+        return False
+    return all(B[k] >= (delta - mu[k, k - 1] ** 2) * B[k - 1] * (1 - 1e-9) for k in range(1, len(B)))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 40, 80])
+    parser.add_argument('--bits', type=int, nargs='+', default=[10, 30, 60, 100])
+    parser.add_argument('--small-entry-sizes', type=int, nargs='+', default=[170, 200],
+                        help='Extra dimensions timed with --small-entry-bits entries only.')
+    parser.add_argument('--small-entry-bits', type=int, default=10)
+    parser.add_argument('--backends', nargs='+', default=list(lo.REDUCERS))
+    parser.add_argument('--exact-max-dim', type=int, default=80,
+                        help='Largest n for which the exact backend is timed.')
+    parser.add_argument('--delta', type=float, default=0.99)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'n':>5} {'bits':>5} {'auto':>6} {'backend':>8} {'time (s)':>9} {'reduced':>8} {'same lattice':>13}")
+    cases = [(n, bits) for n in args.sizes for bits in args.bits]
+    cases += [(n, args.small_entry_bits) for n in args.small_entry_sizes]
+    for n, bits in cases:
+        Basis = random_basis(n, bits, random.Random(args.seed * 1000003 + n * 1009 + bits))
+        det = abs_det(Basis)
+        auto = lo.select_backend(Basis)
+        for backend in args.backends:
+            if backend == 'float' and Basis.dtype == object:
+                continue
+            if backend == 'exact' and n > args.exact_max_dim:
+                continue
+            start = time.perf_counter()
+            reduced = lo.LLL_reduction(Basis.copy(), args.delta, backend=backend)
+            elapsed = time.perf_counter() - start
+            same = abs_det(reduced) == det
+            print(f"{n:>5} {bits:>5} {auto:>6} {backend:>8} {elapsed:>9.3f} "
+                  f"{str(is_reduced(reduced, args.delta)):>8} {str(same):>13}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+### batch_benchmark.py
+"""
+Measures how the batch pipeline scales with the number of worker processes,
+for shared-memory stacks and for pickled streams of bases.
+
+Run from the app directory:
+    python -m benchmarks.batch_benchmark --count 2000 --n 20 --workers 1 2 4 8
+"""
+import argparse
+import os
+import time
+import numpy as np
+from backend import batch
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--n', type=int, default=20)
+    parser.add_argument('--bits', type=int, default=10)
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({1, 2, 4, os.cpu_count()}))
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    bases = np.random.default_rng(args.seed).integers(0, 2 ** args.bits, size=(args.count, args.n, args.n))
+    print(f"{args.count} bases of {args.n}x{args.n}, {os.cpu_count()} CPUs")
+    print(f"{'input':>7} {'workers':>8} {'time (s)':>9} {'bases/s':>9} {'speedup':>8}")
+    for name, source in (('shared', lambda: bases), ('stream', lambda: iter(bases))):
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            for _ in batch.iter_batch(source(), workers=workers, chunk_size=args.chunk_size, ordered=False):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed * workers / args.workers[0]
+            print(f"{name:>7} {workers:>8} {elapsed:>9.3f} {args.count / elapsed:>9.1f} {baseline / elapsed:>8.2f}")
+
+if __name__ == "__main__":
+    main()
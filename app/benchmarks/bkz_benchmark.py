@@ -0,0 +1,80 @@
+### bkz_benchmark.py
+"""
+Compares LLL, LLL with deep insertions and BKZ at several block sizes on
+knapsack-type lattices, reporting time against reduction quality per tour.
+
+Run from the app directory:
+    python -m benchmarks.bkz_benchmark --n 60 --block-sizes 10 20 30 --pruning linear --max-time 30
+"""
+import argparse
+import time
+import numpy as np
+from operations import lattice_operations as lo
+
+def knapsack_basis(n, bits, rng):
+    """
+    Returns the n x n basis with rows (q, 0, ..., 0) and (a_i, e_i), a_i uniform mod a `bits`-bit q.
+    """
+    q = int(rng.integers(2 ** (bits - 1), 2 ** bits))
+    Basis = np.eye(n, dtype=np.int64)
+    Basis[0, 0] = q
+    Basis[1:, 0] = rng.integers(0, q, n - 1)
+    return Basis
+
+def root_hermite_factor(Basis):
+    """
+    Returns (||b_0|| / det(L)^(1/n))^(1/n) of a basis.
+    """
+    _, B, _ = lo.gram_schmidt_qr(Basis)
+    n_rows = len(B)
+    log_det = 0.5 * np.sum(np.log(B))
+    return float(np.exp((0.5 * np.log(B[0]) - log_det / n_rows) / n_rows))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--n', type=int, default=50)
+    parser.add_argument('--bits', type=int, default=24, help='Bit size of the modulus, kept within the float engine.')
+    parser.add_argument('--block-sizes', type=int, nargs='+', default=[10, 20, 25])
+    parser.add_argument('--depth', type=int, default=None, help='Deep insertion depth, default unlimited.')
+    parser.add_argument('--pruning', choices=['none', 'linear'], default='none')
+    parser.add_argument('--max-tours', type=int, default=None)
+    parser.add_argument('--max-time', type=float, default=None, help='Time budget in seconds per BKZ run.')
+    parser.add_argument('--max-nodes', type=int, default=None)
+    parser.add_argument('--auto-abort', type=float, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    Basis = knapsack_basis(args.n, args.bits, np.random.default_rng(args.seed))
+    pruning = None if args.pruning == 'none' else args.pruning
+    runs = [('lll', lo.LLL_reduction, {'backend': 'float'}),
+            ('deep' if args.depth is None else f'deep-{args.depth}', lo.deep_LLL_reduction, {'depth': args.depth})]
+    for block_size in args.block_sizes:
+        runs.append((f'bkz-{block_size}', lo.BKZ_reduction, {
+            'block_size': block_size, 'pruning': pruning, 'max_tours': args.max_tours,
+            'max_time': args.max_time, 'max_nodes': args.max_nodes, 'auto_abort': args.auto_abort
+        }))
+
+    print(f"n={args.n}, {args.bits}-bit modulus, pruning={args.pruning}")
+    print(f"{'algorithm':>10} {'time (s)':>9} {'tours':>6} {'||b_0||':>9} {'rhf':>8}")
+    tour_logs = []
+    for name, reduction, options in runs:
+        tours = [] if reduction is lo.BKZ_reduction else None
+        if tours is not None:
+            options = dict(options, tours=tours)
+        start = time.perf_counter()
+        reduced = reduction(Basis.copy(), **options)
+        elapsed = time.perf_counter() - start
+        first = np.linalg.norm(reduced.astype(np.float64), axis=1)[0]
+        print(f"{name:>10} {elapsed:>9.3f} {len(tours or []):>6} {first:>9.2f} {root_hermite_factor(reduced):>8.5f}")
+        if tours:
+            tour_logs.append((name, tours))
+
+    for name, tours in tour_logs:
+        print(f"\n{name} per tour")
+        print(f"{'tour':>5} {'time (s)':>9} {'inserted':>9} {'nodes':>10} {'||b_0||':>9} {'rhf':>8}")
+        for stats in tours:
+            print(f"{stats['tour']:>5} {stats['seconds']:>9.3f} {stats['insertions']:>9} {stats['nodes']:>10} "
+                  f"{stats['first_norm']:>9.2f} {stats['root_hermite_factor']:>8.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares re-reducing a basis from scratch with IncrementalLLL after each edit,
+for a session that appends vectors one at a time and then deletes and modifies
+rows, checking after every edit that the incremental result spans the same
+lattice as a from-scratch reduction.
+
+Run from the app directory:
+    python -m benchmarks.incremental_benchmark --start 10 --appends 20 --high 1000
+"""
+import argparse
+import time
+import numpy as np
+from operations import lattice_operations as lo
+
+def edits(rng, n_cols, appends, high):
+    for _ in range(appends):
+        yield {'action': 'append', 'values': rng.integers(-high, high, size=n_cols, endpoint=True)}
+    # Edits near the end resume from a late prefix, the ones at row 1 from the earliest
+    for index in (-2, 1):
+        yield {'action': 'delete', 'index': index}
+        yield {'action': 'modify', 'index': index, 'values': rng.integers(-high, high, size=n_cols, endpoint=True)}
+
+def same_lattice(A, B):
+    """
+    Checks that two bases span the same lattice, i.e. A = X B with X integral and |det X| = 1.
+    """
+    if A.shape != B.shape:
+        return False
+    A, B = np.asarray(A, dtype=np.float64), np.asarray(B, dtype=np.float64)
+    X = np.linalg.lstsq(B.T, A.T, rcond=None)[0].T
+    return (np.allclose(X, np.round(X), atol=1e-6) and np.allclose(np.round(X) @ B, A)
+            and np.isclose(abs(np.linalg.det(np.round(X))), 1.0))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--start', type=int, default=10, help='Rows of the initial basis.')
+    parser.add_argument('--appends', type=int, default=20)
+    parser.add_argument('--high', type=int, default=1000, help='Largest absolute entry.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n_cols = args.start + args.appends
+    Basis = rng.integers(-args.high, args.high, size=(args.start, n_cols), endpoint=True)
+    session = lo.IncrementalLLL(Basis)
+    print(f"{'edit':>8} {'rows':>5} {'full (ms)':>10} {'incremental (ms)':>17} {'resumed at':>11} {'swaps':>6}")
+    full_total = incremental_total = 0.0
+    for edit in edits(rng, n_cols, args.appends, args.high):
+        if 'index' in edit:
+            edit['index'] %= session.Basis.shape[0]
+        begin = time.perf_counter()
+        edited = lo.edit_basis(session.Basis, **edit)
+        expected = lo.LLL_reduction(edited.copy())
+        full = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        arguments = {name: value for name, value in edit.items() if name != 'action'}
+        reduced = getattr(session, edit['action'])(**arguments)
+        incremental = time.perf_counter() - begin
+        if not same_lattice(reduced, expected):
+            raise AssertionError(f"{edit['action']} of row {edit.get('index')} changed the lattice")
+        full_total += full
+        incremental_total += incremental
+        print(f"{edit['action']:>8} {session.Basis.shape[0]:>5} {1e3 * full:>10.2f} {1e3 * incremental:>17.2f} "
+              f"{session.stats['resumed_at']:>11} {session.stats['swaps']:>6}")
+    print(f"{'total':>8} {'':>5} {1e3 * full_total:>10.2f} {1e3 * incremental_total:>17.2f}")
+
+if __name__ == "__main__":
+    main()
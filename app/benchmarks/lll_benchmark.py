@@ -0,0 +1,100 @@
+### lll_benchmark.py
+"""
+Compares the incremental LLL engine against the original implementation,
+which re-runs Gram-Schmidt after every size reduction and swap.
+
+Run from the app directory:
+    python -m benchmarks.lll_benchmark --sizes 10 20 50 100 200
+"""
+import argparse
+import time
+import numpy as np
+from operations import lattice_operations as lo
+
+def reference_gram_schmidt(Basis):
+    """
+    The original Gram-Schmidt, one projection at a time. lattice_operations.gram_schmidt
+    now uses a QR factorization, so the baseline keeps its own copy.
+    """
+    n_rows = Basis.shape[0]
+    U = np.zeros_like(Basis, dtype=np.float64)
+    U[0] = Basis[0]
+    for i in range(1, n_rows):
+        proj = sum((np.dot(Basis[i], U[j]) / np.dot(U[j], U[j])) * U[j] for j in range(i))
+        U[i] = Basis[i] - proj
+    return U
+
+def reference_compute_coeff(Basis, U, mu):
+    """
+    The original element-by-element computation of the mu coefficients.
+    """
+    n_rows = Basis.shape[0]
+    for i in range(n_rows):
+        for j in range(i):
+            mu[i][j] = np.dot(Basis[i], U[j]) / np.dot(U[j], U[j])
+    return mu
+
+def reference_LLL_reduction(Basis, delta=0.99):
+    """
+    The original LLL loop, kept here as the baseline for timings and results.
+    """
+    n_rows, n_cols = Basis.shape
+    U = reference_gram_schmidt(Basis)
+    mu = np.zeros((n_rows, n_cols))
+    k = 1
+
+    while k < n_rows:
+        for j in range(k - 1, -1, -1):
+            mu = reference_compute_coeff(Basis, U, mu)
+            if abs(mu[k][j]) > 0.5:
+                Basis[k] = Basis[k] - np.round(mu[k][j]) * Basis[j]
+                U = reference_gram_schmidt(Basis)
+
+        mu = reference_compute_coeff(Basis, U, mu)
+        mu_k_k1 = mu[k][k - 1]
+        norm_Uk = np.dot(U[k], U[k])
+        norm_Uk1 = np.dot(U[k - 1], U[k - 1])
+        if norm_Uk >= (delta - mu_k_k1 ** 2) * norm_Uk1:
+            k += 1
+        else:
+            Basis[[k, k - 1]] = Basis[[k - 1, k]]
+            U = reference_gram_schmidt(Basis)
+            k = max(k - 1, 1)
+    return Basis
+
+def time_call(func, Basis, repeat):
+    """
+    Returns the best wall time over `repeat` runs and the last result.
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        b = Basis.copy()
+        start = time.perf_counter()
+        result = func(b)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 50, 100, 200])
+    parser.add_argument('--reference-max', type=int, default=20,
+                        help='Largest n for which the original implementation is timed.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>5} {'reference (s)':>14} {'incremental (s)':>16} {'speedup':>8} {'same':>5}")
+    for n in args.sizes:
+        Basis = rng.integers(0, 1000, size=(n, n))
+        t_new, reduced = time_call(lambda b: lo.LLL_reduction(b, backend='float'), Basis, args.repeat)
+        if n <= args.reference_max:
+            t_ref, expected = time_call(reference_LLL_reduction, Basis, 1)
+            same = np.array_equal(reduced, expected)
+            print(f"{n:>5} {t_ref:>14.4f} {t_new:>16.4f} {t_ref / t_new:>7.1f}x {str(same):>5}")
+        else:
+            print(f"{n:>5} {'-':>14} {t_new:>16.4f} {'-':>8} {'-':>5}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Times min/max envelope and LTTB decimation of a stack of rows against the
+number of vertices they save, for growing dimensions at a fixed axis width.
+
+Run from the app directory:
+    python -m benchmarks.lod_benchmark --rows 50 --dims 1000 10000 100000 --pixels 1200
+"""
+import argparse
+import time
+import numpy as np
+from operations import vector_operations as vo
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--dims', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--pixels', type=int, default=1200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'d':>7} {'method':>7} {'time (ms)':>10} {'vertices':>10} {'full':>10}")
+    for d in args.dims:
+        x = np.arange(1, d + 1, dtype=np.float64)
+        Y = np.cumsum(rng.normal(size=(args.rows, d)), axis=1)
+        for name, decimate in (('minmax', lambda: vo.minmax_envelope(x, Y, 0, d, args.pixels)),
+                               ('lttb', lambda: vo.lttb(x, Y, 0, d, 2 * args.pixels))):
+            start = time.perf_counter()
+            xs, ys = decimate()
+            elapsed = time.perf_counter() - start
+            # Every bucket keeps its extremes, so the drawn range matches the full rows
+            if name == 'minmax':
+                assert np.allclose(ys.max(axis=1), Y.max(axis=1)) and np.allclose(ys.min(axis=1), Y.min(axis=1))
+            print(f"{d:>7} {name:>7} {1000 * elapsed:>10.2f} {ys.size:>10} {Y.size:>10}")
+
+if __name__ == "__main__":
+    main()
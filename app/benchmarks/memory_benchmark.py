@@ -0,0 +1,58 @@
+"""
+Compares the memory of the standard view's frame engine in the full and the
+compact (float32, lazy frames) storage modes for growing square bases.
+
+Reports the bytes held by the engine after evaluating a few frames and the
+peak traced allocation while building it and evaluating them.
+
+Run from the app directory:
+    python -m benchmarks.memory_benchmark --sizes 500 1000 2000 --frames 3
+
+The full mode evaluates chunks of 25 float64 frames, about 5 GB at n = 5000, so
+large sizes may only fit in the compact mode.
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from operations import vector_operations as vo
+from frontend.plots import standard_frame_engine
+
+def measure(Basis, target_Basis, compact, n_frames, scale=100, total_frames=100):
+    vec_dimension = np.arange(1, Basis.shape[1] + 1)
+    dtype = np.float32 if compact else np.float64
+    start, end = np.asarray(Basis, dtype=dtype), np.asarray(target_Basis, dtype=dtype)
+    tracemalloc.start()
+    begin = time.perf_counter()
+    interp = vo.interpolate(vec_dimension, start, scale=scale, ret='Y').astype(dtype)
+    target_interp = vo.interpolate(vec_dimension, end, scale=scale, ret='Y').astype(dtype)
+    angles = np.zeros(Basis.shape[0])
+    frames = standard_frame_engine(vec_dimension, start, end, interp, target_interp, angles, angles,
+                                   total_frames, compact=compact)
+    for frame in np.linspace(0, total_frames - 1, n_frames).astype(int):
+        frames.frame(frame)['offsets']
+    elapsed = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    held = frames.nbytes()
+    return held['series'] + held['chunks'] + interp.nbytes + target_interp.nbytes, peak, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000, 2000])
+    parser.add_argument('--frames', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>6} {'storage':>8} {'held (MB)':>10} {'peak (MB)':>10} {'time (s)':>9}")
+    for n in args.sizes:
+        Basis = rng.integers(-1000, 1000, size=(n, n))
+        target_Basis = rng.integers(-100, 100, size=(n, n))
+        for compact in (False, True):
+            held, peak, elapsed = measure(Basis, target_Basis, compact, args.frames)
+            name = 'compact' if compact else 'full'
+            print(f"{n:>6} {name:>8} {held / 2 ** 20:>10.1f} {peak / 2 ** 20:>10.1f} {elapsed:>9.2f}")
+
+if __name__ == "__main__":
+    main()
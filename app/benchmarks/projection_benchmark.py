@@ -0,0 +1,48 @@
+"""
+Times fitting each 2-D projection on a basis pair and projecting the
+animation frames with it, for bases with many rows and thousands of columns.
+
+Run from the app directory:
+    python -m benchmarks.projection_benchmark --rows 50 --dims 500 2000 8000 --frames 100
+"""
+import argparse
+import time
+import numpy as np
+from operations import projection_operations as po
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50)
+    parser.add_argument('--dims', type=int, nargs='+', default=[500, 2000, 8000])
+    parser.add_argument('--frames', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'d':>6} {'method':>9} {'fit (s)':>9} {'per frame (ms)':>15} {'stress':>8}")
+    for d in args.dims:
+        Basis = rng.integers(-1000, 1000, size=(args.rows, d)).astype(np.float64)
+        target_Basis = Basis + rng.normal(0, 100, size=Basis.shape)
+        alphas = np.linspace(0, 1, args.frames)[:, None, None]
+        frames = Basis + alphas * (target_Basis - Basis)
+        original = np.linalg.norm(Basis[:, None] - Basis[None], axis=-1)
+
+        for method in po.PROJECTIONS:
+            start = time.perf_counter()
+            projection = po.fit_projection(Basis, target_Basis, method)
+            t_fit = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for frame in frames:
+                projection.transform(frame)
+            t_frame = (time.perf_counter() - start) / args.frames
+
+            # Normalized stress of the projected pairwise distances of the first frame
+            points = projection.transform(Basis)
+            projected = np.linalg.norm(points[:, None] - points[None], axis=-1)
+            scale = np.sum(original * projected) / np.sum(projected ** 2)
+            stress = np.sqrt(np.sum((original - scale * projected) ** 2) / np.sum(original ** 2))
+            print(f"{d:>6} {method:>9} {t_fit:>9.4f} {1000 * t_frame:>15.3f} {stress:>8.3f}")
+
+if __name__ == "__main__":
+    main()
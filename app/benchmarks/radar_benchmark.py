@@ -0,0 +1,78 @@
+### radar_benchmark.py
+"""
+Measures radar-view frame time against the number of basis rows, comparing
+in-place polygon updates with removing and re-creating every fill per frame.
+
+Renders on an offscreen Agg canvas. Run from the app directory:
+    python -m benchmarks.radar_benchmark --rows 10 50 100 200
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from frontend.plots import create_radar_graph, radar_frame_engine, apply_radar_frame
+
+def recreate_radar_frame(state, radar_data):
+    """
+    The previous radar update, which replaced every fill polygon each frame.
+    """
+    ax = radar_data['ax']
+    theta = radar_data['theta']
+    fills = radar_data['fills']
+    for i, line in enumerate(radar_data['lines']):
+        row = state['radar'][i]
+        line.set_ydata(row)
+        fills[i].remove()
+        fills[i] = ax.fill(theta, row, alpha=0.25)[0]
+
+def run(update, n_rows, dimension, n_frames, rng):
+    """
+    Returns mean update and draw time (seconds per frame), plus the memory
+    growth in bytes over a second, traced pass of updates.
+    """
+    fig = Figure(figsize=(8, 8))
+    canvas = FigureCanvasAgg(fig)
+    start = rng.integers(0, 1000, size=(n_rows, dimension))
+    end = rng.integers(0, 1000, size=(n_rows, dimension))
+    radar_data = create_radar_graph(fig, start, end, [f"Dimension {i + 1}" for i in range(dimension)])
+    frames = radar_frame_engine(radar_data, n_frames)
+    frames.precompute()
+    canvas.draw()
+
+    t_update = t_draw = 0.0
+    for frame in range(n_frames):
+        t0 = time.perf_counter()
+        update(frames.frame(frame), radar_data)
+        t1 = time.perf_counter()
+        canvas.draw()
+        t2 = time.perf_counter()
+        t_update += t1 - t0
+        t_draw += t2 - t1
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for frame in range(n_frames):
+        update(frames.frame(frame), radar_data)
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return t_update / n_frames, t_draw / n_frames, growth
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10, 50, 100, 200])
+    parser.add_argument('--dimension', type=int, default=10)
+    parser.add_argument('--frames', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>5} {'mode':>9} {'update (ms)':>12} {'draw (ms)':>10} {'mem growth (KiB)':>17}")
+    for n_rows in args.rows:
+        for mode, update in (('recreate', recreate_radar_frame), ('in-place', apply_radar_frame)):
+            rng = np.random.default_rng(args.seed)
+            t_update, t_draw, growth = run(update, n_rows, args.dimension, args.frames, rng)
+            print(f"{n_rows:>5} {mode:>9} {t_update * 1e3:>12.2f} {t_draw * 1e3:>10.2f} {growth / 1024:>17.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures start-up: per-module import times from `python -X importtime` and the
+time until the window skeleton is shown and until the first frame is drawn.
+
+Each measurement runs in a fresh interpreter so nothing is already imported.
+The window timings use the offscreen Qt platform and are skipped when PyQt5
+is not installed.
+
+Run from the app directory:
+    python -m benchmarks.startup_benchmark --runs 5 --top 15
+    python -m benchmarks.startup_benchmark --output startup.json --baseline old.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Reports seconds from interpreter start to the skeleton window and to the first drawn frame
+WINDOW_SCRIPT = """
+import time
+start = time.perf_counter()
+import json, os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWidgets import QApplication
+from frontend.ui_main import MyApp
+app = QApplication([])
+window = MyApp()
+window.show()
+# Paint the skeleton synchronously: processing events would also run the deferred start-up,
+# which QTimer.singleShot(0) posts as an event
+window.repaint()
+shown = time.perf_counter() - start
+while not hasattr(window, 'anim'):
+    app.processEvents()
+ready = time.perf_counter() - start
+window.close()
+print(json.dumps({'window shown': shown, 'first frame': ready}))
+"""
+
+def import_times(module):
+    """
+    Imports module in a fresh interpreter with -X importtime.
+
+    Returns:
+        times (dict): Module name -> (self, cumulative) import time in seconds.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=APP_DIR, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return times
+
+def window_times():
+    result = subprocess.run([sys.executable, '-c', WINDOW_SCRIPT], cwd=APP_DIR, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='frontend.ui_main', help='Module whose import is broken down.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest modules to list.')
+    parser.add_argument('--output', help='Write the median timings to this JSON file.')
+    parser.add_argument('--baseline', help='JSON timings to compare against.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio that counts as a regression.')
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    cumulative = {name: statistics.median(run[name][1] for run in runs if name in run) for name in runs[0]}
+    own = {name: statistics.median(run[name][0] for run in runs if name in run) for name in runs[0]}
+    print(f"{'module':<50} {'self (ms)':>10} {'cumulative (ms)':>16}")
+    for name in sorted(own, key=own.get, reverse=True)[:args.top]:
+        print(f"{name:<50} {1e3 * own[name]:>10.1f} {1e3 * cumulative[name]:>16.1f}")
+    print(f"scipy imported: {'scipy' in cumulative}, pyplot imported: {'matplotlib.pyplot' in cumulative}")
+
+    results = {f'import {args.module}': cumulative[args.module]}
+    try:
+        windows = [window_times() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"window timings skipped ({e})")
+    else:
+        for key in windows[0]:
+            results[key] = statistics.median(run[key] for run in windows)
+    print()
+    for key, seconds in results.items():
+        print(f"{key:<50} {1e3 * seconds:>10.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = [key for key in results if key in baseline and results[key] > args.threshold * baseline[key]]
+        for key in results:
+            if key in baseline:
+                print(f"{key:<50} {1e3 * baseline[key]:>10.1f} -> {1e3 * results[key]:.1f} ms"
+                      f"{'  REGRESSION' if key in regressions else ''}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Benchmark suite for the operations and rendering layers, with JSON results
+and regression checks against a saved baseline.
+
+Every benchmark is swept over a grid of parameters (rows n, columns d, entry
+bit size and seed) and timed with timeit's autorange, keeping the minimum and
+median of several repeats. The per-frame MyApp.update benchmark runs on an
+offscreen Qt platform and is skipped when PyQt5 is not installed. The import
+benchmark times a fresh interpreter importing each layer, see
+benchmarks.startup_benchmark for a per-module breakdown.
+
+Run from the app directory:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 1.25 --filter lll
+"""
+import argparse
+import fnmatch
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+import numpy as np
+
+# Parameter grids; --quick uses the first value of every list
+GRID = {
+    'n': [10, 20, 40],
+    'd_factor': [1, 2],
+    'bits': [10, 30],
+    'seed': [0],
+}
+FRAME_GRID = {
+    'n': [10, 50],
+    'd_factor': [1, 20],
+    'bits': [10],
+    'seed': [0],
+    'view': ['standard_view', 'radar_graph'],
+}
+
+BENCHMARKS = {}
+
+def benchmark(name, grid=GRID, square=False):
+    """
+    Registers a benchmark. The decorated function takes one grid point as
+    keyword arguments and returns the zero-argument callable to time.
+
+    Parameters:
+        name (str): Benchmark name.
+        grid (dict): Parameter name -> list of values.
+        square (bool): Only run square bases (d_factor == 1).
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, grid, square)
+        return setup
+    return register
+
+def random_basis(n, d_factor, bits, seed):
+    """
+    Returns an n x (d_factor * n) integer basis with entries in [0, 2^bits).
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2 ** bits, size=(n, d_factor * n), dtype=np.int64)
+
+@benchmark('gram_schmidt')
+def bench_gram_schmidt(n, d_factor, bits, seed):
+    from operations import lattice_operations as lo
+    Basis = random_basis(n, d_factor, bits, seed)
+    return lambda: lo.gram_schmidt(Basis)
+
+@benchmark('compute_coeff')
+def bench_compute_coeff(n, d_factor, bits, seed):
+    from operations import lattice_operations as lo
+    Basis = random_basis(n, d_factor, bits, seed).astype(np.float64)
+    U = lo.gram_schmidt(Basis)
+    mu = np.zeros((n, n))
+    return lambda: lo.compute_coeff(Basis, U, mu)
+
+@benchmark('LLL_reduction', square=True)
+def bench_lll(n, d_factor, bits, seed):
+    from operations import lattice_operations as lo
+    Basis = random_basis(n, d_factor, bits, seed)
+    return lambda: lo.LLL_reduction(Basis.copy())
+
+@benchmark('calculateNormal', square=True)
+def bench_normal(n, d_factor, bits, seed):
+    from operations import vector_operations as vo
+    Basis = random_basis(n, d_factor, bits, seed)
+    return lambda: vo.calculateNormal(Basis, scaled=False)
+
+@benchmark('calculateAngle')
+def bench_angle(n, d_factor, bits, seed):
+    from operations import vector_operations as vo
+    Basis = random_basis(n, d_factor, bits, seed)
+    normals = vo.calculateNormal(Basis, scaled=False)
+    return lambda: vo.calculateAngle(Basis, normals)
+
+@benchmark('interpolate')
+def bench_interpolate(n, d_factor, bits, seed):
+    from operations import vector_operations as vo
+    Basis = random_basis(n, d_factor, bits, seed)
+    vec_dimension = np.arange(1, Basis.shape[1] + 1)
+    return lambda: vo.interpolate(vec_dimension, Basis, scale=100, ret='Y')
+
+_qt_app = None
+
+def _offscreen_window(Basis, view):
+    """
+    Builds a MyApp for Basis on the offscreen Qt platform with the reduced data
+    loaded and the animation timer stopped, so frames are driven by the benchmark.
+    """
+    global _qt_app
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    from backend.data_manager import init_data
+    from backend.data_sources import ArraySource
+    from frontend.ui_main import MyApp
+
+    _qt_app = QApplication.instance() or QApplication([])
+    window = MyApp(ArraySource(Basis))
+    while window.reduction_worker is None:
+        _qt_app.processEvents()  # Runs the deferred start-up
+    window.reduction_worker.cancel()
+    window.reduction_thread.quit()
+    window.reduction_thread.wait()
+    window.reduction_worker = None  # Ignore the queued signals of the cancelled worker
+    window.data = init_data(Basis)
+    window.current_view = view
+    window.show_current_view()
+    window.stop_animation()
+    window.resize(1600, 900)
+    window.canvas.draw()
+    return window
+
+@benchmark('MyApp.update', grid=FRAME_GRID)
+def bench_update(n, d_factor, bits, seed, view):
+    Basis = random_basis(n, d_factor, bits, seed)
+    window = _offscreen_window(Basis, view)
+    frames = itertools.cycle(range(window.data['total_frames']))
+
+    def step():
+        # One animation tick: the frame state pushed into the artists and blitted
+        window.anim.draw_frame(next(frames))
+    step.cleanup = window.close
+    return step
+
+@benchmark('profiling.span', grid={'enabled': [False, True]})
+def bench_span(enabled):
+    # Overhead per instrumented block; with profiling off this should stay near a bare function call
+    from backend.profiling import Profiler
+    profiler = Profiler()
+    if enabled:
+        profiler.enable()
+
+    def step():
+        with profiler.span('step'):
+            pass
+        if len(profiler.spans) > 100000:
+            profiler.reset()
+    return step
+
+# Points indexed by the hover benchmark; rebuild includes the KD-tree rebuild after a frame change
+HOVER_GRID = {
+    'points': [1000, 10000, 100000],
+    'rebuild': [False, True],
+}
+
+@benchmark('PointPicker.query', grid=HOVER_GRID)
+def bench_hover(points, rebuild):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from frontend.plots import PointPicker
+
+    fig = Figure(figsize=(16, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    rows = max(points // 1000, 1)
+    x = np.broadcast_to(np.arange(1, points // rows + 1, dtype=np.float64), (rows, points // rows))
+    y = np.random.default_rng(0).normal(size=x.shape).cumsum(axis=1)
+    ax.set_xlim(0, x.shape[1] + 1)
+    ax.set_ylim(y.min(), y.max())
+    picker = PointPicker(ax, describe=lambda row, column, point: '')
+    offsets = np.stack((x, y), axis=-1)
+    picker.set_frame(offsets)
+    targets = itertools.cycle(ax.transData.transform(offsets.reshape(-1, 2)[::97]))
+
+    def step():
+        if rebuild:
+            picker.set_frame(offsets)
+        picker.query(*next(targets))
+    return step
+
+# Modules timed by the import benchmark, from the operations layer up to the window
+IMPORT_GRID = {
+    'module': ['operations.lattice_operations', 'backend.data_manager', 'frontend.plots', 'frontend.ui_main'],
+}
+
+@benchmark('import', grid=IMPORT_GRID)
+def bench_import(module):
+    # A fresh interpreter per call, so nothing is cached; includes interpreter start-up
+    import subprocess
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, '-c', f'import {module}']
+    probe = subprocess.run(command, cwd=app_dir, capture_output=True, text=True)
+    if probe.returncode:
+        raise ImportError(probe.stderr.strip().splitlines()[-1])  # Reported as skipped, e.g. without PyQt5
+    return lambda: subprocess.run(command, cwd=app_dir, check=True)
+
+def points(grid, square, quick):
+    names = list(grid)
+    values = [grid[name][:1] if quick else grid[name] for name in names]
+    for combination in itertools.product(*values):
+        params = dict(zip(names, combination))
+        if square and params.get('d_factor', 1) != 1:
+            continue
+        yield params
+
+def case_name(name, params):
+    return name + '[' + ','.join(f'{key}={value}' for key, value in params.items()) + ']'
+
+def measure(func, repeat, min_time):
+    """
+    Returns timing statistics in seconds per call, timeit-style.
+    """
+    timer = timeit.Timer(func)
+    loops, elapsed = timer.autorange()
+    if elapsed < min_time:
+        loops = max(loops, int(np.ceil(loops * min_time / max(elapsed, 1e-9))))
+    times = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'max': max(times),
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+def environment():
+    import scipy
+    import matplotlib
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+    }
+
+def run(patterns, quick=False, repeat=5, min_time=0.2):
+    """
+    Runs every registered benchmark matching one of the glob patterns.
+
+    Returns:
+        results (dict): Case name -> timing statistics, skipped cases -> {'skipped': reason}.
+    """
+    results = {}
+    for name, (setup, grid, square) in BENCHMARKS.items():
+        if not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        for params in points(grid, square, quick):
+            case = case_name(name, params)
+            try:
+                func = setup(**params)
+            except ImportError as e:
+                results[case] = {'skipped': str(e)}
+                print(f"{case:<60} skipped ({e})")
+                continue
+            try:
+                results[case] = measure(func, repeat, min_time)
+            finally:
+                getattr(func, 'cleanup', lambda: None)()
+            print(f"{case:<60} {1e3 * results[case]['median']:>12.4f} ms")
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Compares median times against a baseline.
+
+    Returns:
+        regressions (list): (case, ratio) for cases slower than threshold times the baseline.
+    """
+    regressions = []
+    print(f"\n{'case':<60} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>7}")
+    for case, stats in results.items():
+        previous = baseline.get(case)
+        if 'median' not in stats or not previous or 'median' not in previous:
+            continue
+        ratio = stats['median'] / previous['median']
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append((case, ratio))
+        elif ratio < 1 / threshold:
+            flag = '  faster'
+        print(f"{case:<60} {1e3 * previous['median']:>14.4f} {1e3 * stats['median']:>10.4f} {ratio:>7.2f}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', nargs='+', default=['*'], help='Glob patterns of benchmark names to run.')
+    parser.add_argument('--quick', action='store_true', help='Only the first value of every parameter.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per repeat.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='JSON results to compare against.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Median slowdown ratio that counts as a regression.')
+    parser.add_argument('--list', action='store_true', help='List the benchmark cases and exit.')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, grid, square) in BENCHMARKS.items():
+            for params in points(grid, square, args.quick):
+                print(case_name(name, params))
+        return
+
+    results = run(args.filter, args.quick, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.2f}x")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
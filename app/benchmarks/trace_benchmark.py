@@ -0,0 +1,65 @@
+"""
+Times LLLTrace.basis_at when scrubbing forward and when jumping around, and
+checks every rebuilt basis against a fresh replay of the steps from the
+initial basis, kept apart from the trace.
+
+Run from the app directory:
+    python -m benchmarks.trace_benchmark --sizes 10 20 30 --queries 200
+"""
+import argparse
+import time
+import numpy as np
+from operations import lattice_operations as lo
+
+def replay(trace, initial, step):
+    ''' Applies the first `step` steps to a copy of the initial basis, without checkpoints '''
+    Basis = initial.copy()
+    for i in range(step):
+        trace.apply(Basis, i)
+    return Basis
+
+def scrub(trace, initial, steps):
+    """
+    Calls basis_at for each step in order.
+
+    Returns:
+        seconds (float): Total wall time.
+        mismatches (int): Number of rebuilt bases that differ from a fresh replay.
+    """
+    seconds = 0.0
+    mismatches = 0
+    for step in steps:
+        start = time.perf_counter()
+        Basis = trace.basis_at(step)
+        seconds += time.perf_counter() - start
+        mismatches += not np.array_equal(Basis, replay(trace, initial, step))
+    return seconds, mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 30])
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>5} {'steps':>7} {'order':>8} {'time (ms)':>10} {'mismatches':>11}")
+    failed = False
+    for n in args.sizes:
+        Basis = rng.integers(-1000, 1000, size=(n, n))
+        trace = lo.LLLTrace(Basis)
+        lo.LLL_reduction(Basis.copy(), trace=trace, backend='float')
+        orders = {
+            'forward': np.linspace(0, len(trace), args.queries).astype(int),
+            # Revisits step 0 and checkpoint 0 after replays that started from them
+            'random': np.concatenate(([0, 5, 10, 3, 0], rng.integers(0, len(trace) + 1, args.queries))),
+        }
+        for name, steps in orders.items():
+            seconds, mismatches = scrub(trace, Basis, steps)
+            failed |= mismatches > 0
+            print(f"{n:>5} {len(trace):>7} {name:>8} {1e3 * seconds:>10.2f} {mismatches:>11}")
+    if failed:
+        raise SystemExit("basis_at returned bases that differ from a fresh replay")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Headless export of the standard and radar animations to MP4, GIF or PNG frames.
+
+Uses the Agg backend and never imports Qt. Frames are rasterized by worker
+processes, each holding its own copy of the figure, and written in order.
+
+Run from the app directory:
+    python -m frontend.export bases.npy --indices 0 1 2 --view radar --output videos/basis_{index}.mp4
+"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.image
+
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+import shutil
+import subprocess
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from frontend.plots import (
+    initialize_plot, update_plot, create_radar_graph, create_compact_plot, apply_compact_frame,
+    standard_frame_engine, apply_standard_frame, radar_frame_engine, apply_radar_frame,
+    draw_static_standard_view, standard_trajectory_engine, radar_trajectory_engine, COMPACT_ROWS,
+    COMPACT_STORAGE_ENTRIES,
+    create_projection_plot, set_projection_limits, projection_frame_engine, projection_trajectory_engine,
+    apply_projection_frame, DimensionLOD, LOD_DIMENSIONS
+)
+from backend.batch import run_bounded, SharedArray
+from backend.data_manager import init_data
+from backend.data_sources import open_source, RandomSource
+from backend.result_cache import ResultCache
+from operations.projection_operations import fit_projection, PROJECTIONS
+
+VIEWS = ('standard', 'radar', 'projection')
+
+def build_scene(Basis, data, view='radar', replay=False, compact=None, projection='pca', figsize=(12, 9), dpi=80):
+    """
+    Builds an off-screen figure for one view, as MyApp.init_plot does on screen.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        data (dict): Data from init_data. replay needs its 'trace'.
+        view (str): 'standard', 'radar' or 'projection'.
+        replay (bool): Replay the recorded LLL steps instead of morphing start to end.
+        compact (bool or None): Use the collection-based standard view, None picks it for large bases.
+        projection (str): Method of the projection view, see projection_operations.PROJECTIONS.
+        figsize (tuple): Figure size in inches.
+        dpi (int): Resolution.
+
+    Returns:
+        fig (Figure): The figure, attached to an Agg canvas.
+        frames (FrameEngine): The frame engine of the view.
+        apply (callable): Pushes a frame state into the figure's artists.
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    replay = replay and data.get('trace') is not None
+    compact_storage = Basis.size > COMPACT_STORAGE_ENTRIES
+
+    if view == 'standard':
+        ax_top, ax_angles, Basis_interp_line, target_interp_line, x_interp_line = initialize_plot(
+            fig, data['vec_dimension'], Basis, data['scale'], data['method'], Basis, data['target_Basis']
+        )
+        if compact is None:
+            compact = Basis.shape[0] > COMPACT_ROWS
+        handles = None
+        if compact:
+            collections = create_compact_plot(ax_top, data['vec_dimension'], x_interp_line, Basis,
+                                              Basis_interp_line, ax_angles, data['angles_basis_complementary'],
+                                              max_columns=2 * LOD_DIMENSIONS)
+            handles = collections['handles']
+            apply = lambda state: apply_compact_frame(state, collections)
+        else:
+            scatter, line_ori, line_interp, ax_angles, angle_plots = update_plot(
+                ax_top, data['vec_dimension'], x_interp_line, Basis_interp_line, ax_angles,
+                data['angles_basis_complementary'], data['target_angles_basis_complementary'], fig, Basis
+            )
+            apply = lambda state: apply_standard_frame(state, line_interp, line_ori, scatter, angle_plots)
+        if replay:
+            frames = standard_trajectory_engine(data['trace'], data['vec_dimension'], data['scale'], data['method'],
+                                                data['total_frames'], easing=data['easing'], compact=compact_storage)
+        else:
+            frames = standard_frame_engine(data['vec_dimension'], Basis, data['target_Basis'],
+                                           Basis_interp_line, target_interp_line,
+                                           data['angles_basis_complementary'],
+                                           data['target_angles_basis_complementary'],
+                                           data['total_frames'], easing=data['easing'], compact=compact_storage)
+        draw_static_standard_view(ax_top, data['vec_dimension'], frames, handles=handles)
+        if Basis.shape[1] > LOD_DIMENSIONS:
+            lod = DimensionLOD(ax_top, data['vec_dimension'])
+            apply_full = apply
+            apply = lambda state: apply_full(lod.apply(state))
+    elif view == 'radar':
+        radar_data = create_radar_graph(fig, np.abs(Basis), np.abs(data['target_Basis']),
+                                        labels=[f"Dimension {i + 1}" for i in range(Basis.shape[1])])
+        if replay:
+            frames = radar_trajectory_engine(data['trace'], data['total_frames'], easing=data['easing'],
+                                             spokes=radar_data['spokes'], compact=compact_storage)
+            max_val = frames.bounds('radar')[1]
+        else:
+            frames = radar_frame_engine(radar_data, data['total_frames'], easing=data['easing'],
+                                        compact=compact_storage)
+            max_val = max(np.max(radar_data['data_start']), np.max(radar_data['data_end']))
+        radar_data['ax'].set_ylim(0, max_val + 10)
+        apply = lambda state: apply_radar_frame(state, radar_data)
+    elif view == 'projection':
+        projected = create_projection_plot(fig, fit_projection(Basis, data['reduced_Basis'], projection),
+                                           Basis, data['reduced_Basis'])
+        if replay:
+            frames = projection_trajectory_engine(data['trace'], projected, data['total_frames'], easing=data['easing'])
+        else:
+            frames = projection_frame_engine(projected, Basis, data['reduced_Basis'], data['total_frames'],
+                                             easing=data['easing'])
+        set_projection_limits(projected, frames)
+        apply = lambda state: apply_projection_frame(state, projected)
+    else:
+        raise ValueError(f"Unknown view {view!r}, use one of {VIEWS}")
+    return fig, frames, apply
+
+# The scene this worker process last built, as (shared block name, fig, frames, apply)
+_scene = None
+
+def _render_chunk(spec, frame_indices, png_pattern):
+    """
+    Worker task: renders the given frames, as RGBA arrays or straight to PNG files.
+
+    spec names the shared block holding the pickled build_scene arguments, which
+    the worker unpickles only for the first chunk of each export it renders.
+    """
+    global _scene
+    if _scene is None or _scene[0] != spec[0]:
+        block = SharedArray(spec[1], spec[2], name=spec[0])
+        try:
+            scene_args = pickle.loads(block.array.tobytes())
+        finally:
+            block.close()
+        _scene = (spec[0],) + build_scene(**scene_args)
+    _, fig, frames, apply = _scene
+    rendered = []
+    for frame in frame_indices:
+        apply(frames.frame(frame))
+        fig.canvas.draw()
+        rgba = np.asarray(fig.canvas.buffer_rgba())
+        if png_pattern is not None:
+            matplotlib.image.imsave(png_pattern % frame, rgba)
+            rgba = None
+        else:
+            rgba = rgba.copy()
+        rendered.append((frame, rgba))
+    return rendered
+
+def render_frames(Basis, data, pool, frames=None, chunk_size=4, png_pattern=None, max_pending=None, **scene_options):
+    """
+    Renders the animation on a process pool and yields (frame, rgba) in frame order.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        data (dict): Data from init_data.
+        pool (concurrent.futures.Executor): Pool of worker processes.
+        frames (int or None): Number of frames, defaults to data['total_frames'].
+        chunk_size (int): Frames rendered per task.
+        png_pattern (str or None): Let the workers write frame f to png_pattern % f and yield None for rgba.
+        max_pending (int or None): Chunks in flight, which bounds the frames held; defaults to twice the CPU count.
+        **scene_options: view, replay, compact, projection, figsize and dpi, see build_scene.
+
+    Yields:
+        frame (int), rgba (np.ndarray or None): Frame index and its (height, width, 4) uint8 image.
+    """
+    if frames is not None:
+        data = dict(data, total_frames=frames)
+    # Pickle the scene, with its data and trace, once into shared memory; tasks only carry its name
+    payload = pickle.dumps(dict(scene_options, Basis=Basis, data=data), protocol=pickle.HIGHEST_PROTOCOL)
+    scene = SharedArray((len(payload),), np.uint8)
+    scene.array[:] = np.frombuffer(payload, dtype=np.uint8)
+    del payload
+    tasks = ((_render_chunk, scene.spec, range(start, min(start + chunk_size, data['total_frames'])), png_pattern)
+             for start in range(0, data['total_frames'], chunk_size))
+    try:
+        for rendered in run_bounded(pool, tasks, ordered=True, max_pending=max_pending or 2 * os.cpu_count()):
+            yield from rendered
+    finally:
+        scene.close()
+
+def _write_mp4(frames, output, fps):
+    ffmpeg = shutil.which(matplotlib.rcParams['animation.ffmpeg_path']) or shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("MP4 export needs ffmpeg on the PATH")
+    process = None
+    try:
+        for _, rgba in frames:
+            if process is None:
+                height, width = rgba.shape[:2]
+                process = subprocess.Popen([
+                    ffmpeg, '-y', '-loglevel', 'error',
+                    '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                    # yuv420p needs even dimensions
+                    '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', output,
+                ], stdin=subprocess.PIPE)
+            process.stdin.write(rgba.tobytes())
+    finally:
+        if process is not None:
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"ffmpeg failed with exit code {process.returncode}")
+
+def _write_gif(frames, output, fps):
+    from PIL import Image
+    # Quantize as frames arrive so only the palette images are held
+    images = [Image.fromarray(rgba).convert('RGB').quantize() for _, rgba in frames]
+    images[0].save(output, save_all=True, append_images=images[1:], duration=int(1000 / fps), loop=0)
+
+def export_animation(Basis, data, output, fps=20, pool=None, workers=None, frames=None, chunk_size=4,
+                     **scene_options):
+    """
+    Renders one basis' animation to a file.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        data (dict): Data from init_data, with trace=True for replay.
+        output (str): .mp4 (needs ffmpeg), .gif, or .png for a numbered PNG sequence.
+            A PNG path containing a %-format such as frame_%04d.png is used as is.
+        fps (int): Frames per second of the video.
+        pool (concurrent.futures.Executor or None): Pool to reuse across exports, otherwise one is created.
+        workers (int or None): Size of the created pool, defaults to the CPU count.
+        frames (int or None): Number of frames, defaults to data['total_frames'].
+        chunk_size (int): Frames rendered per task.
+        **scene_options: view, replay, compact, projection, figsize and dpi, see build_scene.
+    """
+    extension = os.path.splitext(output)[1].lower()
+    if extension not in ('.mp4', '.gif', '.png'):
+        raise ValueError(f"Unsupported output {output!r}, use .mp4, .gif or .png")
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if pool is None:
+        with create_pool(workers) as pool:
+            return export_animation(Basis, data, output, fps, pool, None, frames, chunk_size, **scene_options)
+
+    png_pattern = None
+    if extension == '.png':
+        png_pattern = output if '%' in output else os.path.splitext(output)[0] + '_%04d.png'
+    rendered = render_frames(Basis, data, pool, frames, chunk_size, png_pattern, **scene_options)
+    if extension == '.mp4':
+        _write_mp4(rendered, output, fps)
+    elif extension == '.gif':
+        _write_gif(rendered, output, fps)
+    else:
+        for _ in rendered:
+            pass
+
+def create_pool(workers=None):
+    """
+    Returns a process pool for rendering. Spawned workers start without any Qt state.
+    """
+    return concurrent.futures.ProcessPoolExecutor(workers or os.cpu_count(),
+                                                  mp_context=multiprocessing.get_context('spawn'))
+
+def main():
+    parser = argparse.ArgumentParser(description='Render reduction animations without a display.')
+    parser.add_argument('input', nargs='?', help='File of bases; a random 10x10 basis if omitted.')
+    parser.add_argument('--format', choices=['npy', 'npz', 'csv', 'lattice'], default=None)
+    parser.add_argument('--indices', type=int, nargs='+', default=None, help='Bases to render, default all.')
+    parser.add_argument('--output', default='basis_{index}.mp4',
+                        help='Output path; {index} is replaced by the basis index. .mp4, .gif or .png.')
+    parser.add_argument('--view', choices=VIEWS, default='radar')
+    parser.add_argument('--projection', choices=sorted(PROJECTIONS), default='pca',
+                        help='Method of the projection view.')
+    parser.add_argument('--replay', action='store_true', help='Replay the recorded LLL steps.')
+    parser.add_argument('--algorithm', default='lll')
+    parser.add_argument('--frames', type=int, default=None)
+    parser.add_argument('--fps', type=int, default=20)
+    parser.add_argument('--dpi', type=int, default=80)
+    parser.add_argument('--size', type=float, nargs=2, default=(12, 9), metavar=('WIDTH', 'HEIGHT'),
+                        help='Figure size in inches.')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=4)
+    parser.add_argument('--cache', default=None, help='Reuse reductions from this result cache directory.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    source = open_source(args.input, args.format) if args.input else RandomSource(seed=args.seed)
+    indices = args.indices if args.indices is not None else range(len(source))
+    cache = ResultCache(args.cache) if args.cache else None
+    with create_pool(args.workers) as pool:
+        for index in indices:
+            Basis = source[index]
+            data = init_data(Basis, trace=args.replay, algorithm=args.algorithm, cache=cache)
+            output = args.output.format(index=index)
+            export_animation(Basis, data, output, args.fps, pool, frames=args.frames, chunk_size=args.chunk_size,
+                             view=args.view, replay=args.replay, projection=args.projection, figsize=tuple(args.size), dpi=args.dpi)
+            print(f"{source.label(index)} -> {output}")
+
+if __name__ == "__main__":
+    main()
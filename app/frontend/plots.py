@@ -1,17 +1,35 @@
 ### plots.py
+import time
+from collections import deque
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib import colormaps
 from matplotlib.gridspec import GridSpec
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.ticker import MaxNLocator
-from matplotlib.animation import FuncAnimation
-from matplotlib.projections import register_projection
-from matplotlib.projections.polar import PolarAxes
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.lines import Line2D
 from operations import vector_operations as vo
-from backend.data_manager import init_data, Basis, init_angle
-
-plt.rcParams['animation.embed_limit'] = 100.0
-
+from backend.data_manager import init_data, init_angle
+from backend.frame_engine import FrameEngine, TrajectoryFrameEngine
+from backend import profiling
+
+# Bases with more rows than this use one collection per element type instead of per-row artists
+COMPACT_ROWS = 20
+# Bases with more columns than this are decimated to the axis width in the standard view
+LOD_DIMENSIONS = 200
+# The radar view groups dimensions into at most this many spokes
+MAX_SPOKES = 60
+# Above this many dimensions the x axis gets automatic ticks instead of one per dimension
+MAX_DIMENSION_TICKS = 50
+# Hover tooltips and picks find the nearest point within this many pixels of the pointer
+HOVER_RADIUS = 8
+# Mouse moves are coalesced into at most one hover query per this many milliseconds
+HOVER_INTERVAL = 30
+# The frame-time HUD averages over this many recent frames
+HUD_FRAMES = 30
+# Above this many basis entries the views default to the compact frame storage, see frame_storage
+COMPACT_STORAGE_ENTRIES = 1_000_000
+
+@profiling.profiled()
 def initialize_plot(fig, vec_dimension, basis_data, scale, method, Basis, target_Basis):
     gs = GridSpec(2, 1, figure=fig)
 
@@ -25,12 +43,8 @@ def initialize_plot(fig, vec_dimension, basis_data, scale, method, Basis, target
 
     # Interpolated lines for smoother animation
     x_interp_line = np.linspace(vec_dimension.min(), vec_dimension.max(), scale)
-    Basis_interp_line = [
-        vo.interpolate(vec_dimension, y, scale=scale, method=method, ret='Y') for y in Basis
-    ]
-    target_interp_line = [
-        vo.interpolate(vec_dimension, y, scale=scale, method=method, ret='Y') for y in target_Basis
-    ]
+    Basis_interp_line = vo.interpolate(vec_dimension, Basis, scale=scale, method=method, ret='Y')
+    target_interp_line = vo.interpolate(vec_dimension, target_Basis, scale=scale, method=method, ret='Y')
 
     # Bottom subplot for Angles
     ax_angles = fig.add_subplot(gs[1])
@@ -40,13 +54,14 @@ def initialize_plot(fig, vec_dimension, basis_data, scale, method, Basis, target
 
     return ax_top, ax_angles, Basis_interp_line, target_interp_line, x_interp_line
 
-def update_plot(ax, vec_dimension, x_interp_line, Basis_interp_line, ax_angles, angle_basis_complementary, target_angles_basis_complementary, fig):
+@profiling.profiled()
+def update_plot(ax, vec_dimension, x_interp_line, Basis_interp_line, ax_angles, angle_basis_complementary, target_angles_basis_complementary, fig, Basis):
     scatter = []
     line_ori = []
     line_interp = []
 
     for i, y in enumerate(Basis):
-        color = plt.cm.tab20(i % 20)
+        color = colormaps['tab20'](i % 20)
         scatter_o = ax.scatter(
             vec_dimension, y, color=color, alpha=0.6, picker=True,
             # label=f'Data_Points_{i + 1}'
@@ -117,6 +132,8 @@ def get_arc_offset(i, max_arcs):
         return (x_offset, y_offset)
 
 def create_canvas(fig):
+    # Imported here so that headless rendering never loads Qt
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
     return FigureCanvas(fig)
 
 def update_angle(frame, total_frames, ax, i, arc, line1, line2, angle_text, initial_angle, target_angle, radius=0.2, offset=(0, 0)):
@@ -141,21 +158,494 @@ def update_angle(frame, total_frames, ax, i, arc, line1, line2, angle_text, init
     """
     alpha = frame / (total_frames - 1) if total_frames > 1 else 1.0
     new_angle = (1 - alpha) * initial_angle + alpha * target_angle
+    return set_angle(i, arc, line1, line2, angle_text, new_angle, radius=radius, offset=offset)
 
+def set_angle(i, arc, line1, line2, angle_text, angle, radius=0.2, offset=(0, 0)):
+    """
+    Draws the angle plot (arc) at the given angle.
+
+    Parameters:
+        i (int): Index of the basis vector.
+        arc (matplotlib.patches.Arc): The arc representing the angle.
+        line1, line2 (matplotlib.lines.Line2D): Lines representing the angle.
+        angle_text (matplotlib.text.Text): Text annotation for the angle.
+        angle (float): Angle in degrees.
+        radius (float): Radius of the arc.
+        offset (tuple): (x, y) offset to separate arcs.
+
+    Returns:
+        List of updated plot elements.
+    """
     # Update the arc
-    arc.theta2 = new_angle
+    arc.theta2 = angle
 
     # Update the lines representing the angle
-    x1 = offset[0] + radius * np.cos(np.radians(new_angle))
-    y1 = offset[1] + radius * np.sin(np.radians(new_angle))
+    x1 = offset[0] + radius * np.cos(np.radians(angle))
+    y1 = offset[1] + radius * np.sin(np.radians(angle))
     line2.set_data([offset[0], x1], [offset[1], y1])
 
     # Update the angle text
-    angle_text.set_text(f'{i + 1}: {new_angle:.2f}°')
+    angle_text.set_text(f'{i + 1}: {angle:.2f}°')
 
     return [arc, line1, line2, angle_text]
 
+def frame_storage(compact):
+    """
+    FrameEngine keyword arguments for the full or the memory-compact storage mode.
+
+    The compact mode stores the series as float32 and evaluates one frame at a
+    time, keeping the last two, instead of float64 chunks of 25 frames.
+    """
+    if compact:
+        return {'dtype': np.float32, 'chunk_size': 1, 'max_chunks': 2}
+    return {}
+
+def _standard_offsets(vec_dimension):
+    # Scatter points (rows, d, 2) of a frame, derived from 'raw' instead of stored as a second copy
+    def offsets(state):
+        raw = state['raw']
+        x = np.broadcast_to(np.asarray(vec_dimension, dtype=raw.dtype), raw.shape)
+        return np.stack((x, raw), axis=-1)
+    return offsets
+
+def standard_frame_engine(vec_dimension, Basis, target_Basis, Basis_interp_line, target_interp_line,
+                          angles, target_angles, total_frames, easing='linear', compact=False):
+    """
+    Builds the frame engine for the standard view.
+
+    Parameters:
+        compact (bool): Use the compact storage, see frame_storage.
+
+    Returns:
+        FrameEngine with the series 'interp', 'raw' and 'angles', and 'offsets' derived per frame.
+    """
+    return FrameEngine({
+        'interp': (Basis_interp_line, target_interp_line),
+        'raw': (Basis, target_Basis),
+        'angles': (angles, target_angles),
+    }, total_frames, easing=easing, derived={'offsets': _standard_offsets(vec_dimension)},
+        **frame_storage(compact))
+
+def standard_trajectory_engine(trace, vec_dimension, scale, method, total_frames, easing='linear', compact=False):
+    """
+    Builds a standard view frame engine that replays the recorded LLL steps.
+
+    Returns:
+        TrajectoryFrameEngine with the same series as standard_frame_engine.
+    """
+    weights = vo.interpolation_matrix(vec_dimension, method, scale)
+
+    def build(bases):
+        signed = bases.astype(np.float64)
+        angles = vo.calculate_angles_with_complementary(signed)
+        # The morph and the static view end at data['target_Basis'], which holds magnitudes
+        raw = np.abs(signed)
+        return {
+            'interp': raw @ weights.T,
+            'raw': raw,
+            'angles': np.nan_to_num(angles, nan=0.0, posinf=0.0, neginf=0.0),
+        }
+
+    return TrajectoryFrameEngine(trace, build, total_frames, easing=easing,
+                                 derived={'offsets': _standard_offsets(vec_dimension)}, **frame_storage(compact))
+
+def apply_standard_frame(state, line_interp, line_ori, scatter, angle_plots):
+    """
+    Pushes one frame of the standard view into its artists.
+
+    Parameters:
+        state (dict): Frame state from the standard view's FrameEngine.
+        line_interp, line_ori, scatter (list): Per-row artists from update_plot.
+        angle_plots (list): Per-row angle artists from update_plot.
+
+    Returns:
+        List of the artists that change between frames.
+    """
+    for i, (line_i, line_o, scatter_o) in enumerate(zip(line_interp, line_ori, scatter)):
+        line_i.set_ydata(state['interp'][i])
+        if 'x' in state:
+            # Decimated by DimensionLOD, so the x values differ per row and frame
+            line_o.set_data(state['x'][i], state['raw'][i])
+        else:
+            line_o.set_ydata(state['raw'][i])
+        scatter_o.set_offsets(state['offsets'][i])
+
+    artists = list(scatter) + list(line_ori) + list(line_interp)
+    for i, (arc, line1, line2, angle_text, _, _) in enumerate(angle_plots):
+        offset = get_arc_offset(i, len(angle_plots))
+        set_angle(i, arc, line1, line2, angle_text, state['angles'][i], radius=0.4, offset=offset)
+        artists.extend((arc, line2, angle_text))
+    return artists
+
+@profiling.profiled()
+def create_compact_plot(ax, vec_dimension, x_interp_line, Basis, Basis_interp_line,
+                        ax_angles, angle_basis_complementary, radius=0.4, arc_points=24, max_columns=None):
+    """
+    Compact alternative to update_plot that draws every row with a handful of collections:
+    one LineCollection for the original lines, one for the interpolations, one
+    scatter PathCollection for all points and one PolyCollection of angle wedges.
+    Only the angle labels stay per-row Text artists.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The top axis of the standard view.
+        vec_dimension (np.ndarray): Dimension indices used as x values.
+        x_interp_line (np.ndarray): x values of the interpolated lines.
+        Basis (np.ndarray): Starting basis, one row per vector.
+        Basis_interp_line (np.ndarray): Interpolated starting rows.
+        ax_angles (matplotlib.axes.Axes): The axis for the angle wedges.
+        angle_basis_complementary (np.ndarray): Starting angles in degrees.
+        radius (float): Radius of the angle wedges.
+        arc_points (int): Number of vertices used for each wedge's arc.
+        max_columns (int or None): Draw wider rows as a min/max envelope of about this many
+            points until the first frame, which DimensionLOD decimates to the axis width anyway.
+
+    Returns:
+        compact (dict): The collections, per-row colors, angle labels and legend handles.
+    """
+    n_rows = Basis.shape[0]
+    colors = np.array([colormaps['tab20'](i % 20) for i in range(n_rows)])
+    colors[:, 3] = 0.6
+    if max_columns is not None and Basis.shape[1] > max_columns:
+        x, Basis = vo.minmax_envelope(vec_dimension, Basis, 0, Basis.shape[1], max(max_columns // 2, 1))
+    else:
+        x = np.broadcast_to(vec_dimension, Basis.shape)
+
+    line_ori = LineCollection(np.stack((x, Basis), axis=-1), colors=colors)
+    interp_segments = np.empty(Basis_interp_line.shape + (2,))
+    interp_segments[..., 0] = x_interp_line
+    interp_segments[..., 1] = Basis_interp_line
+    line_interp = LineCollection(interp_segments, colors=colors)
+    ax.add_collection(line_ori)
+    ax.add_collection(line_interp)
+    scatter = ax.scatter(x.ravel(), np.ravel(Basis), color=np.repeat(colors, Basis.shape[1], axis=0))
+    ax.autoscale_view()
+
+    offsets = np.array([get_arc_offset(i, n_rows) for i in range(n_rows)], dtype=np.float64)
+    arcs = PolyCollection(
+        _wedge_vertices(offsets, angle_basis_complementary, radius, arc_points),
+        closed=True, edgecolors=(0, 0, 1, 0.6), facecolors=(0, 0, 1, 0.1), linewidths=2
+    )
+    ax_angles.add_collection(arcs)
+    texts = [
+        ax_angles.text(ox, oy - 0.2, f'{i + 1}: {angle:.2f}°', ha='center', va='center', fontsize=8, alpha=0.8)
+        for i, ((ox, oy), angle) in enumerate(zip(offsets, angle_basis_complementary))
+    ]
+    ax_angles.set_xlim(offsets[:, 0].min() - 0.5, offsets[:, 0].max() + 1.0)
+    ax_angles.set_ylim(offsets[:, 1].min() - 0.5, offsets[:, 1].max() + radius + 0.5)
+
+    handles = [Line2D([], [], color=color, label=f'Basis_{i + 1}') for i, color in enumerate(colors)]
+    return {
+        'line_ori': line_ori,
+        'line_interp': line_interp,
+        'scatter': scatter,
+        'arcs': arcs,
+        'texts': texts,
+        'colors': colors,
+        'offsets': offsets,
+        'interp_segments': interp_segments,
+        'radius': radius,
+        'arc_points': arc_points,
+        'handles': handles,
+    }
+
+def _wedge_vertices(offsets, angles, radius, arc_points):
+    """
+    Vertices of one closed wedge per row: the centre followed by the arc from 0 to angle.
+    """
+    theta = np.radians(np.linspace(0.0, 1.0, arc_points)[None, :] * np.asarray(angles)[:, None])
+    vertices = np.empty((len(offsets), arc_points + 1, 2))
+    vertices[:, 0] = offsets
+    vertices[:, 1:, 0] = offsets[:, :1] + radius * np.cos(theta)
+    vertices[:, 1:, 1] = offsets[:, 1:] + radius * np.sin(theta)
+    return vertices
+
+def apply_compact_frame(state, compact):
+    """
+    Pushes one frame of the standard view into the collections from create_compact_plot.
+
+    Returns:
+        List of the artists that change between frames.
+    """
+    compact['line_ori'].set_segments(state['offsets'])
+    compact['interp_segments'][..., 1] = state['interp']
+    compact['line_interp'].set_segments(compact['interp_segments'])
+    n_points = len(compact['scatter'].get_offsets())
+    compact['scatter'].set_offsets(state['offsets'].reshape(-1, 2))
+    if state['offsets'].shape[0] * state['offsets'].shape[1] != n_points:
+        # A new level of detail changed the points per row, so recolor them per row
+        set_compact_row_visibility(compact, compact.get('visible', np.ones(len(compact['colors']), dtype=bool)))
+    compact['arcs'].set_verts(
+        _wedge_vertices(compact['offsets'], state['angles'], compact['radius'], compact['arc_points'])
+    )
+    for i, (text, angle) in enumerate(zip(compact['texts'], state['angles'])):
+        text.set_text(f'{i + 1}: {angle:.2f}°')
+    return [compact['line_ori'], compact['line_interp'], compact['scatter'], compact['arcs']] + compact['texts']
+
+def set_compact_row_visibility(compact, visible):
+    """
+    Shows or hides individual rows of a compact plot through per-row alpha values.
+
+    Parameters:
+        compact (dict): The dict returned by create_compact_plot.
+        visible (np.ndarray): Boolean mask with one entry per row.
+    """
+    visible = np.asarray(visible, dtype=bool)
+    compact['visible'] = visible
+    colors = compact['colors'].copy()
+    colors[~visible, 3] = 0.0
+    compact['line_ori'].set_colors(colors)
+    compact['line_interp'].set_colors(colors)
+    n_points = len(compact['scatter'].get_offsets()) // len(colors)
+    compact['scatter'].set_color(np.repeat(colors, n_points, axis=0))
+
+    edge = np.tile((0.0, 0.0, 1.0, 0.6), (len(colors), 1))
+    face = np.tile((0.0, 0.0, 1.0, 0.1), (len(colors), 1))
+    edge[~visible, 3] = 0.0
+    face[~visible, 3] = 0.0
+    compact['arcs'].set_edgecolors(edge)
+    compact['arcs'].set_facecolors(face)
+    for text, shown in zip(compact['texts'], visible):
+        text.set_visible(bool(shown))
+
+def draw_static_standard_view(ax, vec_dimension, frames, handles=None):
+    """
+    Sets up the parts of the standard view that do not change between frames:
+    y-limits covering the whole animation, grid, legend and ticks.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The top axis of the standard view.
+        vec_dimension (np.ndarray): Dimension indices used as x values.
+        frames (FrameEngine): The standard view's frame engine.
+        handles (list): Legend handles, for plots whose artists carry no labels.
+    """
+    y_min, y_max = frames.bounds('interp')
+    raw_min, raw_max = frames.bounds('raw')
+    y_min, y_max = min(y_min, raw_min), max(y_max, raw_max)
+    margin = 0.05 * (y_max - y_min) or 1.0
+    ax.set_ylim(y_min - margin, y_max + margin)
+    ax.grid(True)
+    ax.legend(handles=handles, bbox_to_anchor=(1.02, 1), loc='upper left', borderaxespad=0)
+    if len(vec_dimension) <= MAX_DIMENSION_TICKS:
+        ax.set_xticks(vec_dimension)
+
+class DimensionLOD:
+    """
+    Level of detail for the dimension axis of the standard view.
+
+    Decimates the raw rows of each frame to the x range currently shown and to
+    about one bucket per pixel of the axis, so the vertices drawn per row are
+    bounded by the screen width rather than by the dimension. Zooming or
+    panning with the navigation toolbar changes the x limits, and the next
+    frame is decimated at the new resolution, down to every dimension once
+    few enough are in view.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The top axis of the standard view.
+        vec_dimension (np.ndarray): Dimension indices used as x values.
+        method (str): 'minmax' for a min/max envelope per bucket, 'lttb' for
+            Largest-Triangle-Three-Buckets decimation.
+        on_change (callable): Optional callback when the x limits change, e.g. to redraw a paused frame.
+    """
+
+    def __init__(self, ax, vec_dimension, method='minmax', on_change=None):
+        self.ax = ax
+        self.x = np.asarray(vec_dimension, dtype=np.float64)
+        self.method = method
+        self.on_change = on_change
+        self._cid = ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def _on_xlim_changed(self, ax):
+        if self.on_change is not None:
+            self.on_change()
+
+    def window(self):
+        """
+        Returns the column range in view, one column beyond each edge so lines leave the axis.
+        """
+        x_min, x_max = sorted(self.ax.get_xlim())
+        start = max(int(np.searchsorted(self.x, x_min, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(self.x, x_max, side='right')) + 1, len(self.x))
+        return start, max(stop, start + 1)
+
+    def apply(self, state):
+        """
+        Returns the frame state with 'raw' and 'offsets' decimated and per-row x values under 'x'.
+        """
+        raw = state['raw']
+        start, stop = self.window()
+        pixels = max(int(self.ax.bbox.width), 2)
+        if stop - start <= 2 * pixels:
+            xs = np.broadcast_to(self.x[start:stop], raw.shape[:-1] + (stop - start,))
+            ys = raw[..., start:stop]
+        elif self.method == 'lttb':
+            xs, ys = vo.lttb(self.x, raw, start, stop, 2 * pixels)
+        else:
+            xs, ys = vo.minmax_envelope(self.x, raw, start, stop, pixels)
+        return dict(state, raw=ys, x=xs, offsets=np.stack((xs, ys), axis=-1))
+
+    def disconnect(self):
+        self.ax.callbacks.disconnect(self._cid)
+
+class PointPicker:
+    """
+    Hover tooltips and click picking for the points of the shown frame.
+
+    The frame's points are transformed to screen space and put in a KD-tree,
+    so finding the point under the pointer costs O(log n) however many rows
+    and dimensions are drawn. The tree is rebuilt lazily by the first query
+    after the frame, the axis limits, the canvas size or the visible rows
+    change, so playback without the pointer over the axis never pays for it.
+    Mouse moves are coalesced by a single-shot timer into at most one query
+    per HOVER_INTERVAL milliseconds.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axis whose points are indexed and which shows the tooltip.
+        describe (callable): describe(row, column, point) returns the tooltip text.
+        on_pick (callable): Optional on_pick(row, column) when a point is clicked.
+        on_change (callable): Optional callback after the tooltip changed, e.g. to redraw a paused frame.
+        radius (float): Maximum distance to the pointer in pixels.
+        interval (int): Minimum milliseconds between hover queries.
+    """
+
+    def __init__(self, ax, describe, on_pick=None, on_change=None, radius=HOVER_RADIUS, interval=HOVER_INTERVAL):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.describe = describe
+        self.on_pick = on_pick
+        self.on_change = on_change
+        self.radius = radius
+        self.points = np.empty((0, 1, 2))
+        self.visible = None
+        self.hovered = None
+        self._tree = None
+        self._ids = None
+        self._pending = None
+        self._scheduled = False
+        self.annotation = ax.annotate(
+            '', xy=(0, 0), xytext=(12, 12), textcoords='offset points', fontsize=8, zorder=10,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.9), annotation_clip=False, visible=False
+        )
+        self._cids = [
+            self.canvas.mpl_connect('motion_notify_event', self._on_move),
+            self.canvas.mpl_connect('button_press_event', self._on_press),
+            self.canvas.mpl_connect('resize_event', self._invalidate),
+        ]
+        self._ax_cids = [
+            ax.callbacks.connect('xlim_changed', self._invalidate),
+            ax.callbacks.connect('ylim_changed', self._invalidate),
+        ]
+        self._timer = self.canvas.new_timer(interval=interval)
+        self._timer.single_shot = True
+        self._timer.add_callback(self._process)
+
+    def set_frame(self, points):
+        """
+        Replaces the indexed points with those of a new frame and moves an open tooltip along.
+
+        Parameters:
+            points (np.ndarray): (rows, columns, 2) data coordinates, one row per basis vector.
+        """
+        self.points = points
+        self._tree = None
+        if self.hovered is not None:
+            self._show(self.hovered if self.hovered[1] < points.shape[1] else None)
+
+    def set_visible_rows(self, visible):
+        """
+        Restricts hovering and picking to the rows that are shown.
+
+        Parameters:
+            visible (np.ndarray): Boolean mask with one entry per row.
+        """
+        self.visible = np.asarray(visible, dtype=bool)
+        self._tree = None
+        if self.hovered is not None and not self.visible[self.hovered[0]]:
+            self._show(None)
+
+    def _invalidate(self, *args):
+        self._tree = None
+
+    def _build(self):
+        from scipy.spatial import cKDTree
+
+        n_columns = self.points.shape[1]
+        flat = self.points.reshape(-1, 2)
+        ids = np.arange(len(flat))
+        if self.visible is not None:
+            keep = np.repeat(self.visible, n_columns)
+            flat, ids = flat[keep], ids[keep]
+        screen = self.ax.transData.transform(flat)
+        finite = np.isfinite(screen).all(axis=1)
+        self._ids = ids[finite]
+        self._tree = cKDTree(screen[finite])
+
+    def query(self, x, y):
+        """
+        Finds the point nearest to a screen position.
+
+        Parameters:
+            x, y (float): Position in display pixels, as in matplotlib mouse events.
+
+        Returns:
+            (row, column) of the nearest point within the radius, or None.
+        """
+        if self._tree is None:
+            self._build()
+        if not len(self._ids):
+            return None
+        distance, i = self._tree.query((x, y), distance_upper_bound=self.radius)
+        if not np.isfinite(distance):
+            return None
+        return divmod(int(self._ids[i]), self.points.shape[1])
+
+    def _on_move(self, event):
+        self._pending = event
+        if not self._scheduled:
+            self._scheduled = True
+            self._timer.start()
+
+    def _process(self):
+        event, self._pending = self._pending, None
+        self._scheduled = False
+        if event is None:
+            return
+        hit = self.query(event.x, event.y) if event.inaxes is self.ax else None
+        if hit != self.hovered:
+            self._show(hit)
+            if self.on_change is not None:
+                self.on_change()
+
+    def _on_press(self, event):
+        toolbar = getattr(self.canvas, 'toolbar', None)
+        if event.inaxes is not self.ax or event.button != 1 or (toolbar is not None and toolbar.mode):
+            return
+        hit = self.query(event.x, event.y)
+        if hit is not None and self.on_pick is not None:
+            self.on_pick(*hit)
+
+    def _show(self, hit):
+        self.hovered = hit
+        if hit is None:
+            self.annotation.set_visible(False)
+            return
+        row, column = hit
+        point = self.points[row, column]
+        self.annotation.xy = point
+        self.annotation.set_text(self.describe(row, column, point))
+        self.annotation.set_visible(True)
+
+    def disconnect(self):
+        self._timer.stop()
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        for cid in self._ax_cids:
+            self.ax.callbacks.disconnect(cid)
+
 def radar_factory(num_vars):
+    # The polar machinery is only imported once a radar graph is actually drawn
+    from matplotlib.projections import register_projection
+    from matplotlib.projections.polar import PolarAxes
+
     theta = np.linspace(0, 2 * np.pi, num_vars, endpoint=False)
 
     class RadarAxes(PolarAxes):
@@ -171,7 +661,14 @@ def radar_factory(num_vars):
     register_projection(RadarAxes)
     return theta
 
-def create_radar_graph(fig, data_start, data_end, labels, total_frames=100):
+@profiling.profiled()
+def create_radar_graph(fig, data_start, data_end, labels, total_frames=100, max_spokes=MAX_SPOKES):
+    edges = None
+    if data_start.shape[1] > max_spokes:
+        # One spoke per group of dimensions, showing the group's largest entry
+        data_start, edges = vo.aggregate_dimensions(data_start, max_spokes)
+        data_end, _ = vo.aggregate_dimensions(data_end, max_spokes)
+        labels = [f"Dimensions {lo + 1}-{hi}" for lo, hi in zip(edges[:-1], edges[1:])]
     num_vars = len(labels)
     theta = radar_factory(num_vars)
 
@@ -186,12 +683,306 @@ def create_radar_graph(fig, data_start, data_end, labels, total_frames=100):
 
     lines = [ax.plot(theta, row, linewidth=2, label=f'Basis {i + 1}')[0] for i, row in enumerate(data_start)]
     fills = [ax.fill(theta, row, alpha=0.25)[0] for row in data_start]
+    ax.legend(bbox_to_anchor=(1.5, 1), loc='upper left', borderaxespad=0)
 
     return {
         'lines': lines,
         'fills': fills,
         'ax': ax,
         'theta': theta,
+        'labels': labels,
         'data_start': data_start,
-        'data_end': data_end
-    }
\ No newline at end of file
+        'data_end': data_end,
+        'spokes': max_spokes if edges is not None else None
+    }
+
+def radar_frame_engine(radar_data, total_frames, easing='linear', compact=False):
+    """
+    Builds the frame engine for the radar view from the dict returned by create_radar_graph.
+    """
+    return FrameEngine({'radar': (radar_data['data_start'], radar_data['data_end'])},
+                       total_frames, easing=easing, **frame_storage(compact))
+
+def radar_trajectory_engine(trace, total_frames, easing='linear', spokes=None, compact=False):
+    """
+    Builds a radar view frame engine that replays the recorded LLL steps.
+    spokes groups the dimensions as create_radar_graph did, see its 'spokes' entry.
+    """
+    def build(bases):
+        rows = np.abs(bases).astype(np.float64)
+        if spokes is not None:
+            rows, _ = vo.aggregate_dimensions(rows, spokes)
+        return {'radar': np.concatenate((rows, rows[..., :1]), axis=-1)}
+
+    return TrajectoryFrameEngine(trace, build, total_frames, easing=easing, **frame_storage(compact))
+
+def apply_radar_frame(state, radar_data):
+    """
+    Pushes one frame of the radar view into its lines and fills, updating
+    the existing polygons in place.
+
+    Returns:
+        List of the artists that change between frames.
+    """
+    theta = radar_data['theta']
+    fills = radar_data['fills']
+    for i, line in enumerate(radar_data['lines']):
+        row = state['radar'][i]
+        line.set_ydata(row)
+        # Reuse the polygon instead of replacing it
+        fills[i].set_xy(np.column_stack((theta, row)))
+    return radar_data['lines'] + fills
+
+def radar_hover_points(state, radar_data):
+    """
+    Returns the (rows, spokes, 2) polar points of a radar frame for PointPicker, without the closing point.
+    """
+    values = state['radar'][:, :-1]
+    theta = np.broadcast_to(radar_data['theta'][:-1], values.shape)
+    return np.stack((theta, values), axis=-1)
+
+@profiling.profiled()
+def create_projection_plot(fig, projection, Basis, target_Basis):
+    """
+    Draws every basis vector as a segment from the projected origin to its 2-D image.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to draw on.
+        projection (Projection): Fitted 2-D projection, see operations.projection_operations.
+        Basis (np.ndarray): The original basis matrix.
+        target_Basis (np.ndarray): The reduced basis matrix.
+
+    Returns:
+        projected (dict): The axis, segment and scatter collections, colors and the projection.
+    """
+    ax = fig.add_subplot()
+    ax.set_title(f"Basis Vectors Projected to 2-D ({projection.method.upper()})", pad=20)
+    ax.set_xlabel("Component 1")
+    ax.set_ylabel("Component 2")
+
+    n_rows = Basis.shape[0]
+    colors = np.array([colormaps['tab20'](i % 20) for i in range(n_rows)])
+    colors[:, 3] = 0.8
+    origin = projection.origin
+    points = projection.transform(Basis)
+    segments = np.empty((n_rows, 2, 2))
+    segments[:, 0] = origin
+    segments[:, 1] = points
+    vectors = LineCollection(segments, colors=colors, linewidths=1.5)
+    ax.add_collection(vectors)
+    scatter = ax.scatter(points[:, 0], points[:, 1], color=colors, zorder=3)
+    ax.scatter(*origin, color='k', marker='+', zorder=3)
+    ax.grid(True)
+    ax.set_aspect('equal', adjustable='datalim')
+
+    handles = [Line2D([], [], color=color, label=f'Basis {i + 1}') for i, color in enumerate(colors)]
+    if n_rows <= COMPACT_ROWS:
+        ax.legend(handles=handles, bbox_to_anchor=(1.02, 1), loc='upper left', borderaxespad=0)
+    return {
+        'ax': ax,
+        'vectors': vectors,
+        'scatter': scatter,
+        'segments': segments,
+        'colors': colors,
+        'projection': projection,
+    }
+
+def set_projection_limits(projected, frames):
+    """
+    Fixes the axis limits to cover the origin and every frame of the animation.
+    """
+    x_min, x_max = frames.bounds('points', axis=0)
+    y_min, y_max = frames.bounds('points', axis=1)
+    origin = projected['projection'].origin
+    x_min, x_max = min(x_min, origin[0]), max(x_max, origin[0])
+    y_min, y_max = min(y_min, origin[1]), max(y_max, origin[1])
+    x_margin = 0.05 * (x_max - x_min) or 1.0
+    y_margin = 0.05 * (y_max - y_min) or 1.0
+    projected['ax'].set_xlim(x_min - x_margin, x_max + x_margin)
+    projected['ax'].set_ylim(y_min - y_margin, y_max + y_margin)
+
+def projection_frame_engine(projected, Basis, target_Basis, total_frames, easing='linear'):
+    """
+    Builds the frame engine for the projection view. The projection is linear,
+    so blending the projected endpoints equals projecting the blended bases.
+    """
+    projection = projected['projection']
+    return FrameEngine({'points': (projection.transform(Basis), projection.transform(target_Basis))},
+                       total_frames, easing=easing)
+
+def projection_trajectory_engine(trace, projected, total_frames, easing='linear'):
+    """
+    Builds a projection view frame engine that replays the recorded LLL steps.
+    """
+    projection = projected['projection']
+
+    def build(bases):
+        return {'points': projection.transform(bases)}
+
+    return TrajectoryFrameEngine(trace, build, total_frames, easing=easing)
+
+def apply_projection_frame(state, projected):
+    """
+    Pushes one frame of the projection view into its collections.
+
+    Returns:
+        List of the artists that change between frames.
+    """
+    projected['segments'][:, 1] = state['points']
+    projected['vectors'].set_segments(projected['segments'])
+    projected['scatter'].set_offsets(state['points'])
+    return [projected['vectors'], projected['scatter']]
+
+def projection_hover_points(state):
+    """
+    Returns the (rows, 1, 2) projected points of a frame for PointPicker.
+    """
+    return state['points'][:, None, :]
+
+def set_projection_row_visibility(projected, visible):
+    """
+    Shows or hides individual rows of the projection view through per-row alpha values.
+    """
+    colors = projected['colors'].copy()
+    colors[~np.asarray(visible, dtype=bool), 3] = 0.0
+    projected['vectors'].set_colors(colors)
+    projected['scatter'].set_color(colors)
+
+class FrameTimeHUD:
+    """
+    On-screen overlay with the average update and draw time of recent frames and the achieved fps.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to draw the overlay on.
+        window (int): Number of recent frames averaged.
+    """
+
+    def __init__(self, fig, window=HUD_FRAMES):
+        self.updates = deque(maxlen=window)
+        self.draws = deque(maxlen=window)
+        self.ticks = deque(maxlen=window + 1)
+        self.text = fig.text(
+            0.005, 0.995, '', ha='left', va='top', family='monospace', fontsize=8, zorder=20,
+            bbox=dict(boxstyle='round', facecolor='black', alpha=0.6), color='white'
+        )
+
+    def record(self, update_seconds, draw_seconds=None):
+        """
+        Records one frame; usable as BlitAnimation's on_timing. draw_seconds is None
+        when the draw is not timed, as with the full redraw render mode.
+        """
+        self.updates.append(update_seconds)
+        if draw_seconds is not None:
+            self.draws.append(draw_seconds)
+        self.ticks.append(time.perf_counter())
+
+    def refresh(self):
+        """
+        Updates the overlay text from the frames recorded so far and returns its artist.
+        """
+        update = f"{1e3 * np.mean(self.updates):6.1f} ms" if self.updates else '     - ms'
+        draw = f"{1e3 * np.mean(self.draws):6.1f} ms" if self.draws else '     - ms'
+        elapsed = self.ticks[-1] - self.ticks[0] if len(self.ticks) > 1 else 0.0
+        fps = f"{(len(self.ticks) - 1) / elapsed:5.1f}" if elapsed > 0 else '    -'
+        self.text.set_text(f"update {update}  draw {draw}  fps {fps}")
+        return self.text
+
+    def remove(self):
+        self.text.remove()
+
+class BlitAnimation:
+    """
+    Frame driver for the blitted render mode.
+
+    The figure background (axes, grid, legend, ticks) is cached on every full
+    draw, which only happens at start-up, on resize, zoom or view change. Each
+    tick then restores that background and redraws only the artists returned
+    by `func(frame)`. Exposes `event_source` and `repeat` like FuncAnimation.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): Figure attached to a canvas.
+        func (callable): Called with a frame index, returns the artists that changed.
+        frames (int): Number of frames.
+        interval (int): Delay between frames in milliseconds.
+        repeat (bool): Whether to loop when the last frame is reached.
+        on_timing (callable): Optional on_timing(update_seconds, draw_seconds) after every blitted frame.
+    """
+
+    def __init__(self, fig, func, frames, interval=100, repeat=True, on_timing=None):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.func = func
+        self.frames = frames
+        self.repeat = repeat
+        self.on_timing = on_timing
+        self.frame = 0
+        self._background = None
+        self._artists = []
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.event_source = self.canvas.new_timer(interval=interval)
+        self.event_source.add_callback(self._step)
+        self.event_source.start()
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            self.fig.draw_artist(artist)
+
+    def draw_frame(self, frame):
+        """
+        Renders the given frame by blitting its artists over the cached background.
+        """
+        start = time.perf_counter()
+        artists = self.func(frame)
+        for artist in artists:
+            artist.set_animated(True)
+        self._artists = list(artists)
+
+        if self._background is None:
+            # First frame: a full draw caches the background without the animated artists
+            self.canvas.draw()
+            return
+        drawn = time.perf_counter()
+        with profiling.span('blit', artists=len(self._artists)):
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.fig.bbox)
+        profiling.count('artists drawn', len(self._artists))
+        if self.on_timing is not None:
+            self.on_timing(drawn - start, time.perf_counter() - drawn)
+
+    def redraw(self):
+        """
+        Blits the current artists again without computing a frame, e.g. after a tooltip changed.
+        """
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.fig.bbox)
+
+    def seek(self, frame):
+        """
+        Draws the given frame and continues playback from there.
+        """
+        self.draw_frame(frame)
+        self.frame = (frame + 1) % self.frames
+
+    def _step(self):
+        self.draw_frame(self.frame)
+        self.frame += 1
+        if self.frame >= self.frames:
+            self.frame = 0
+            if not self.repeat:
+                self.event_source.stop()
+
+    def stop(self):
+        """
+        Stops playback and detaches from the canvas.
+        """
+        self.event_source.stop()
+        self.canvas.mpl_disconnect(self._draw_cid)
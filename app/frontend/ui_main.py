@@ -1,28 +1,54 @@
 ### ui_main.py
 import sys
+import time
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QScrollArea, QPushButton,
     QCheckBox, QSlider, QHBoxLayout, QFrame, QLabel, QListWidget, QSizePolicy,
-    QListWidgetItem, QAbstractItemView
+    QListWidgetItem, QAbstractItemView, QFileDialog, QInputDialog, QMessageBox, QActionGroup
 )
-from PyQt5.QtCore import Qt
-from frontend.plots import initialize_plot, update_plot, create_canvas, update_angle, get_arc_offset, create_radar_graph
-from backend.data_manager import init_data, Basis, init_angle
-import matplotlib.pyplot as plt
+from PyQt5.QtCore import Qt, QTimer
+from frontend.plots import (
+    initialize_plot, update_plot, create_canvas, create_radar_graph,
+    standard_frame_engine, apply_standard_frame, radar_frame_engine, apply_radar_frame,
+    draw_static_standard_view, BlitAnimation, create_compact_plot, apply_compact_frame, set_compact_row_visibility,
+    standard_trajectory_engine, radar_trajectory_engine, COMPACT_ROWS,
+    create_projection_plot, set_projection_limits, projection_frame_engine, projection_trajectory_engine,
+    apply_projection_frame, set_projection_row_visibility, DimensionLOD, LOD_DIMENSIONS,
+    PointPicker, radar_hover_points, projection_hover_points, FrameTimeHUD, COMPACT_STORAGE_ENTRIES
+)
+from operations.projection_operations import fit_projection
+from operations.lattice_operations import edit_basis
+from backend.data_manager import init_preview_data, init_angle
+from backend.data_sources import open_source, RandomSource
+from backend.result_cache import ResultCache, default_cache_dir
+from backend import profiling
+from frontend.workers import ReductionWorker, EditWorker, start_worker
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from matplotlib.animation import FuncAnimation
-from matplotlib.pyplot import close
 import numpy as np
 
 
-plt.rcParams['animation.embed_limit'] = 100.0
-
 class MyApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, source=None, index=0):
         super().__init__()
+        self.source = source if source is not None else RandomSource()
+        self.basis_index = index
         self.current_view = "radar_graph"
         # self.current_view = "standard_view"  # Default view
+        self.render_mode = "blit"  # "blit" redraws only animated artists, "full" redraws the figure
+        self.render_backend = "auto"  # "artists", "collections", or "auto" to pick collections for large bases
+        self.animation_source = "morph"  # "morph" blends start and end, "trajectory" replays the LLL steps
+        self.projection_method = "pca"  # Name in projection_operations.PROJECTIONS, for the projection view
+        self.level_of_detail = "auto"  # "minmax", "lttb", "off", or "auto" for minmax on high-dimensional bases
+        self.storage = "auto"  # "full", "compact" (float32, lazy frames), or "auto" for compact on large bases
+        self.basis_pair = None  # (data, start, end) float32 copies shared by the views in compact storage
+        self.lod = None
+        self.picker = None
+        self.compact = None  # Handles of the collection-based standard view, see create_compact_plot
+        self.hud = None  # FrameTimeHUD while the frame-time overlay is shown
+        self.frame_state = None  # State of the shown frame, for hover tooltips
+        self.projection = None
+        self.projection_data = None  # The data dict self.projection was fitted for
         self.initUI()
 
     def initUI(self):
@@ -40,38 +66,163 @@ class MyApp(QMainWindow):
         self.layout = QVBoxLayout(self.container)
         self.container.setLayout(self.layout)
 
-        self.Basis = Basis
         self.repeat = True
 
+        self.reduction_worker = None
+        self.reduction_thread = None
+        self.reduction_status = ""
+        self.reduction_running = False
+        self.result_cache = None
+        self.edit_session = None  # IncrementalLLL of the last edit, reused by the next one
+        self.reduced = None  # (Basis, signed reduced basis) of the last finished reduction
+        self.pre_edit = None  # (Basis, data) restored when an edit is cancelled or fails
+        self.pending_edits = []  # Edits applied to pre_edit's basis that have not been reduced yet
+
+        # Paint an empty window first; the basis, plots and controls are built once the event loop runs
+        self.loading_label = QLabel('Loading basis...', self)
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.loading_label)
+        QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        ''' Load the basis and build the views behind the skeleton window shown by initUI '''
+        self.Basis = self.source[self.basis_index]
+        self.result_cache = self.open_result_cache()
         self.init_data()
+        self.loading_label.setParent(None)
         self.init_plot()
         self.setup_ui()
         self.animation()
+        self.start_reduction()
 
     def init_data(self):
-        self.data = init_data()
+        # Show the original basis right away, the reduced target arrives from start_reduction
+        self.data = init_preview_data(self.Basis)
         # print(self.data)
 
+    def open_result_cache(self):
+        ''' Cache reductions on disk, or only in memory if the cache directory is not writable '''
+        try:
+            return ResultCache(default_cache_dir())
+        except OSError:
+            return ResultCache()
+
+    def start_reduction(self):
+        ''' Run the LLL reduction and angle computation on a worker thread '''
+        self.start_reduction_worker(ReductionWorker(self.Basis, cache=self.result_cache))
+        self.set_reduction_status("Reducing...", running=True)
+
+    def start_reduction_worker(self, worker):
+        self.reduction_worker = worker
+        self.reduction_worker.progress.connect(self.on_reduction_progress)
+        self.reduction_worker.finished.connect(self.on_reduction_finished)
+        self.reduction_worker.cancelled.connect(self.on_reduction_cancelled)
+        self.reduction_worker.failed.connect(self.on_reduction_failed)
+        self.reduction_thread = start_worker(self.reduction_worker)
+
+    def set_reduction_status(self, text, running=False):
+        self.reduction_status = text
+        self.reduction_running = running
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(text)
+            self.cancel_button.setEnabled(running)
+
+    def from_current_worker(self):
+        ''' Signals of a worker whose basis has since been replaced are ignored '''
+        return self.sender() is self.reduction_worker
+
+    def on_reduction_progress(self, k, n_rows, swaps):
+        if not self.from_current_worker():
+            return
+        self.set_reduction_status(f"Reducing: k = {k}/{n_rows}, swaps = {swaps}", running=True)
+
+    def on_reduction_finished(self, data):
+        ''' Swap in the reduced target and rebuild the current view '''
+        if not self.from_current_worker():
+            return
+        if isinstance(self.sender(), EditWorker):
+            self.edit_session = self.sender().session
+        self.pre_edit = None
+        self.pending_edits = []
+        self.data = data
+        self.reduced = (self.Basis, data['reduced_Basis'])
+        self.set_reduction_status("Reduction finished")
+        self.show_current_view()
+
+    def on_reduction_cancelled(self):
+        if not self.from_current_worker():
+            return
+        if self.restore_pre_edit():
+            self.set_reduction_status("Edit cancelled, basis restored")
+            return
+        self.set_reduction_status("Reduction cancelled, showing the original basis")
+
+    def on_reduction_failed(self, message):
+        if not self.from_current_worker():
+            return
+        if self.restore_pre_edit():
+            self.set_reduction_status(f"Edit failed: {message}, basis restored")
+            return
+        self.set_reduction_status(f"Reduction failed: {message}")
+
+    def on_cancel_reduction(self):
+        if self.reduction_worker is not None:
+            self.reduction_worker.cancel()
+
+    @profiling.profiled('MyApp.init_plot')
     def init_plot(self):
         self.fig = Figure(figsize=(16, 12))  # Increased height for better spacing
         self.canvas = FigureCanvas(self.fig)
         self.layout.addWidget(self.canvas)
 
+        self.lod = None
+        self.compact = None
+        if self.picker is not None:
+            self.picker.disconnect()
         if self.current_view == "standard_view":
             
+            start, end = self.frame_bases()
             self.ax_top, self.ax_angles, self.Basis_interp_line, self.target_interp_line, self.x_interp_line = initialize_plot(
                                                                                                 self.fig, self.data['vec_dimension'], 
-                                                                                                self.Basis, self.data['scale'], self.data['method'],
-                                                                                                self.Basis, self.data['target_Basis']
+                                                                                                start, self.data['scale'], self.data['method'],
+                                                                                                start, end
                                                                                             )
-            self.update_plot()
+            if self.compact_storage():
+                self.Basis_interp_line = self.Basis_interp_line.astype(np.float32)
+                self.target_interp_line = self.target_interp_line.astype(np.float32)
+            if self.use_collections():
+                self.compact = create_compact_plot(
+                    self.ax_top, self.data['vec_dimension'], self.x_interp_line, start,
+                    self.Basis_interp_line, self.ax_angles, self.data['angles_basis_complementary'],
+                    max_columns=2 * LOD_DIMENSIONS if self.lod_method() else None
+                )
+            else:
+                self.update_plot()
+            if self.replay_trajectory():
+                self.frames = standard_trajectory_engine(
+                    self.data['trace'], self.data['vec_dimension'], self.data['scale'], self.data['method'],
+                    self.data['total_frames'], easing=self.data['easing'], compact=self.compact_storage()
+                )
+            else:
+                self.frames = standard_frame_engine(
+                    self.data['vec_dimension'], start, end,
+                    self.Basis_interp_line, self.target_interp_line,
+                    self.data['angles_basis_complementary'], self.data['target_angles_basis_complementary'],
+                    self.data['total_frames'], easing=self.data['easing'], compact=self.compact_storage()
+                )
+            draw_static_standard_view(self.ax_top, self.data['vec_dimension'], self.frames,
+                                      handles=self.compact['handles'] if self.compact else None)
+            if self.lod_method():
+                self.lod = DimensionLOD(self.ax_top, self.data['vec_dimension'], self.lod_method(),
+                                        on_change=self.on_lod_change)
 
         elif self.current_view == "radar_graph":
             # Prepare data for the radar graph
+            start, end = self.frame_bases()
             self.radar_data = create_radar_graph(
                                 self.fig,
-                                np.abs(self.Basis), 
-                                np.abs(self.data['target_Basis']),
+                                np.abs(start), 
+                                np.abs(end),
                                 labels = [f"Dimension {i + 1}" for i in range(self.Basis.shape[1])]
                             )
             self.radar_data_start = self.radar_data['data_start']
@@ -80,11 +231,156 @@ class MyApp(QMainWindow):
             self.radar_fills = self.radar_data['fills']
             self.radar_ax = self.radar_data['ax']
             self.radar_theta = self.radar_data['theta']
-
-            max_val = max(np.max(self.radar_data_start), np.max(self.radar_data_end))
+            if self.replay_trajectory():
+                self.frames = radar_trajectory_engine(self.data['trace'], self.data['total_frames'],
+                                                      easing=self.data['easing'], spokes=self.radar_data['spokes'],
+                                                      compact=self.compact_storage())
+                max_val = self.frames.bounds('radar')[1]
+            else:
+                self.frames = radar_frame_engine(self.radar_data, self.data['total_frames'], easing=self.data['easing'],
+                                                 compact=self.compact_storage())
+                max_val = max(np.max(self.radar_data_start), np.max(self.radar_data_end))
             self.radar_ax.set_ylim(0, max_val + 10)
-        
-    
+
+        elif self.current_view == "projection_view":
+            projection = self.fitted_projection()
+            self.projected = create_projection_plot(self.fig, projection, self.Basis, self.data['reduced_Basis'])
+            if self.replay_trajectory():
+                self.frames = projection_trajectory_engine(self.data['trace'], self.projected,
+                                                           self.data['total_frames'], easing=self.data['easing'])
+            else:
+                self.frames = projection_frame_engine(self.projected, self.Basis, self.data['reduced_Basis'],
+                                                      self.data['total_frames'], easing=self.data['easing'])
+            set_projection_limits(self.projected, self.frames)
+
+        self.picker = PointPicker(self.view_axis(), self.describe_point, on_pick=self.on_pick_point,
+                                  on_change=self.on_hover_change)
+        if self.hud is not None:
+            self.hud = FrameTimeHUD(self.fig)
+
+    def view_axis(self):
+        ''' The axis of the current view that holds the basis vectors '''
+        if self.current_view == "standard_view":
+            return self.ax_top
+        if self.current_view == "projection_view":
+            return self.projected['ax']
+        return self.radar_ax
+
+    def row_angle(self, row):
+        ''' Angle text of a basis vector in the shown frame, or start and reduced angles for views without one '''
+        if 'angles' in self.frame_state:
+            return f"{self.frame_state['angles'][row]:.2f}°"
+        return (f"{self.data['angles_basis_complementary'][row]:.2f}° -> "
+                f"{self.data['target_angles_basis_complementary'][row]:.2f}°")
+
+    def describe_point(self, row, column, point):
+        ''' Tooltip text for the hovered point '''
+        if self.current_view == "standard_view":
+            coordinates = f"Dimension {point[0]:.0f}: {point[1]:.4g}"
+        elif self.current_view == "projection_view":
+            coordinates = f"({point[0]:.4g}, {point[1]:.4g})"
+        else:
+            coordinates = f"{self.radar_data['labels'][column]}: {point[1]:.4g}"
+        return f"Basis {row + 1}\n{coordinates}\nAngle: {self.row_angle(row)}"
+
+    def on_pick_point(self, row, column):
+        ''' Bring the clicked basis vector into view in the selection list '''
+        self.basis_list.scrollToItem(self.basis_list.item(row))
+
+    def on_hover_change(self):
+        ''' Show a changed tooltip, also while the animation is paused '''
+        if isinstance(self.anim, BlitAnimation):
+            self.anim.redraw()
+        else:
+            self.canvas.draw_idle()
+
+    def fitted_projection(self):
+        ''' The 2-D projection of the current basis pair, fitted once and reused across frames and redraws '''
+        if (self.projection is None or self.projection_data is not self.data
+                or self.projection.method != self.projection_method):
+            self.projection = fit_projection(self.Basis, self.data['reduced_Basis'], self.projection_method)
+            self.projection_data = self.data
+        return self.projection
+
+    def compact_storage(self):
+        ''' Whether frames are stored as float32 and evaluated one at a time, see plots.frame_storage '''
+        if self.storage == "auto":
+            return self.Basis.size > COMPACT_STORAGE_ENTRIES
+        return self.storage == "compact"
+
+    def frame_bases(self):
+        '''
+        The start and reduced bases the views animate. In compact storage these are float32
+        copies made once per data and shared by the standard and radar views and their frame engines.
+        '''
+        if not self.compact_storage():
+            self.basis_pair = None
+            return self.Basis, self.data['target_Basis']
+        if self.basis_pair is None or self.basis_pair[0] is not self.data:
+            self.basis_pair = (self.data, np.asarray(self.Basis, dtype=np.float32),
+                               np.asarray(self.data['target_Basis'], dtype=np.float32))
+        return self.basis_pair[1:]
+
+    def set_storage(self, mode):
+        self.storage = mode
+        self.show_current_view()
+
+    def memory_usage(self):
+        '''
+        Bytes held by the basis data and the current view's frame state, by component.
+        '''
+        usage = {
+            'basis': _nbytes(self.Basis),
+            'reduced basis': _nbytes(self.data['target_Basis']),
+        }
+        if self.basis_pair is not None:
+            usage['float32 bases (shared)'] = self.basis_pair[1].nbytes + self.basis_pair[2].nbytes
+        if self.current_view == "standard_view":
+            usage['interpolation'] = self.Basis_interp_line.nbytes + self.target_interp_line.nbytes
+        engine = self.frames.nbytes()
+        usage['frame series'] = engine['series']
+        usage['cached frames'] = engine['chunks']
+        return usage
+
+    def on_memory_usage(self):
+        usage = self.memory_usage()
+        lines = [f"{name}: {size / 2 ** 20:.1f} MB" for name, size in usage.items()]
+        lines.append(f"total: {sum(usage.values()) / 2 ** 20:.1f} MB")
+        try:
+            import resource
+            # ru_maxrss is in kilobytes on Linux
+            lines.append(f"peak process memory: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10:.1f} MB")
+        except ImportError:
+            pass
+        storage = "compact (float32, lazy frames)" if self.compact_storage() else "full"
+        QMessageBox.information(self, 'Memory Usage', f"Frame storage: {storage}\n\n" + "\n".join(lines))
+
+    def lod_method(self):
+        ''' Decimation method for the standard view, or None to draw every dimension '''
+        if self.level_of_detail == "auto":
+            return "minmax" if self.Basis.shape[1] > LOD_DIMENSIONS else None
+        return None if self.level_of_detail == "off" else self.level_of_detail
+
+    def on_lod_change(self):
+        ''' Re-decimate the shown frame after a zoom or pan, so paused frames refine too '''
+        if hasattr(self, 'anim') and hasattr(self, 'slider_bar'):
+            self.update(self.slider_bar.value())
+
+    def set_level_of_detail(self, mode):
+        self.level_of_detail = mode
+        if self.current_view == "standard_view":
+            self.show_standard_view()
+
+    def replay_trajectory(self):
+        ''' Whether frames replay the recorded LLL steps rather than morphing start to end '''
+        return self.animation_source == "trajectory" and self.data.get('trace') is not None
+
+    def use_collections(self):
+        ''' Whether the standard view should use the compact collection-based artists '''
+        if self.render_backend == "auto":
+            return self.Basis.shape[0] > COMPACT_ROWS
+        return self.render_backend == "collections"
+
     def update_plot(self, offsets = []):
         self.scatter, self.line_ori, self.line_interp, self.ax_angles, self.angle_plots = update_plot(
             self.ax_top, 
@@ -95,7 +391,8 @@ class MyApp(QMainWindow):
             self.ax_angles,
             self.data['angles_basis_complementary'],
             self.data['target_angles_basis_complementary'],
-            self.fig
+            self.fig,
+            self.Basis
         )
     
     def setup_ui(self):
@@ -124,11 +421,19 @@ class MyApp(QMainWindow):
         self.slider_bar.setValue(0)
         self.slider_bar.valueChanged.connect(self.on_slider)
 
+        # Reduction status and cancel button
+        self.status_label = QLabel(self.reduction_status, self)
+        self.cancel_button = QPushButton('Cancel Reduction', self)
+        self.cancel_button.setEnabled(self.reduction_running)
+        self.cancel_button.clicked.connect(self.on_cancel_reduction)
+
         # Add widgets to controls layout
         self.controls_layout.addWidget(self.play_button)
         self.controls_layout.addWidget(self.loop_checkbox)
         self.controls_layout.addWidget(QLabel("Frame:"))
         self.controls_layout.addWidget(self.slider_bar)
+        self.controls_layout.addWidget(self.status_label)
+        self.controls_layout.addWidget(self.cancel_button)
 
         self.layout.addWidget(self.controls_frame)
 
@@ -145,8 +450,8 @@ class MyApp(QMainWindow):
         self.basis_list.setSelectionMode(QAbstractItemView.MultiSelection)
         for i in range(self.Basis.shape[0]):
             item = QListWidgetItem(f'Basis Vector {i + 1}')
-            item.setSelected(True)  # Default to selected
             self.basis_list.addItem(item)
+            item.setSelected(True)  # Default to selected, only takes effect once the item is in the list
         self.basis_list.itemSelectionChanged.connect(self.update_selected_arcs)
         self.selection_layout.addWidget(self.basis_list)
 
@@ -158,8 +463,220 @@ class MyApp(QMainWindow):
         self.layout.addWidget(self.toolbar)
     
     def setup_menubar(self,menubar):
+        self.setup_file_menu(menubar)
+        self.setup_edit_menu(menubar)
         self.setup_toggle_menu(menubar)
         self.setup_view_menu(menubar)
+        self.setup_profile_menu(menubar)
+
+    def setup_profile_menu(self, menubar):
+        profile_menu = menubar.addMenu('Profile')
+
+        hud_action = profile_menu.addAction('Frame Time Overlay')
+        hud_action.setCheckable(True)
+        hud_action.setChecked(self.hud is not None)
+        hud_action.triggered.connect(self.set_frame_time_hud)
+
+        record_action = profile_menu.addAction('Record Profile')
+        record_action.setCheckable(True)
+        record_action.setChecked(profiling.PROFILER.enabled)
+        record_action.triggered.connect(
+            lambda checked: profiling.PROFILER.enable() if checked else profiling.PROFILER.disable()
+        )
+
+        export_action = profile_menu.addAction('Export Profile...')
+        export_action.triggered.connect(self.on_export_profile)
+
+        reset_action = profile_menu.addAction('Reset Profile')
+        reset_action.triggered.connect(profiling.PROFILER.reset)
+
+        profile_menu.addSeparator()
+        memory_action = profile_menu.addAction('Memory Usage...')
+        memory_action.triggered.connect(self.on_memory_usage)
+
+    def set_frame_time_hud(self, checked):
+        ''' Show or hide the per-frame update and draw time overlay '''
+        if checked and self.hud is None:
+            self.hud = FrameTimeHUD(self.fig)
+            # Keep it out of the cached blit background, it is drawn with every frame
+            self.hud.text.set_animated(self.render_mode == "blit")
+        elif not checked and self.hud is not None:
+            self.hud.remove()
+            self.hud = None
+        self.canvas.draw_idle()
+
+    def on_frame_timing(self, update_seconds, draw_seconds):
+        if self.hud is not None:
+            self.hud.record(update_seconds, draw_seconds)
+
+    def on_export_profile(self):
+        ''' Write the recorded spans and counters as a Chrome trace or a JSON summary '''
+        path, selected = QFileDialog.getSaveFileName(
+            self, 'Export Profile', 'profile.json', 'Chrome Trace (*.json);;Summary (*.json)'
+        )
+        if not path:
+            return
+        try:
+            profiling.PROFILER.export(path, 'summary' if selected.startswith('Summary') else 'chrome')
+        except OSError as e:
+            QMessageBox.warning(self, 'Export Profile', f'Could not write {path}: {e}')
+
+    def setup_edit_menu(self, menubar):
+        edit_menu = menubar.addMenu('Edit')
+
+        append_action = edit_menu.addAction('Append Vector...')
+        append_action.triggered.connect(self.on_append_vector)
+
+        random_action = edit_menu.addAction('Append Random Vector')
+        random_action.triggered.connect(self.on_append_random_vector)
+
+        delete_action = edit_menu.addAction('Delete Vector...')
+        delete_action.triggered.connect(self.on_delete_vector)
+
+        entry_action = edit_menu.addAction('Edit Entry...')
+        entry_action.triggered.connect(self.on_edit_entry)
+
+    def on_append_vector(self):
+        n_cols = self.Basis.shape[1]
+        text, ok = QInputDialog.getText(self, 'Append Vector',
+                                        f'{n_cols} integer entries, separated by spaces or commas:')
+        if not ok:
+            return
+        try:
+            values = [int(x) for x in text.replace(',', ' ').split()]
+        except ValueError:
+            QMessageBox.warning(self, 'Append Vector', f'Not a list of integers: {text}')
+            return
+        self.apply_edit({'action': 'append', 'values': values})
+
+    def on_append_random_vector(self):
+        ''' Append a vector with entries of the size of the current ones '''
+        high = max(int(np.abs(self.Basis).max()), 1)
+        values = np.random.default_rng().integers(-high, high, size=self.Basis.shape[1], endpoint=True)
+        self.apply_edit({'action': 'append', 'values': values})
+
+    def on_delete_vector(self):
+        n_rows = self.Basis.shape[0]
+        row, ok = QInputDialog.getInt(self, 'Delete Vector', f'Basis vector to delete (1 to {n_rows}):',
+                                      n_rows, 1, n_rows)
+        if ok:
+            self.apply_edit({'action': 'delete', 'index': row - 1})
+
+    def on_edit_entry(self):
+        n_rows, n_cols = self.Basis.shape
+        row, ok = QInputDialog.getInt(self, 'Edit Entry', f'Basis vector (1 to {n_rows}):', 1, 1, n_rows)
+        if not ok:
+            return
+        column, ok = QInputDialog.getInt(self, 'Edit Entry', f'Entry (1 to {n_cols}):', 1, 1, n_cols)
+        if not ok:
+            return
+        text, ok = QInputDialog.getText(self, 'Edit Entry', f'New value of entry {column} of vector {row}:',
+                                        text=str(self.Basis[row - 1, column - 1]))
+        if not ok:
+            return
+        try:
+            value = int(text)
+        except ValueError:
+            QMessageBox.warning(self, 'Edit Entry', f'Not an integer: {text}')
+            return
+        self.apply_edit({'action': 'modify', 'index': row - 1, 'values': [value], 'columns': [column - 1]})
+
+    def apply_edit(self, edit):
+        '''
+        Show the edited basis right away and re-reduce it on a worker thread, resuming
+        from the reduced vectors before the first edited one, see IncrementalLLL. Edits
+        made while an earlier one is still reducing are applied on top of it, and the
+        worker redoes the whole chain from the last reduced basis.
+        '''
+        try:
+            Basis = edit_basis(self.Basis, **edit)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Edit Basis', str(e))
+            return
+        if self.reduction_thread is not None and self.reduction_thread.isRunning():
+            self.reduction_worker.cancel()
+            self.reduction_thread.wait()
+        if self.pre_edit is None:
+            self.pre_edit = (self.Basis, self.data)
+            self.pending_edits = []
+        self.pending_edits.append(edit)
+        start = self.pre_edit[0]
+        reduced = self.reduced[1] if self.reduced is not None and self.reduced[0] is start else None
+        worker = EditWorker(start, list(self.pending_edits), session=self.edit_session, reduced=reduced)
+        self.Basis = Basis
+        self.init_data()
+        self.show_current_view()
+        self.start_reduction_worker(worker)
+        self.set_reduction_status("Re-reducing from the first edited vector...", running=True)
+
+    def restore_pre_edit(self):
+        ''' Go back to the basis from before the edits that did not finish, returns whether there were any '''
+        if self.pre_edit is None:
+            return False
+        self.Basis, self.data = self.pre_edit
+        self.pre_edit = None
+        self.pending_edits = []
+        self.show_current_view()
+        return True
+
+    def setup_file_menu(self, menubar):
+        file_menu = menubar.addMenu('File')
+
+        open_action = file_menu.addAction('Open Basis File...')
+        open_action.triggered.connect(self.on_open_file)
+
+        choose_action = file_menu.addAction('Choose Basis...')
+        choose_action.triggered.connect(self.on_choose_basis)
+
+    def on_open_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, 'Open Basis File', '',
+            'Bases (*.npy *.npz *.csv *.txt *.lat);;All Files (*)'
+        )
+        if not path:
+            return
+        try:
+            source = open_source(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, 'Open Basis File', f'Could not open {path}: {e}')
+            return
+        if len(source) == 0:
+            QMessageBox.warning(self, 'Open Basis File', f'No bases found in {path}')
+            return
+        self.source.close()
+        self.source = source
+        self.on_choose_basis()
+
+    def on_choose_basis(self):
+        ''' Pick a basis from the current source, by index since sources may hold thousands '''
+        index = 0
+        if len(self.source) > 1:
+            index, ok = QInputDialog.getInt(
+                self, 'Choose Basis', f'Basis index (0 to {len(self.source) - 1}):',
+                self.basis_index if self.basis_index < len(self.source) else 0, 0, len(self.source) - 1
+            )
+            if not ok:
+                return
+        self.load_basis(index)
+
+    def load_basis(self, index):
+        ''' Replace the displayed basis with basis `index` of the current source and reduce it '''
+        try:
+            Basis = self.source[index]
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, 'Choose Basis', f'Could not read {self.source.label(index)}: {e}')
+            return
+        if self.reduction_thread is not None and self.reduction_thread.isRunning():
+            self.reduction_worker.cancel()
+            self.reduction_thread.wait()
+        self.basis_index = index
+        self.Basis = Basis
+        self.pre_edit = None
+        self.pending_edits = []
+        self.setWindowTitle(f'LLL Visualization - {self.source.label(index)}')
+        self.init_data()
+        self.show_current_view()
+        self.start_reduction()
 
     def setup_toggle_menu(self,menubar):
         toggle_menu = menubar.addMenu('Toggle Visibility')
@@ -181,7 +698,12 @@ class MyApp(QMainWindow):
 
     def toggle_all_visibility(self, element, checked):
         ''' Toggle visibility of different plot elements '''
-        if element == 'scatter':
+        if self.current_view != "standard_view":
+            # The radar and projection views have no scatters or interpolation lines
+            return
+        if self.compact:
+            self.compact[element].set_visible(checked)
+        elif element == 'scatter':
             for scatter in self.scatter:
                 scatter.set_visible(checked)
         elif element == 'line_ori':
@@ -203,8 +725,64 @@ class MyApp(QMainWindow):
         standard_view_action = view_menu.addAction('Standard View')
         standard_view_action.triggered.connect(self.show_standard_view)
 
+        projection_view_action = view_menu.addAction('Projection View')
+        projection_view_action.triggered.connect(self.show_projection_view)
+
+        projection_menu = view_menu.addMenu('Projection Method')
+        projection_group = QActionGroup(self)
+        for method, label in (('pca', 'PCA'), ('gaussian', 'Gaussian Random'), ('sparse', 'Sparse Random'),
+                              ('mds', 'Classical MDS')):
+            action = projection_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(method == self.projection_method)
+            action.triggered.connect(lambda checked, method=method: self.set_projection_method(method))
+            projection_group.addAction(action)
+
+        lod_menu = view_menu.addMenu('Level of Detail')
+        lod_group = QActionGroup(self)
+        for mode, label in (('auto', 'Auto'), ('off', 'Off'), ('minmax', 'Min/Max Envelope'), ('lttb', 'LTTB')):
+            action = lod_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(mode == self.level_of_detail)
+            action.triggered.connect(lambda checked, mode=mode: self.set_level_of_detail(mode))
+            lod_group.addAction(action)
+
+        storage_menu = view_menu.addMenu('Frame Storage')
+        storage_group = QActionGroup(self)
+        for mode, label in (('auto', 'Auto'), ('full', 'Full (float64)'), ('compact', 'Compact (float32, lazy)')):
+            action = storage_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(mode == self.storage)
+            action.triggered.connect(lambda checked, mode=mode: self.set_storage(mode))
+            storage_group.addAction(action)
+
+        view_menu.addSeparator()
+        trajectory_action = view_menu.addAction('Replay LLL Steps')
+        trajectory_action.setCheckable(True)
+        trajectory_action.setChecked(self.animation_source == "trajectory")
+        trajectory_action.triggered.connect(self.set_trajectory_replay)
+
+    def set_trajectory_replay(self, checked):
+        ''' Switch between the start-to-end morph and replaying the actual reduction steps '''
+        self.animation_source = "trajectory" if checked else "morph"
+        self.show_current_view()
+
+    def set_projection_method(self, method):
+        ''' Choose the projection and show the projection view with it '''
+        self.projection_method = method
+        self.show_projection_view()
+
+    def show_current_view(self):
+        if self.current_view == "standard_view":
+            self.show_standard_view()
+        elif self.current_view == "projection_view":
+            self.show_projection_view()
+        else:
+            self.show_radar_graph()
+
     def show_radar_graph(self):
         self.current_view = "radar_graph"
+        self.stop_animation()
         for i in reversed(range(self.layout.count())):
             widget = self.layout.itemAt(i).widget()
             if widget:
@@ -218,9 +796,11 @@ class MyApp(QMainWindow):
         self.init_plot()
         self.canvas.draw_idle()
         self.setup_ui_main()
+        self.animation()
 
     def show_standard_view(self):
         self.current_view = "standard_view"
+        self.stop_animation()
 
         # Clear existing layout
         for i in reversed(range(self.layout.count())):
@@ -236,37 +816,60 @@ class MyApp(QMainWindow):
         self.init_plot()
         self.canvas.draw_idle()
         self.setup_ui_main()
+        self.animation()
+
+    def show_projection_view(self):
+        self.current_view = "projection_view"
+        self.stop_animation()
+
+        # Clear existing layout
+        for i in reversed(range(self.layout.count())):
+            widget = self.layout.itemAt(i).widget()
+            if widget:
+                widget.setParent(None)
+
+        # Clear the old figure, if any
+        if hasattr(self, 'current_fig'):
+            self.clear_figure(self.current_fig)
+
+        self.init_plot()
+        self.canvas.draw_idle()
+        self.setup_ui_main()
+        self.animation()
 
     def clear_figure(self,fig):
         """
         Clears and closes the given figure to prevent residual elements.
         """
         if fig:
+            from matplotlib.pyplot import close
             fig.clf()  # Clear the figure
             close(fig)  # Close the figure to free memory
 
-    def on_hover(self, event):
-        ''' Display annotation when hovering over a scatter or line '''
-        vis = False
-        if event.inaxes == self.ax_top:
-            for i, (scatter, line) in enumerate(zip(self.scatter, self.line_ori)):
-                cont_scatter, _ = scatter.contains(event)
-                cont_line, _ = line.contains(event)
-                if cont_scatter or cont_line:
-                    angle = self.angles_basis_complementary[i]
-                    self.annotation.xy = (event.xdata, event.ydata)
-                    self.annotation.set_text(f'Basis {i+1}\nAngle: {angle}°')
-                    self.annotation.set_visible(True)
-                    vis = True
-                    break
-        if not vis:
-            self.annotation.set_visible(False)
-        self.canvas.draw_idle()
-
     def update_selected_arcs(self):
         ''' Update which arcs and basis vectors are displayed based on selection '''
         selected_items = self.basis_list.selectedItems()
         selected_indices = [int(item.text().split(' ')[-1]) - 1 for item in selected_items]
+        visible = np.zeros(self.Basis.shape[0], dtype=bool)
+        visible[selected_indices] = True
+        self.picker.set_visible_rows(visible)
+
+        if self.current_view == "projection_view":
+            set_projection_row_visibility(self.projected, visible)
+            self.canvas.draw_idle()
+            return
+
+        if self.current_view == "radar_graph":
+            for line, fill, shown in zip(self.radar_lines, self.radar_fills, visible):
+                line.set_visible(shown)
+                fill.set_visible(shown)
+            self.canvas.draw_idle()
+            return
+
+        if self.compact:
+            set_compact_row_visibility(self.compact, visible)
+            self.canvas.draw_idle()
+            return
 
         # Hide all arcs and basis vectors first
         for i, plot in enumerate(self.angle_plots):
@@ -299,64 +902,66 @@ class MyApp(QMainWindow):
         """
         Unified update function for both radar graph and standard visualization.
         """
-        if self.current_view == "radar_graph":
-            alpha = frame / (self.data['total_frames'] - 1)
-            # print(f"Frame {frame}/{self.data['total_frames']}: alpha={alpha:.3f}")  # Debugging: Frame progress
-
-            for i, line in enumerate(self.radar_lines):
-                interpolated_row = (1 - alpha) * self.radar_data_start[i] + alpha *  self.radar_data_end[i]
-
-                # Update the radar chart
-                line.set_ydata(interpolated_row)
-                self.radar_fills[i].remove()
-                self.radar_fills[i] = self.radar_ax.fill(self.radar_theta, interpolated_row, alpha=0.25)[0]
-            self.radar_ax.legend(bbox_to_anchor=(1.5, 1), loc='upper left', borderaxespad=0)
-            
-            
-            # return self.radar_lines + self.radar_fills
-
-        elif self.current_view == "standard_view":
-            alpha = frame / (self.data['total_frames'] - 1) if self.data['total_frames'] > 1 else 1.0
-            # Update standard visualization (basis vectors and angles)
-            for i, (line_interp, line_ori, scatter) in enumerate(zip(self.line_interp, self.line_ori, self.scatter)):
-                interpolated_data = (1 - alpha) * self.Basis_interp_line[i] + alpha * self.target_interp_line[i]
-                interpolated_line_ori = (1 - alpha) * self.Basis[i] + alpha * self.data['target_Basis'][i]
-
-                # Handle non-finite values
-                if not np.all(np.isfinite(interpolated_data)):
-                    interpolated_data = np.nan_to_num(interpolated_data, nan=0.0, posinf=0.0, neginf=0.0)
-                if not np.all(np.isfinite(interpolated_line_ori)):
-                    interpolated_line_ori = np.nan_to_num(interpolated_line_ori, nan=0.0, posinf=0.0, neginf=0.0)
-
-                line_interp.set_ydata(interpolated_data)
-                line_ori.set_ydata(interpolated_line_ori)
-                interpolated_offsets = np.column_stack((self.data['vec_dimension'], interpolated_line_ori))
-                scatter.set_offsets(interpolated_offsets)
-
-            # self.ax_top.relim()
-            self.ax_top.autoscale_view()
-            self.ax_top.grid(True)
-            self.ax_top.legend(bbox_to_anchor=(1.02, 1), loc='upper left', borderaxespad=0)
-            self.ax_top.set_xticks(self.data['vec_dimension'])
-
-            # Update angles (arcs)
-            for i, (arc, line1, line2, angle_text, initial_angle, target_angle) in enumerate(self.angle_plots):
-                if i >= len(self.angle_plots):
-                    continue
-                offset = get_arc_offset(i, self.Basis.shape[0])
-                update_angle(frame, self.data['total_frames'], self.ax_angles, i, arc, line1, line2, angle_text,
-                            initial_angle, target_angle, radius=0.4, offset=offset)
+        start = time.perf_counter()
+        with profiling.span('MyApp.update', frame=frame, view=self.current_view):
+            state = self.frames.frame(frame)
+            artists = []
+            if self.current_view == "radar_graph":
+                artists = apply_radar_frame(state, self.radar_data)
+                points = radar_hover_points(state, self.radar_data)
+
+            elif self.current_view == "standard_view":
+                if self.lod is not None:
+                    state = self.lod.apply(state)
+                if self.compact:
+                    artists = apply_compact_frame(state, self.compact)
+                else:
+                    artists = apply_standard_frame(state, self.line_interp, self.line_ori, self.scatter,
+                                                   self.angle_plots)
+                points = state['offsets']
+
+            elif self.current_view == "projection_view":
+                artists = apply_projection_frame(state, self.projected)
+                points = projection_hover_points(state)
+
+            # Only stores the points; the hover index is rebuilt when the pointer next moves
+            self.frame_state = state
+            self.picker.set_frame(points)
+            artists.append(self.picker.annotation)
+
+        if self.hud is not None:
+            if self.render_mode == "full":
+                # Drawn later by draw_idle, so only the update is timed
+                self.hud.record(time.perf_counter() - start)
+            artists.append(self.hud.refresh())
 
         # Update the slider position only if the animation is running
         if self.anim.event_source is not None:
+            self.slider_bar.blockSignals(True)
             self.slider_bar.setValue(frame)
+            self.slider_bar.blockSignals(False)
 
-        self.canvas.draw_idle()
+        if self.render_mode == "full":
+            self.canvas.draw_idle()
+        return artists
 
 
     def animation(self):
 
         ''' Initialize and start the animation '''
+        if self.render_mode == "blit":
+            self.anim = BlitAnimation(
+                self.fig,
+                self.update,
+                frames=self.data['total_frames'],
+                interval=100,
+                repeat=self.repeat,
+                on_timing=self.on_frame_timing
+            )
+            self.anim.draw_frame(0)
+            return
+
+        from matplotlib.animation import FuncAnimation
         self.anim = FuncAnimation(
             self.fig,
             self.update,
@@ -365,12 +970,16 @@ class MyApp(QMainWindow):
             repeat=self.repeat,
             blit=False
         )
-        
-        if self.current_view == "standard_view":
-            self.ax_top.grid(True)
 
         self.canvas.draw()
 
+    def stop_animation(self):
+        ''' Stop the running animation before its figure is replaced '''
+        if hasattr(self, 'anim'):
+            self.anim.event_source.stop()
+            if isinstance(self.anim, BlitAnimation):
+                self.anim.stop()
+
     def on_toggle(self):
         '''Toggle between play and pause states'''
         if self.play_button.text() == 'Pause':
@@ -384,8 +993,11 @@ class MyApp(QMainWindow):
         ''' Function to control the slider '''
         new_frame = self.slider_bar.value()
         self.anim.event_source.stop()
-        self.update(new_frame)
-        self.canvas.draw_idle()
+        if isinstance(self.anim, BlitAnimation):
+            self.anim.seek(new_frame)
+        else:
+            self.update(new_frame)
+            self.canvas.draw_idle()
 
         if self.play_button.text() == 'Pause':
             self.anim.event_source.start()
@@ -397,9 +1009,19 @@ class MyApp(QMainWindow):
 
     def closeEvent(self, event):
         ''' Properly close the animation to prevent errors '''
-        self.anim.event_source.stop()
+        if hasattr(self, 'anim'):
+            self.anim.event_source.stop()
+        if self.reduction_thread is not None and self.reduction_thread.isRunning():
+            self.reduction_worker.cancel()
+            self.reduction_thread.wait()
         event.accept()
 
+def _nbytes(array):
+    # Object arrays hold Python ints, count their digits as well as the pointers
+    if array.dtype == object:
+        return array.nbytes + sum(sys.getsizeof(value) for value in array.flat)
+    return array.nbytes
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     ex = MyApp()
@@ -0,0 +1,116 @@
+### workers.py
+import time
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
+from backend.data_manager import init_data, init_edit_data
+from operations.lattice_operations import ReductionCancelled
+
+class ReductionWorker(QObject):
+    """
+    Runs init_data (LLL reduction and angle computation) off the GUI thread.
+
+    Signals:
+        progress (int, int, int): Current LLL index k, number of rows and swap count.
+        finished (dict): The data dict returned by init_data, including the reduction trace.
+        cancelled: Emitted when cancel() stopped the reduction.
+        failed (str): Error message if the computation raised.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        progress_interval (float): Minimum number of seconds between progress signals.
+        **options: Reduction algorithm and options passed on to init_data.
+    """
+    progress = pyqtSignal(int, int, int)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, Basis, progress_interval=0.1, **options):
+        super().__init__()
+        self.Basis = Basis
+        self.options = options
+        self.progress_interval = progress_interval
+        self._cancel_requested = False
+        self._last_progress = 0.0
+
+    def cancel(self):
+        ''' Ask the running reduction to stop at its next iteration '''
+        self._cancel_requested = True
+
+    def _should_stop(self):
+        return self._cancel_requested
+
+    def _on_progress(self, k, swaps):
+        # The LLL loop reports every iteration, only forward a few updates per second
+        now = time.perf_counter()
+        if now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            self.progress.emit(k, self.Basis.shape[0], swaps)
+
+    @pyqtSlot()
+    def run(self):
+        # Must be a slot so that thread.started runs it on the worker thread
+        try:
+            data = init_data(self.Basis, progress=self._on_progress, should_stop=self._should_stop, trace=True,
+                             **self.options)
+        except ReductionCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(data)
+
+class EditWorker(ReductionWorker):
+    """
+    Applies basis edits and re-reduces incrementally off the GUI thread, see
+    data_manager.init_edit_data. Has the signals of ReductionWorker; finished
+    carries data without a trace and the session is left in self.session.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix before the edits.
+        edits (list): The edits in order, see lattice_operations.edit_basis.
+        session (IncrementalLLL): The session holding Basis, if any.
+        reduced (np.ndarray): An LLL-reduced basis of Basis, if known.
+        progress_interval (float): Minimum number of seconds between progress signals.
+    """
+
+    def __init__(self, Basis, edits, session=None, reduced=None, progress_interval=0.1):
+        super().__init__(Basis, progress_interval)
+        self.edits = edits
+        self.session = session
+        self.reduced = reduced
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            data, self.session = init_edit_data(self.Basis, self.edits, self.session, self.reduced,
+                                                progress=self._on_progress, should_stop=self._should_stop)
+        except ReductionCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(data)
+
+def start_worker(worker):
+    """
+    Moves the worker onto a new QThread and starts it.
+
+    Parameters:
+        worker (ReductionWorker): The worker to run.
+
+    Returns:
+        thread (QThread): The running thread, which quits once the worker is done, so
+            thread.wait() after worker.cancel() returns without running the GUI event loop.
+    """
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    # Quit from the worker thread itself: a queued quit would wait for the GUI thread,
+    # which may be the one blocked in thread.wait()
+    worker.finished.connect(thread.quit, Qt.DirectConnection)
+    worker.cancelled.connect(thread.quit, Qt.DirectConnection)
+    worker.failed.connect(thread.quit, Qt.DirectConnection)
+    thread.start()
+    return thread
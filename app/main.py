@@ -1,15 +1,26 @@
+import argparse
 import sys
 from PyQt5.QtWidgets import QApplication
 from frontend.ui_main import MyApp
+from backend.data_sources import open_source
 
 def main():
     """
     Initializes and runs the PyQt application.
+
+    Optionally opens a file of bases, e.g. `python main.py bases.npy --index 3`.
     """
-    app = QApplication(sys.argv)
-    main_window = MyApp()
+    parser = argparse.ArgumentParser(description='Visualize the LLL reduction of a basis.')
+    parser.add_argument('input', nargs='?', help='File of bases: .npy, .npz, .csv or text lattices.')
+    parser.add_argument('--index', type=int, default=0, help='Which basis of the file to show.')
+    parser.add_argument('--format', choices=['npy', 'npz', 'csv', 'lattice'], default=None)
+    args, qt_args = parser.parse_known_args()
+
+    source = open_source(args.input, args.format) if args.input else None
+    app = QApplication(sys.argv[:1] + qt_args)
+    main_window = MyApp(source, args.index)
     main_window.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
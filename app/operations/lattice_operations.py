@@ -1,9 +1,42 @@
 ### lattice_operations.py
+from array import array
+from fractions import Fraction
+import math
+import time
 import numpy as np
-import scipy.interpolate
 
 np.seterr(divide='ignore', invalid='ignore')
 
+def gram_schmidt_qr(Basis):
+    """
+    Computes the Gram-Schmidt data of the basis from a single QR factorization.
+
+    With Basis.T = Q R, row i of the basis is sum_j R[j, i] * q_j, so the
+    orthogonalized vectors are U[j] = R[j, j] * q_j and mu[i][j] = R[j, i] / R[j, j].
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector.
+
+    Returns:
+        U (np.ndarray): The orthogonalized basis.
+        B (np.ndarray): Squared norms of the orthogonalized vectors.
+        mu (np.ndarray): Lower triangular (n x n) matrix of Gram-Schmidt coefficients.
+    """
+    n_rows, n_cols = Basis.shape
+    Q, R = np.linalg.qr(np.asarray(Basis, dtype=np.float64).T)
+    rank = R.shape[0]
+    r_diag = np.diagonal(R).copy()
+
+    U = np.zeros((n_rows, n_cols), dtype=np.float64)
+    U[:rank] = (Q * r_diag).T
+    B = np.zeros(n_rows, dtype=np.float64)
+    B[:rank] = r_diag ** 2
+
+    mu = np.zeros((n_rows, n_rows), dtype=np.float64)
+    mu[:, :rank] = (R / r_diag[:, None]).T
+    mu[np.triu_indices(n_rows)] = 0.0
+    return U, B, mu
+
 def gram_schmidt(Basis):
     """
     Performs Gram-Schmidt orthogonalization on the basis.
@@ -14,13 +47,7 @@ def gram_schmidt(Basis):
     Returns:
         U (np.ndarray): The orthogonalized basis.
     """
-    n_rows = Basis.shape[0]
-    U = np.zeros_like(Basis, dtype=np.float64)
-    U[0] = Basis[0]
-    for i in range(1, n_rows):
-        proj = sum((np.dot(Basis[i], U[j]) / np.dot(U[j], U[j])) * U[j] for j in range(i))
-        U[i] = Basis[i] - proj
-    return U
+    return gram_schmidt_qr(Basis)[0]
 
 def compute_coeff(Basis, U, mu):
     """
@@ -35,44 +62,1114 @@ def compute_coeff(Basis, U, mu):
         mu (np.ndarray): Updated mu array with computed coefficients.
     """
     n_rows = Basis.shape[0]
-    for i in range(n_rows):
-        for j in range(i):
-            mu[i][j] = np.dot(Basis[i], U[j]) / np.dot(U[j], U[j])
+    coeff = (Basis @ U.T) / np.einsum('ij,ij->i', U, U)
+    rows, cols = np.tril_indices(n_rows, -1)
+    mu[rows, cols] = coeff[rows, cols]
     return mu
 
-def LLL_reduction(Basis, delta=0.99):
+class ReductionCancelled(Exception):
+    """
+    Raised when a reduction is stopped through its should_stop callback.
+    """
+
+class LLLTrace:
+    """
+    Compact log of the steps taken by an LLL reduction, with on-demand replay.
+
+    Each step is stored as a delta: a size reduction b_k -= r * b_j as (k, j, r),
+    a swap of b_k and b_(k-1) as (k, k-1). Full copies of the basis are only kept
+    as checkpoints every `checkpoint_every` steps. When more than `max_checkpoints`
+    are held the spacing doubles and every other checkpoint is dropped, so memory
+    stays bounded by max_checkpoints * n * d however long the reduction runs.
+
+    Parameters:
+        Basis (np.ndarray): The basis before reduction. Copied.
+        checkpoint_every (int): Initial number of steps between checkpoints.
+        max_checkpoints (int): Maximum number of checkpoints kept.
+    """
+    SIZE_REDUCTION = 0
+    SWAP = 1
+
+    def __init__(self, Basis, checkpoint_every=64, max_checkpoints=32):
+        self.initial = np.array(Basis, copy=True)
+        self.kinds = array('b')
+        self.rows = array('q')
+        self.others = array('q')
+        self.multipliers = []
+        self.checkpoint_every = checkpoint_every
+        self.max_checkpoints = max_checkpoints
+        self.checkpoints = {0: self.initial}
+        # Replays continue in place, so the last replayed basis must never be a checkpoint
+        self._last = (0, self.initial.copy())
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def record_size_reduction(self, k, j, r, Basis):
+        """
+        Logs b_k -= r * b_j. Basis is the basis after the step, used for checkpoints.
+        """
+        self.kinds.append(self.SIZE_REDUCTION)
+        self.rows.append(k)
+        self.others.append(j)
+        self.multipliers.append(r)
+        self._checkpoint(Basis)
+
+    def record_swap(self, k, Basis):
+        """
+        Logs the swap of b_k and b_(k-1). Basis is the basis after the step.
+        """
+        self.kinds.append(self.SWAP)
+        self.rows.append(k)
+        self.others.append(k - 1)
+        self.multipliers.append(0)
+        self._checkpoint(Basis)
+
+    def _checkpoint(self, Basis):
+        step = len(self)
+        if step % self.checkpoint_every:
+            return
+        self.checkpoints[step] = Basis.copy()
+        if len(self.checkpoints) > self.max_checkpoints:
+            self.checkpoint_every *= 2
+            self.checkpoints = {
+                s: b for s, b in self.checkpoints.items() if s % self.checkpoint_every == 0
+            }
+
+    def apply(self, Basis, step):
+        """
+        Applies the logged step with index `step` to Basis in place.
+        """
+        k, j = self.rows[step], self.others[step]
+        if self.kinds[step] == self.SWAP:
+            Basis[[k, j]] = Basis[[j, k]]
+        else:
+            Basis[k] = Basis[k] - self.multipliers[step] * Basis[j]
+
+    def basis_at(self, step):
+        """
+        Rebuilds the basis after the first `step` steps from the nearest checkpoint.
+
+        Parameters:
+            step (int): Number of steps to apply, clipped to [0, len(self)].
+
+        Returns:
+            Basis (np.ndarray): A fresh copy of the basis at that step.
+        """
+        step = min(max(int(step), 0), len(self))
+        start = (step // self.checkpoint_every) * self.checkpoint_every
+        last_step, last = self._last
+        if start <= last_step <= step:
+            # Scrubbing forward: continue from the previous replay
+            start, Basis = last_step, last
+        else:
+            Basis = self.checkpoints[start].copy()
+        for i in range(start, step):
+            self.apply(Basis, i)
+        self._last = (step, Basis)
+        return Basis.copy()
+
+    def to_arrays(self):
+        """
+        Returns the trace as a dict of arrays, e.g. for np.savez. Inverse of from_arrays.
+        """
+        steps = sorted(self.checkpoints)
+        return {
+            'initial': self.initial,
+            'kinds': np.array(self.kinds, dtype=np.int8),
+            'rows': np.array(self.rows, dtype=np.int64),
+            'others': np.array(self.others, dtype=np.int64),
+            'multipliers': np.array(self.multipliers),
+            'checkpoint_steps': np.array(steps, dtype=np.int64),
+            'checkpoints': np.stack([self.checkpoints[s] for s in steps]),
+            'settings': np.array([self.checkpoint_every, self.max_checkpoints], dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Rebuilds a trace from the dict returned by to_arrays.
+        """
+        checkpoint_every, max_checkpoints = (int(v) for v in arrays['settings'])
+        trace = cls(arrays['initial'], checkpoint_every, max_checkpoints)
+        trace.kinds.extend(int(v) for v in arrays['kinds'])
+        trace.rows.extend(int(v) for v in arrays['rows'])
+        trace.others.extend(int(v) for v in arrays['others'])
+        trace.multipliers = arrays['multipliers'].tolist()
+        trace.checkpoints = {int(s): b for s, b in zip(arrays['checkpoint_steps'], arrays['checkpoints'])}
+        trace._last = (0, trace.checkpoints[0].copy())
+        return trace
+
+class LLLReducer:
+    """
+    Incremental LLL reduction engine.
+
+    Keeps the Gram-Schmidt vectors U, their squared norms B and the mu
+    matrix in step with the basis, so that size reduction and swaps only
+    touch the affected rows instead of re-orthogonalizing the whole basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector. Reduced in place.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        trace (LLLTrace): Optional log that records every size reduction and swap.
+        gram_schmidt (tuple): Optional (U, B, mu) of the first rows of Basis, reused
+            instead of recomputed; only the remaining rows are orthogonalized.
+    """
+
+    def __init__(self, Basis, delta=0.99, trace=None, gram_schmidt=None):
+        self.Basis = Basis
+        self.delta = delta
+        self.trace = trace
+        self.swaps = 0
+        self.size_reductions = 0
+        self.gs_recomputations = 0  # Calls to refresh
+        if gram_schmidt is None:
+            self.U, self.B, self.mu = gram_schmidt_qr(Basis)
+            return
+        U, B, mu = gram_schmidt
+        start, (n_rows, n_cols) = len(B), Basis.shape
+        self.U = np.zeros((n_rows, n_cols))
+        self.B = np.zeros(n_rows)
+        self.mu = np.zeros((n_rows, n_rows))
+        self.U[:start], self.B[:start], self.mu[:start, :start] = U, B, mu
+        if start < n_rows:
+            self.refresh(start)
+
+    def refresh(self, start=0):
+        """
+        Recomputes U, B and mu for rows start.. from the basis, keeping the rows
+        before `start`. Used to clear accumulated rounding error and after the
+        basis was changed outside of size_reduce and swap.
+        """
+        self.gs_recomputations += 1
+        if start == 0:
+            self.U, self.B, self.mu = gram_schmidt_qr(self.Basis)
+            return
+        U, B, mu = self.U, self.B, self.mu
+        rows = np.asarray(self.Basis[start:], dtype=np.float64)
+        mu[start:, :start] = (rows @ U[:start].T) / B[:start]
+        U[start:], B[start:], mu[start:, start:] = gram_schmidt_qr(rows - mu[start:, :start] @ U[:start])
+
+    def size_reduce(self, k, j, r=None):
+        """
+        Subtracts r * b_j from b_k and updates row k of mu, with r = round(mu[k][j])
+        unless given. Requires j < k. The Gram-Schmidt vectors are unchanged.
+        """
+        if r is None:
+            r = np.round(self.mu[k, j])
+        self.Basis[k] = self.Basis[k] - r * self.Basis[j]
+        self.mu[k, :j] -= r * self.mu[j, :j]
+        self.mu[k, j] -= r
+        self.size_reductions += 1
+        if self.trace is not None:
+            self.trace.record_size_reduction(k, j, r, self.Basis)
+
+    def swap(self, k):
+        """
+        Swaps b_k and b_(k-1) and updates U, B and mu in O(n + d).
+        """
+        U, B, mu = self.U, self.B, self.mu
+        self.Basis[[k, k - 1]] = self.Basis[[k - 1, k]]
+        mu[[k, k - 1], :k - 1] = mu[[k - 1, k], :k - 1]
+
+        m = mu[k, k - 1]
+        B_new = B[k] + m * m * B[k - 1]
+        mu[k, k - 1] = m * B[k - 1] / B_new
+
+        U_k1 = U[k] + m * U[k - 1]
+        U[k] = U[k - 1] - mu[k, k - 1] * U_k1
+        U[k - 1] = U_k1
+        B[k] = B[k - 1] * B[k] / B_new
+        B[k - 1] = B_new
+
+        t = mu[k + 1:, k].copy()
+        mu[k + 1:, k] = mu[k + 1:, k - 1] - m * t
+        mu[k + 1:, k - 1] = t + mu[k, k - 1] * mu[k + 1:, k]
+        self.swaps += 1
+        if self.trace is not None:
+            self.trace.record_swap(k, self.Basis)
+
+    def lovasz(self, k):
+        """
+        Checks the Lovász condition between b_(k-1) and b_k.
+        """
+        return self.B[k] >= (self.delta - self.mu[k, k - 1] ** 2) * self.B[k - 1]
+
+    def size_reduce_row(self, k):
+        """
+        Size-reduces b_k against b_(k-1), ..., b_0.
+        """
+        for j in range(k - 1, -1, -1):
+            if abs(self.mu[k, j]) > 0.5:
+                self.size_reduce(k, j)
+
+    def reduce(self, k=1, progress=None, should_stop=None, end=None):
+        """
+        Runs the LLL loop starting at index k.
+
+        Parameters:
+            k (int): Index to start from; rows before k are assumed LLL-reduced.
+            progress (callable): Called as progress(k, swaps) once per iteration.
+            should_stop (callable): Polled once per iteration; returning True raises ReductionCancelled.
+            end (int): Only reduce the rows before this index. Defaults to all rows.
+
+        Returns:
+            Basis (np.ndarray): The reduced basis matrix.
+        """
+        n_rows = self.Basis.shape[0] if end is None else end
+        while k < n_rows:
+            if should_stop is not None and should_stop():
+                raise ReductionCancelled(f"Reduction stopped at k={k} after {self.swaps} swaps")
+            self.size_reduce_row(k)
+
+            if self.lovasz(k):
+                k += 1
+            else:
+                self.swap(k)
+                k = max(k - 1, 1)
+
+            if progress is not None:
+                progress(k, self.swaps)
+        return self.Basis
+
+class L2Reducer:
+    """
+    LLL with floating-point Gram-Schmidt data and exact integer basis updates (L²-style).
+
+    The basis is kept as integers, int64 while entries are small enough that dot
+    products cannot overflow and Python ints (object dtype) beyond that, so row
+    updates never round or wrap around. Whenever row k is visited its Gram-Schmidt
+    coefficients are recomputed in float64 from the exact Gram row, and size
+    reduction repeats until every |mu[k][j]| <= eta, which removes the drift of
+    the floating-point values.
+
+    Parameters:
+        Basis (np.ndarray): Integer basis matrix where each row is a basis vector.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        eta (float): Size reduction bound, slightly above 0.5 to absorb rounding.
+        trace (LLLTrace): Optional log that records every size reduction and swap.
+    """
+    max_size_reduction_rounds = 64
+
+    def __init__(self, Basis, delta=0.99, eta=0.51, trace=None):
+        n_rows, n_cols = Basis.shape
+        self.Basis = _integer_basis(Basis)
+        self.delta = delta
+        self.eta = eta
+        self.trace = trace
+        self.safe_bits = (62 - math.ceil(math.log2(max(n_cols, 2)))) // 2
+        if self.Basis.dtype != object and max_entry_bits(self.Basis) > self.safe_bits:
+            self.Basis = self.Basis.astype(object)
+        self.mu = np.zeros((n_rows, n_rows))
+        self.r = np.zeros((n_rows, n_rows))
+        self.B = np.zeros(n_rows)
+        self.swaps = 0
+        self.size_reductions = 0
+        self.gs_recomputations = 0  # Rows recomputed by _compute_row
+
+    def _compute_row(self, k):
+        self.gs_recomputations += 1
+        # r[k][j] = <b_k, b_j> - sum_(i<j) mu[j][i] r[k][i], i.e. a unit lower triangular solve
+        gram = np.array(self.Basis[:k + 1] @ self.Basis[k], dtype=np.float64)
+        if k:
+            import scipy.linalg  # Deferred so importing the module stays cheap
+            r_k = scipy.linalg.solve_triangular(self.mu[:k, :k], gram[:k], lower=True,
+                                                unit_diagonal=True, check_finite=False)
+            self.r[k, :k] = r_k
+            self.mu[k, :k] = r_k / self.B[:k]
+            self.B[k] = gram[k] - np.dot(self.mu[k, :k], r_k)
+        else:
+            self.B[k] = gram[k]
+
+    def _subtract(self, k, j, X):
+        if self.Basis.dtype != object:
+            bits = X.bit_length() + max(max_entry_bits(self.Basis[j]), max_entry_bits(self.Basis[k])) + 1
+            if bits > self.safe_bits:
+                self.Basis = self.Basis.astype(object)
+        self.Basis[k] = self.Basis[k] - X * self.Basis[j]
+
+    def size_reduce_row(self, k):
+        """
+        Size-reduces b_k against all earlier rows, recomputing its Gram-Schmidt row
+        from the exact basis until every |mu[k][j]| <= eta.
+        """
+        for _ in range(self.max_size_reduction_rounds):
+            self._compute_row(k)
+            if k == 0 or np.abs(self.mu[k, :k]).max() <= self.eta:
+                return
+            for j in range(k - 1, -1, -1):
+                X = int(np.rint(self.mu[k, j]))
+                if X == 0:
+                    continue
+                self._subtract(k, j, X)
+                self.mu[k, :j] -= X * self.mu[j, :j]
+                self.mu[k, j] -= X
+                self.size_reductions += 1
+                if self.trace is not None:
+                    self.trace.record_size_reduction(k, j, X, self.Basis)
+        raise ArithmeticError("Size reduction did not converge in float64, use backend='exact'")
+
+    def reduce(self, k=1, progress=None, should_stop=None):
+        """
+        Runs the LLL loop starting at index k, see LLLReducer.reduce.
+
+        Returns:
+            Basis (np.ndarray): The reduced basis, int64 or object dtype.
+        """
+        n_rows = self.Basis.shape[0]
+        for i in range(k):
+            self._compute_row(i)
+        while k < n_rows:
+            if should_stop is not None and should_stop():
+                raise ReductionCancelled(f"Reduction stopped at k={k} after {self.swaps} swaps")
+
+            self.size_reduce_row(k)
+            if self.B[k] >= (self.delta - self.mu[k, k - 1] ** 2) * self.B[k - 1]:
+                k += 1
+            else:
+                self.Basis[[k, k - 1]] = self.Basis[[k - 1, k]]
+                self.swaps += 1
+                if self.trace is not None:
+                    self.trace.record_swap(k, self.Basis)
+                if k == 1:
+                    self._compute_row(0)
+                k = max(k - 1, 1)
+
+            if progress is not None:
+                progress(k, self.swaps)
+        return self.Basis
+
+class IntegralLLLReducer:
+    """
+    Exact LLL using only integer arithmetic (Cohen, Algorithm 2.6.7).
+
+    Instead of mu and the squared norms it keeps the integers d_i (Gram determinants
+    of the first i vectors) and lambda[k][j] = d_(j+1) * mu[k][j], with every division
+    exact. Nothing is rounded, so the result is correct for any entry size, at the
+    cost of big-integer arithmetic. Indices below follow the 1-based algorithm.
+
+    Parameters:
+        Basis (np.ndarray): Integer basis matrix with linearly independent rows.
+        delta (float): Lovász condition parameter, used as an exact fraction.
+        trace (LLLTrace): Optional log that records every size reduction and swap.
+    """
+
+    def __init__(self, Basis, delta=0.99, trace=None):
+        n_rows = Basis.shape[0]
+        self.Basis = _integer_basis(Basis).astype(object)
+        fraction = Fraction(delta).limit_denominator(1 << 16)
+        self.p, self.q = fraction.numerator, fraction.denominator
+        self.trace = trace
+        self.d = [1] + [0] * n_rows
+        self.lam = [[0] * (n_rows + 1) for _ in range(n_rows + 1)]
+        self.k_max = 0
+        self.swaps = 0
+        self.size_reductions = 0
+        self.gs_recomputations = 0  # Rows orthogonalized by _orthogonalize
+
+    def _dot(self, i, j):
+        return int(np.dot(self.Basis[i - 1], self.Basis[j - 1]))
+
+    def _orthogonalize(self, k):
+        self.gs_recomputations += 1
+        for j in range(1, k + 1):
+            u = self._dot(k, j)
+            for i in range(1, j):
+                u = (self.d[i] * u - self.lam[k][i] * self.lam[j][i]) // self.d[i - 1]
+            if j < k:
+                self.lam[k][j] = u
+            elif u == 0:
+                raise ValueError("The basis vectors are linearly dependent.")
+            else:
+                self.d[k] = u
+
+    def _size_reduce(self, k, l):
+        lam, d_l = self.lam[k][l], self.d[l]
+        if 2 * abs(lam) <= d_l:
+            return
+        q = (2 * lam + d_l) // (2 * d_l)
+        self.Basis[k - 1] = self.Basis[k - 1] - q * self.Basis[l - 1]
+        self.lam[k][l] = lam - q * d_l
+        for i in range(1, l):
+            self.lam[k][i] -= q * self.lam[l][i]
+        self.size_reductions += 1
+        if self.trace is not None:
+            self.trace.record_size_reduction(k - 1, l - 1, q, self.Basis)
+
+    def _swap(self, k):
+        d, lam = self.d, self.lam
+        self.Basis[[k - 1, k - 2]] = self.Basis[[k - 2, k - 1]]
+        for j in range(1, k - 1):
+            lam[k][j], lam[k - 1][j] = lam[k - 1][j], lam[k][j]
+        m = lam[k][k - 1]
+        B = (d[k - 2] * d[k] + m * m) // d[k - 1]
+        for i in range(k + 1, self.k_max + 1):
+            t = lam[i][k]
+            lam[i][k] = (d[k] * lam[i][k - 1] - m * t) // d[k - 1]
+            lam[i][k - 1] = (B * t + m * lam[i][k]) // d[k]
+        d[k - 1] = B
+        self.swaps += 1
+        if self.trace is not None:
+            self.trace.record_swap(k - 1, self.Basis)
+
+    def reduce(self, k=1, progress=None, should_stop=None):
+        """
+        Runs the integral LLL loop, see LLLReducer.reduce.
+
+        Returns:
+            Basis (np.ndarray): The reduced basis as an object array of Python ints.
+        """
+        n_rows = self.Basis.shape[0]
+        if self.k_max == 0:
+            self.k_max = 1
+            self._orthogonalize(1)
+        k = max(k, 1) + 1
+        while k <= n_rows:
+            if should_stop is not None and should_stop():
+                raise ReductionCancelled(f"Reduction stopped at k={k - 1} after {self.swaps} swaps")
+
+            if k > self.k_max:
+                self.k_max = k
+                self._orthogonalize(k)
+            self._size_reduce(k, k - 1)
+            m = self.lam[k][k - 1]
+            if self.q * (self.d[k] * self.d[k - 2] + m * m) < self.p * self.d[k - 1] ** 2:
+                self._swap(k)
+                k = max(2, k - 1)
+            else:
+                for l in range(k - 2, 0, -1):
+                    self._size_reduce(k, l)
+                k += 1
+
+            if progress is not None:
+                progress(k - 1, self.swaps)
+        return self.Basis
+
+# The float backend's row updates r * b_j stay exact in float64 up to FLOAT_MAX_BITS-bit
+# entries, and its Gram-Schmidt data keeps enough precision while rows * entry bits (a bound
+# on the bits of the Gram determinant's spread) stays within FLOAT_MAX_DIM_BITS.
+FLOAT_MAX_BITS = 26
+FLOAT_MAX_DIM_BITS = 2048
+# The L² backend's float64 Gram rows overflow beyond L2_MAX_BITS-bit entries, and its
+# coefficients lose precision beyond L2_MAX_DIM_BITS, 160 rows of 64-bit entries.
+L2_MAX_BITS = 480
+L2_MAX_DIM_BITS = 160 * 64
+
+REDUCERS = {
+    'float': LLLReducer,
+    'l2': L2Reducer,
+    'exact': IntegralLLLReducer,
+}
+
+def max_entry_bits(Basis):
+    """
+    Returns the bit length of the largest absolute entry of an integer array.
+    """
+    if Basis.size == 0:
+        return 0
+    if Basis.dtype == object:
+        return max(abs(int(x)).bit_length() for x in Basis.flat)
+    return int(np.abs(Basis).max()).bit_length()
+
+def select_backend(Basis):
+    """
+    Chooses the arithmetic backend for a basis from its entry size and dimension.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector.
+
+    Returns:
+        backend (str): 'float' for non-integer bases and for small entries in moderate dimension,
+            'l2' while rows * entry bits stays within L2_MAX_DIM_BITS, 'exact' beyond.
+    """
+    if Basis.dtype.kind == 'f' and not np.all(np.mod(Basis, 1) == 0):
+        return 'float'
+    n_rows = Basis.shape[0]
+    bits = max_entry_bits(Basis)
+    if Basis.dtype != object and bits <= FLOAT_MAX_BITS and n_rows * bits <= FLOAT_MAX_DIM_BITS:
+        return 'float'
+    if bits <= L2_MAX_BITS and n_rows * bits <= L2_MAX_DIM_BITS:
+        return 'l2'
+    return 'exact'
+
+def _integer_basis(Basis):
+    """
+    Returns the basis as int64, or as Python ints when entries do not fit.
+    """
+    if Basis.dtype == object:
+        return np.array([[int(x) for x in row] for row in Basis], dtype=object)
+    if Basis.dtype.kind == 'f':
+        if np.abs(Basis).max(initial=0) >= 2 ** 62:
+            return np.array([[int(x) for x in row] for row in Basis], dtype=object)
+        return Basis.astype(np.int64)
+    return Basis.astype(np.int64, copy=True)
+
+def LLL_reduction(Basis, delta=0.99, progress=None, should_stop=None, trace=None, backend='auto', stats=None):
     """
     Performs LLL lattice reduction on the Basis.
 
     Parameters:
         Basis (np.ndarray): The basis matrix where each row is a basis vector.
         delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        progress (callable): Optional progress(k, swaps) callback, see LLLReducer.reduce.
+        should_stop (callable): Optional cancellation check, see LLLReducer.reduce.
+        trace (LLLTrace): Optional log that records every step of the reduction.
+        backend (str): 'float', 'l2', 'exact' or 'auto' to pick one with select_backend.
+        stats (dict): Optional dict that receives the reducer's counters, see reducer_stats.
 
     Returns:
-        Basis (np.ndarray): The reduced basis matrix.
+        Basis (np.ndarray): The reduced basis matrix. Written back into Basis when its
+            dtype can hold the result, otherwise returned as an object array of Python ints.
+    """
+    if backend == 'auto':
+        backend = select_backend(Basis)
+    reducer = REDUCERS[backend](Basis, delta, trace=trace)
+    try:
+        reduced = reducer.reduce(progress=progress, should_stop=should_stop)
+    finally:
+        if stats is not None:
+            stats.update(reducer_stats(reducer), backend=backend)
+    if reduced is Basis:
+        return Basis
+    if Basis.dtype == object or (Basis.dtype.kind in 'iu' and max_entry_bits(reduced) >= 63):
+        return reduced
+    Basis[...] = reduced
+    return Basis
+
+def reducer_stats(reducer):
+    """
+    Returns the work counters of a reducer: swaps, size reductions and Gram-Schmidt
+    recomputations, plus insertions and enumeration nodes for BKZ.
+    """
+    stats = {
+        'swaps': reducer.swaps,
+        'size_reductions': reducer.size_reductions,
+        'gs_recomputations': reducer.gs_recomputations,
+    }
+    for name in ('insertions', 'nodes'):
+        if hasattr(reducer, name):
+            stats[name] = getattr(reducer, name)
+    return stats
+
+# Prefix snapshots kept by an IncrementalLLL session, evenly spaced over the rows
+INCREMENTAL_CHECKPOINTS = 8
+
+def edit_basis(Basis, action, index=None, values=None, columns=None):
+    """
+    Returns an edited copy of the basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector.
+        action (str): 'append' a row, 'delete' row index or 'modify' entries of row index.
+        index (int): Row to delete or modify.
+        values (sequence): The appended row, or the new entries of the modified row.
+        columns (sequence): Columns of row index that receive values. Defaults to all.
+
+    Returns:
+        Basis (np.ndarray): The edited basis, object dtype if an entry does not fit in int64.
     """
     n_rows, n_cols = Basis.shape
-    U = gram_schmidt(Basis)
-    mu = np.zeros((n_rows, n_cols))
-    k = 1
+    if action != 'append' and not 0 <= index < n_rows:
+        raise ValueError(f"Row index {index} is out of range for {n_rows} rows.")
+    if action == 'delete':
+        if n_rows == 1:
+            raise ValueError("Cannot delete the only basis vector.")
+        return np.delete(Basis, index, axis=0)
+    if action not in ('append', 'modify'):
+        raise ValueError("Unsupported edit. Use 'append', 'delete' or 'modify'.")
 
-    while k < n_rows:
-        # Size reduction
-        for j in range(k - 1, -1, -1):
-            mu = compute_coeff(Basis, U, mu)
-            if abs(mu[k][j]) > 0.5:
-                Basis[k] = Basis[k] -  np.round(mu[k][j]) * Basis[j]
-                U = gram_schmidt(Basis)
-
-        # Lovász condition
-        mu = compute_coeff(Basis, U, mu)
-        mu_k_k1 = mu[k][k - 1]
-        norm_Uk = np.dot(U[k], U[k])
-        norm_Uk1 = np.dot(U[k - 1], U[k - 1])
-        if norm_Uk >= (delta - mu_k_k1 ** 2) * norm_Uk1:
+    values = [float(x) if Basis.dtype.kind == 'f' else int(x) for x in np.ravel(values)]
+    columns = list(range(n_cols) if action == 'append' or columns is None else columns)
+    if len(values) != len(columns):
+        raise ValueError(f"Expected {len(columns)} entries, got {len(values)}.")
+    if not all(0 <= j < n_cols for j in columns):
+        raise ValueError(f"Column indices must be between 0 and {n_cols - 1}.")
+    dtype = Basis.dtype
+    if dtype.kind in 'iu' and any(abs(x) >= 2 ** 62 for x in values):
+        dtype = object
+    if action == 'append':
+        return np.concatenate((Basis.astype(dtype), np.array([values], dtype=dtype)))
+    edited = Basis.astype(dtype, copy=True)
+    edited[index, columns] = values
+    return edited
+
+class IncrementalLLL:
+    """
+    Keeps an LLL-reduced basis up to date while the original basis is edited.
+
+    An appended row does not change the lattice of the rows before it, so the
+    reduction resumes at the new row with the current reduced basis as prefix.
+    Deleting or modifying row i instead resumes from the longest recorded prefix
+    of at most i rows: when the LLL loop first reaches index m, its first m rows
+    are a reduced basis of the first m original rows, and such prefixes are kept
+    at INCREMENTAL_CHECKPOINTS evenly spaced lengths plus the full length. With
+    the float backend the prefix's Gram-Schmidt data is kept too, so only the
+    rows after it are orthogonalized. The exact backend has no resumable state
+    and restarts its loop at k = 1, which still skips the swaps of the prefix.
+
+    An edit only takes effect when its reduction completes; when it raises
+    (ReductionCancelled, or ValueError for a dependent row) the session keeps
+    its previous basis.
+
+    Parameters:
+        Basis (np.ndarray): The original basis, one row per vector.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        backend (str): 'float', 'l2', 'exact' or 'auto' to pick one with select_backend on every edit.
+        reduced (np.ndarray): An LLL-reduced basis of the same lattice, if already known.
+        max_checkpoints (int): Number of evenly spaced prefix snapshots.
+        progress (callable): Optional progress(k, swaps) callback for the initial reduction.
+        should_stop (callable): Optional cancellation check for the initial reduction.
+    """
+
+    def __init__(self, Basis, delta=0.99, backend='auto', reduced=None, max_checkpoints=INCREMENTAL_CHECKPOINTS,
+                 progress=None, should_stop=None):
+        self.delta = delta
+        self.backend = backend
+        self.max_checkpoints = max_checkpoints
+        self.Basis = np.array(Basis, copy=True)
+        self.prefixes = {}
+        self.stats = {}
+        if reduced is None:
+            self.reduced = self._resume(self.Basis, 0, progress, should_stop)
+        else:
+            self.reduced = np.array(reduced, copy=True)
+            self.prefixes[len(self.reduced)] = (self.reduced, None)
+
+    def append(self, values, progress=None, should_stop=None):
+        """
+        Appends a row to the basis and reduces only from that row on.
+
+        Returns:
+            reduced (np.ndarray): The reduced basis of the edited lattice.
+        """
+        n_rows = self.Basis.shape[0]
+        return self._edit(edit_basis(self.Basis, 'append', values=values), n_rows, progress, should_stop)
+
+    def delete(self, index, progress=None, should_stop=None):
+        """
+        Deletes row index and reduces from the last prefix before it.
+
+        Returns:
+            reduced (np.ndarray): The reduced basis of the edited lattice.
+        """
+        return self._edit(edit_basis(self.Basis, 'delete', index), index, progress, should_stop)
+
+    def modify(self, index, values, columns=None, progress=None, should_stop=None):
+        """
+        Sets entries of row index, see edit_basis, and reduces from the last prefix before it.
+
+        Returns:
+            reduced (np.ndarray): The reduced basis of the edited lattice.
+        """
+        edited = edit_basis(self.Basis, 'modify', index, values, columns)
+        return self._edit(edited, index, progress, should_stop)
+
+    def _edit(self, Basis, start, progress, should_stop):
+        self.stats = {}
+        self.reduced = self._resume(Basis, start, progress, should_stop)
+        self.Basis = Basis
+        return self.reduced.copy()
+
+    def _resume(self, Basis, start, progress, should_stop):
+        """
+        Reduces Basis, whose first `start` rows are unchanged, from the longest usable prefix.
+        """
+        prefixes = {m: prefix for m, prefix in self.prefixes.items() if m <= start}
+        length = max(prefixes, default=0)
+        prefix, gram_schmidt = prefixes.get(length, (Basis[:0], None))
+        working = np.concatenate((prefix, Basis[length:]))
+        n_rows = working.shape[0]
+
+        backend = select_backend(working) if self.backend == 'auto' else self.backend
+        if backend == 'float':
+            reducer = LLLReducer(working, self.delta, gram_schmidt=gram_schmidt)
+            if np.any(reducer.B[length:] <= 1e-9 * reducer.B.max()):
+                raise ValueError("The basis vectors are linearly dependent.")
+        else:
+            if backend == 'l2' and np.linalg.matrix_rank(np.asarray(working, dtype=np.float64)) < n_rows:
+                raise ValueError("The basis vectors are linearly dependent.")
+            reducer = REDUCERS[backend](working, self.delta)
+
+        spacing = max(-(-n_rows // self.max_checkpoints), 1)
+        # A swap at k = 1 leaves k at 1, so k = 1 never marks a new reduced prefix
+        reached = [max(length, 1)]
+
+        def record(k, swaps):
+            # Rows 0..k-1 are reduced the first time the loop gets past k - 1
+            if k > reached[0]:
+                reached[0] = k
+                if k % spacing == 0 and k < n_rows:
+                    prefixes[k] = self._snapshot(reducer, k)
+            if progress is not None:
+                progress(k, swaps)
+
+        try:
+            reduced = reducer.reduce(k=1 if backend == 'exact' else max(length, 1), progress=record,
+                                     should_stop=should_stop)
+        finally:
+            self.stats = dict(reducer_stats(reducer), backend=backend, resumed_at=length)
+        prefixes[n_rows] = self._snapshot(reducer, n_rows)
+        self.prefixes = prefixes
+        return reduced
+
+    def _snapshot(self, reducer, m):
+        rows = reducer.Basis[:m].copy()
+        if not isinstance(reducer, LLLReducer):
+            return rows, None
+        return rows, (reducer.U[:m].copy(), reducer.B[:m].copy(), reducer.mu[:m, :m].copy())
+
+class DeepLLLReducer(LLLReducer):
+    """
+    LLL with deep insertions (Schnorr-Euchner).
+
+    Instead of only swapping b_k with b_(k-1), b_k is inserted at the first
+    position i where its projection orthogonal to b_0, ..., b_(i-1) is shorter
+    than delta * B[i]. The insertion is carried out as k - i adjacent swaps, so
+    the Gram-Schmidt state and the trace are maintained exactly as in LLL.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector. Reduced in place.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        depth (int or None): Only insert at i < depth or i >= k - depth. None allows every position.
+        trace (LLLTrace): Optional log that records every size reduction and swap.
+    """
+
+    def __init__(self, Basis, delta=0.99, depth=None, trace=None):
+        super().__init__(Basis, delta, trace=trace)
+        self.depth = depth
+        self.insertions = 0
+
+    def insertion_index(self, k):
+        """
+        Returns the first position where b_k should be inserted, or None.
+        """
+        weights = self.mu[k, :k] ** 2 * self.B[:k]
+        # C[i] is the squared norm of b_k projected orthogonally to b_0, ..., b_(i-1)
+        C = self.B[k] + np.cumsum(weights[::-1])[::-1]
+        candidates = C < self.delta * self.B[:k]
+        if self.depth is not None:
+            i = np.arange(k)
+            candidates &= (i < self.depth) | (i >= k - self.depth)
+        if not candidates.any():
+            return None
+        return int(np.argmax(candidates))
+
+    def insert(self, k, i):
+        """
+        Moves b_k to position i and shifts b_i, ..., b_(k-1) up by one.
+        """
+        for j in range(k, i, -1):
+            self.swap(j)
+        self.insertions += 1
+
+    def reduce(self, k=1, progress=None, should_stop=None, end=None):
+        """
+        Runs the deep insertion loop starting at index k, see LLLReducer.reduce.
+        """
+        n_rows = self.Basis.shape[0] if end is None else end
+        while k < n_rows:
+            if should_stop is not None and should_stop():
+                raise ReductionCancelled(f"Reduction stopped at k={k} after {self.swaps} swaps")
+            self.size_reduce_row(k)
+
+            i = self.insertion_index(k)
+            if i is None:
+                k += 1
+            else:
+                self.insert(k, i)
+                k = max(i, 1)
+
+            if progress is not None:
+                progress(k, self.swaps)
+        return self.Basis
+
+def linear_pruning(block_size):
+    """
+    Linear pruning coefficients (Gama, Nguyen and Regev): a partial vector with
+    i of the block's coordinates fixed is kept while its length is below i / block_size
+    of the enumeration radius.
+
+    Parameters:
+        block_size (int): Number of vectors in the block.
+
+    Returns:
+        coefficients (np.ndarray): Bound factor for 1, ..., block_size fixed coordinates.
+    """
+    return np.arange(1, block_size + 1) / block_size
+
+def enumerate_shortest(mu, B, radius, pruning=None, max_nodes=None):
+    """
+    Schnorr-Euchner enumeration of the shortest nonzero vector in a block.
+
+    Parameters:
+        mu (np.ndarray): Gram-Schmidt coefficients of the block, lower triangular.
+        B (np.ndarray): Squared norms of the block's Gram-Schmidt vectors.
+        radius (float): Only vectors with squared projected norm below this are returned.
+        pruning (np.ndarray or None): Bound factors per number of fixed coordinates, see linear_pruning.
+        max_nodes (int or None): Give up after visiting this many enumeration nodes.
+
+    Returns:
+        x (list or None): Integer coefficients of the shortest vector found, or None.
+        norm (float): Its squared projected norm, or radius when nothing was found.
+        nodes (int): Number of enumeration nodes visited.
+    """
+    n = len(B)
+    mu, B = mu.tolist(), B.tolist()
+    factors = [1.0] * n if pruning is None else [float(f) for f in pruning]
+    # Level k has n - k coordinates fixed
+    factors = [factors[n - 1 - k] for k in range(n)]
+    bounds = [radius * f for f in factors]
+
+    x, c, l = [0] * n, [0.0] * n, [0.0] * (n + 1)
+    dx, ddx = [1] * n, [1] * n
+    best, nodes = None, 0
+    k = n - 1
+    while True:
+        y = x[k] - c[k]
+        length = l[k + 1] + y * y * B[k]
+        nodes += 1
+        if length < bounds[k]:
+            if k > 0:
+                l[k] = length
+                k -= 1
+                c[k] = -sum(x[j] * mu[j][k] for j in range(k + 1, n))
+                x[k] = round(c[k])
+                dx[k] = ddx[k] = 1 if c[k] >= x[k] else -1
+                continue
+            if length > 0:
+                best, radius = x.copy(), length
+                bounds = [radius * f for f in factors]
+        else:
             k += 1
+            if k == n:
+                break
+        if max_nodes is not None and nodes >= max_nodes:
+            break
+        # Next candidate at level k, zig-zagging around the center
+        if l[k + 1] == 0:
+            x[k] += 1
         else:
-            Basis[[k, k - 1]] = Basis[[k - 1, k]]  # Swap rows
-            U = gram_schmidt(Basis)
-            k = max(k - 1, 1)
-    return Basis
+            x[k] += dx[k]
+            ddx[k] = -ddx[k]
+            dx[k] = ddx[k] - dx[k]
+    return best, radius, nodes
+
+class BKZReducer(LLLReducer):
+    """
+    Block Korkine-Zolotarev reduction (Schnorr-Euchner BKZ) on top of the
+    incremental LLL engine.
+
+    Each tour walks k = 0, ..., n-2, enumerates the shortest vector of the
+    projected block [k, k + block_size) and, when it beats delta * B[k], makes it
+    b_k with unimodular row operations (size reductions and adjacent swaps on the
+    maintained Gram-Schmidt state) before LLL-reducing the block again. The
+    Gram-Schmidt state is recomputed from the basis at the start of every tour.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector. Reduced in place.
+        block_size (int): Number of vectors per enumeration block. 2 is equivalent to LLL.
+        delta (float): Lovász condition parameter, also used as the insertion threshold.
+        pruning (str, np.ndarray or None): 'linear', explicit bound factors, or None for full enumeration.
+        max_tours (int or None): Stop after this many tours.
+        max_time (float or None): Stop once this many seconds have passed, checked between blocks.
+        max_nodes (int or None): Enumeration node limit per block.
+        auto_abort (float or None): Stop when a tour lowers the basis potential by less than
+            this relative amount.
+        trace (LLLTrace): Optional log that records every size reduction and swap.
+    """
+
+    def __init__(self, Basis, block_size=10, delta=0.99, pruning=None, max_tours=None, max_time=None,
+                 max_nodes=None, auto_abort=None, trace=None):
+        super().__init__(Basis, delta, trace=trace)
+        self.block_size = block_size
+        self.pruning = pruning
+        self.max_tours = max_tours
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.auto_abort = auto_abort
+        self.insertions = 0
+        self.nodes = 0
+        self.tours = []
+
+    def potential(self):
+        """
+        Returns the log of the basis potential, sum of (n - i) * log B[i].
+        """
+        n_rows = len(self.B)
+        return float(np.sum((n_rows - np.arange(n_rows)) * np.log(self.B)))
+
+    def root_hermite_factor(self):
+        """
+        Returns (||b_0|| / det(L)^(1/n))^(1/n), the usual measure of reduction quality.
+        """
+        n_rows = len(self.B)
+        log_det = 0.5 * np.sum(np.log(self.B))
+        return float(np.exp((0.5 * np.log(self.B[0]) - log_det / n_rows) / n_rows))
+
+    def _pruning(self, block_size):
+        if isinstance(self.pruning, str):
+            return linear_pruning(block_size)
+        if self.pruning is not None:
+            return self.pruning[-block_size:]
+        return None
+
+    def insert_vector(self, k, x):
+        """
+        Makes sum_i x[i] * b_(k+i) the vector b_k.
+
+        Runs Euclid's algorithm on neighbouring coefficients from the end of the
+        block: b_i += q * b_(i-1) turns x[i-1] into x[i-1] - q * x[i], then the two
+        rows are swapped. The coefficients of a shortest vector have gcd 1, so the
+        block ends up starting with +-v and stays a basis of the same lattice.
+        """
+        x = list(x)
+        for i in range(len(x) - 1, 0, -1):
+            while x[i] != 0:
+                q = x[i - 1] // x[i]
+                if q:
+                    self.size_reduce(k + i, k + i - 1, -q)
+                    x[i - 1] -= q * x[i]
+                x[i - 1], x[i] = x[i], x[i - 1]
+                self.swap(k + i)
+        self.insertions += 1
+
+    def svp_reduce(self, k, end):
+        """
+        Enumerates the block [k, end) and inserts its shortest vector if it improves B[k].
+
+        Returns:
+            inserted (bool): Whether the basis was changed.
+        """
+        x, _, nodes = enumerate_shortest(
+            self.mu[k:end, k:end], self.B[k:end], self.delta * self.B[k],
+            pruning=self._pruning(end - k), max_nodes=self.max_nodes
+        )
+        self.nodes += nodes
+        if x is None:
+            return False
+        self.insert_vector(k, x)
+        return True
+
+    def tour(self, progress=None, should_stop=None, deadline=None):
+        """
+        Runs one BKZ tour.
+
+        Returns:
+            insertions (int): Number of blocks whose shortest vector was inserted.
+        """
+        n_rows = self.Basis.shape[0]
+        insertions = 0
+        for k in range(n_rows - 1):
+            if should_stop is not None and should_stop():
+                raise ReductionCancelled(f"Reduction stopped in tour {len(self.tours) + 1} at k={k}")
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            end = min(k + self.block_size, n_rows)
+            if self.svp_reduce(k, end):
+                insertions += 1
+                LLLReducer.reduce(self, max(k, 1), progress, should_stop, end=end)
+            elif progress is not None:
+                progress(k, self.swaps)
+        return insertions
+
+    def reduce(self, k=1, progress=None, should_stop=None):
+        """
+        LLL-reduces the basis from index k, then runs BKZ tours until one makes no
+        insertion or an early abort condition is met. Each tour appends its time,
+        insertions, enumeration nodes, swaps, ||b_0|| and root Hermite factor to self.tours.
+
+        Returns:
+            Basis (np.ndarray): The reduced basis matrix.
+        """
+        start = time.perf_counter()
+        deadline = None if self.max_time is None else start + self.max_time
+        LLLReducer.reduce(self, k, progress, should_stop)
+        potential = self.potential()
+        while self.max_tours is None or len(self.tours) < self.max_tours:
+            self.refresh()
+            tour_start, nodes, swaps = time.perf_counter(), self.nodes, self.swaps
+            insertions = self.tour(progress, should_stop, deadline)
+            previous, potential = potential, self.potential()
+            self.tours.append({
+                'tour': len(self.tours) + 1,
+                'seconds': time.perf_counter() - tour_start,
+                'insertions': insertions,
+                'nodes': self.nodes - nodes,
+                'swaps': self.swaps - swaps,
+                'first_norm': float(np.sqrt(self.B[0])),
+                'root_hermite_factor': self.root_hermite_factor(),
+            })
+            if insertions == 0 or (deadline is not None and time.perf_counter() > deadline):
+                break
+            if self.auto_abort is not None and previous - potential < self.auto_abort * abs(previous):
+                break
+        # Rows after a block can lose size reduction when the block changes
+        LLLReducer.reduce(self, 1, progress, should_stop)
+        return self.Basis
+
+def deep_LLL_reduction(Basis, delta=0.99, depth=None, progress=None, should_stop=None, trace=None, stats=None):
+    """
+    Performs LLL reduction with deep insertions on the Basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector. Reduced in place.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        depth (int or None): Insertion depth, see DeepLLLReducer.
+        progress (callable): Optional progress(k, swaps) callback, see LLLReducer.reduce.
+        should_stop (callable): Optional cancellation check, see LLLReducer.reduce.
+        trace (LLLTrace): Optional log that records every step of the reduction.
+        stats (dict): Optional dict that receives the reducer's counters, see reducer_stats.
+
+    Returns:
+        Basis (np.ndarray): The reduced basis matrix.
+    """
+    reducer = DeepLLLReducer(Basis, delta, depth=depth, trace=trace)
+    try:
+        return reducer.reduce(progress=progress, should_stop=should_stop)
+    finally:
+        if stats is not None:
+            stats.update(reducer_stats(reducer))
+
+def BKZ_reduction(Basis, block_size=10, delta=0.99, pruning=None, max_tours=None, max_time=None,
+                  max_nodes=None, auto_abort=None, progress=None, should_stop=None, trace=None, tours=None,
+                  stats=None):
+    """
+    Performs BKZ reduction on the Basis.
+
+    Parameters:
+        Basis (np.ndarray): The basis matrix where each row is a basis vector. Reduced in place.
+        block_size (int): Number of vectors per enumeration block.
+        delta (float): Lovász condition parameter. Typically between 0.5 and 1.0.
+        pruning (str, np.ndarray or None): Enumeration pruning, see BKZReducer.
+        max_tours (int or None): Stop after this many tours.
+        max_time (float or None): Time budget in seconds.
+        max_nodes (int or None): Enumeration node limit per block.
+        auto_abort (float or None): Minimum relative potential decrease per tour.
+        progress (callable): Optional progress(k, swaps) callback, see LLLReducer.reduce.
+        should_stop (callable): Optional cancellation check, see LLLReducer.reduce.
+        trace (LLLTrace): Optional log that records every step of the reduction.
+        tours (list): Optional list that receives one statistics dict per tour.
+        stats (dict): Optional dict that receives the reducer's counters, see reducer_stats.
+
+    Returns:
+        Basis (np.ndarray): The reduced basis matrix.
+    """
+    reducer = BKZReducer(Basis, block_size, delta, pruning=pruning, max_tours=max_tours, max_time=max_time,
+                         max_nodes=max_nodes, auto_abort=auto_abort, trace=trace)
+    try:
+        reduced = reducer.reduce(progress=progress, should_stop=should_stop)
+    finally:
+        if stats is not None:
+            stats.update(reducer_stats(reducer))
+    if tours is not None:
+        tours.extend(reducer.tours)
+    return reduced
+
+REDUCTIONS = {
+    'lll': LLL_reduction,
+    'deep': deep_LLL_reduction,
+    'bkz': BKZ_reduction,
+}
+
+# Bump whenever a change to the reductions can change their output, so cached results are invalidated
+REDUCTION_VERSION = 1
@@ -0,0 +1,169 @@
+import numpy as np
+
+# Above this many rows and columns PCA switches from a thin SVD to a randomized one
+RANDOMIZED_SVD_SIZE = 2000
+
+class Projection:
+    """
+    Fixed affine map from R^d to R^k: x -> (x - mean) @ components.
+
+    Fitted once per basis pair, so every animation frame is projected by the same
+    map and costs one (n x d) @ (d x k) product.
+
+    Parameters:
+        mean (np.ndarray): (d,) centre subtracted before projecting.
+        components (np.ndarray): (d, k) projection matrix.
+        method (str): Name of the method that produced it.
+    """
+
+    def __init__(self, mean, components, method):
+        self.mean = mean
+        self.components = components
+        self.method = method
+
+    @property
+    def origin(self):
+        ''' Image of the zero vector '''
+        return -self.mean @ self.components
+
+    def transform(self, X):
+        """
+        Projects the rows of X, which may be any stack (..., d).
+
+        Returns:
+            Y (np.ndarray): (..., k) projected coordinates.
+        """
+        return (np.asarray(X, dtype=np.float64) - self.mean) @ self.components
+
+def _points(bases):
+    return np.concatenate([np.asarray(B, dtype=np.float64).reshape(-1, np.shape(B)[-1]) for B in bases])
+
+def _randomized_range(X, k, oversample=10, power_iterations=2, rng=None):
+    """
+    Orthonormal (d, k + oversample) basis approximating the top right singular subspace of X.
+    """
+    rng = np.random.default_rng(rng)
+    Q = X.T @ rng.standard_normal((X.shape[0], k + oversample))
+    for _ in range(power_iterations):
+        Q, _ = np.linalg.qr(Q)
+        Q = X.T @ (X @ Q)
+    Q, _ = np.linalg.qr(Q)
+    return Q
+
+def pca_projection(bases, k=2, seed=None):
+    """
+    Projects onto the top k principal axes of the rows of all given bases.
+
+    Uses a thin SVD of the centred rows, or a randomized SVD with power
+    iterations when both the number of rows and the dimension are large.
+
+    Parameters:
+        bases (sequence of np.ndarray): The bases to fit on, e.g. (Basis, target_Basis).
+        k (int): Output dimension.
+        seed (int or None): Seed for the randomized SVD.
+
+    Returns:
+        projection (Projection): The fitted projection.
+    """
+    X = _points(bases)
+    mean = X.mean(axis=0)
+    X = X - mean
+    if min(X.shape) > RANDOMIZED_SVD_SIZE:
+        Q = _randomized_range(X, k, rng=seed)
+        _, _, Vt = np.linalg.svd(X @ Q, full_matrices=False)
+        components = Q @ Vt[:k].T
+    else:
+        import scipy.linalg
+        _, _, Vt = scipy.linalg.svd(X, full_matrices=False, lapack_driver='gesdd')
+        components = Vt[:k].T
+    return Projection(mean, _pad_columns(components, k), 'pca')
+
+def random_projection(bases, k=2, kind='gaussian', density=None, seed=None):
+    """
+    Johnson-Lindenstrauss random projection of the centred rows.
+
+    Parameters:
+        bases (sequence of np.ndarray): The bases, only used for the dimension and centre.
+        k (int): Output dimension.
+        kind (str): 'gaussian' for N(0, 1/k) entries, 'sparse' for entries +-sqrt(1/(density k))
+            with probability density / 2 each and 0 otherwise.
+        density (float or None): Non-zero fraction for 'sparse', defaults to 1/sqrt(d).
+        seed (int or None): Seed, fixed so that the same basis always gets the same view.
+
+    Returns:
+        projection (Projection): The projection.
+    """
+    X = _points(bases)
+    d = X.shape[1]
+    rng = np.random.default_rng(seed)
+    if kind == 'gaussian':
+        components = rng.standard_normal((d, k)) / np.sqrt(k)
+    elif kind == 'sparse':
+        density = density or 1.0 / np.sqrt(d)
+        signs = rng.choice((-1.0, 0.0, 1.0), size=(d, k), p=(density / 2, 1 - density, density / 2))
+        components = signs / np.sqrt(density * k)
+    else:
+        raise ValueError("Unsupported random projection. Use 'gaussian' or 'sparse'.")
+    return Projection(X.mean(axis=0), components, kind)
+
+def mds_projection(bases, k=2):
+    """
+    Classical (Torgerson) MDS of the rows, turned into a linear map.
+
+    The embedding comes from the top eigenvectors of the double-centred Gram
+    matrix of the rows. With eigenpairs (l, u), the map x -> x @ X.T @ u / sqrt(l)
+    reproduces it exactly on the rows and is linear, so intermediate frames are
+    projected consistently. With Euclidean distances this matches PCA up to sign;
+    the Gram formulation costs O(m^2 d) for m rows, which suits few rows in very
+    high dimension.
+
+    Parameters:
+        bases (sequence of np.ndarray): The bases to fit on.
+        k (int): Output dimension.
+
+    Returns:
+        projection (Projection): The fitted projection.
+    """
+    X = _points(bases)
+    mean = X.mean(axis=0)
+    X = X - mean
+    gram = X @ X.T  # Equals -1/2 J D^2 J for the squared distance matrix D^2 of centred rows
+    m = len(gram)
+    import scipy.linalg
+    eigenvalues, eigenvectors = scipy.linalg.eigh(gram, subset_by_index=(max(m - k, 0), m - 1))
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues = eigenvalues[order]
+    scale = np.zeros_like(eigenvalues)
+    positive = eigenvalues > eigenvalues.max(initial=0.0) * 1e-12
+    scale[positive] = 1.0 / np.sqrt(eigenvalues[positive])
+    components = X.T @ (eigenvectors[:, order] * scale)
+    return Projection(mean, _pad_columns(components, k), 'mds')
+
+def _pad_columns(components, k):
+    # Fewer rows than k leaves fewer axes; keep the output k-dimensional
+    if components.shape[1] < k:
+        components = np.pad(components, ((0, 0), (0, k - components.shape[1])))
+    return components
+
+PROJECTIONS = {
+    'pca': pca_projection,
+    'gaussian': lambda bases, k=2, seed=None: random_projection(bases, k, 'gaussian', seed=seed),
+    'sparse': lambda bases, k=2, seed=None: random_projection(bases, k, 'sparse', seed=seed),
+    'mds': lambda bases, k=2, seed=None: mds_projection(bases, k),
+}
+
+def fit_projection(Basis, target_Basis, method='pca', k=2, seed=0):
+    """
+    Fits one projection for a basis and its reduced target, to be reused for every frame.
+
+    Parameters:
+        Basis (np.ndarray): The original basis matrix.
+        target_Basis (np.ndarray): The reduced basis matrix.
+        method (str): Name in PROJECTIONS.
+        k (int): Output dimension.
+        seed (int): Seed for the random and randomized methods.
+
+    Returns:
+        projection (Projection): The fitted projection.
+    """
+    return PROJECTIONS[method]((Basis, target_Basis), k=k, seed=seed)
@@ -1,6 +1,7 @@
 ### vector_operations.py
+import functools
+import warnings
 import numpy as np
-import scipy.interpolate
 
 np.seterr(divide='ignore', invalid='ignore')
 
@@ -8,27 +9,27 @@ def interpolate(X, Y, scale=100, method='cubicspline', ret='XY'):
     """
     Interpolates the given data points using the specified method.
 
+    Y may be a single row or a 2-D array with one row per curve; all rows share
+    the x grid and are interpolated in one matrix product.
+
     Parameters:
         X (array-like): The x-coordinates of the data points.
-        Y (array-like): The y-coordinates of the data points.
+        Y (array-like): The y-coordinates of the data points, shape (len(X),) or (rows, len(X)).
         scale (int): The number of points to interpolate between min and max of X.
         method (str): The interpolation method to use. Currently supports 'cubicspline'.
         ret (str): Return type. 'Y' for interpolated Y values, 'XY' for both X and Y.
 
     Returns:
-        If ret == 'Y': Returns the interpolated Y values.
+        If ret == 'Y': Returns the interpolated Y values, shape (scale,) or (rows, scale).
         If ret == 'XY': Returns a tuple (X_plot, Y_plot).
     """
-    x_data = np.asarray(X)
-    y_data = np.asarray(Y)
+    x_data = np.asarray(X, dtype=np.float64)
+    y_data = np.asarray(Y, dtype=np.float64)
     x_plot = np.linspace(x_data.min(), x_data.max(), scale)
 
     try:
-        if method == 'cubicspline':
-            spline = scipy.interpolate.CubicSpline(x_data, y_data)
-            y_plot = spline(x_plot)
-        else:
-            raise ValueError("Unsupported interpolation method. Use 'cubicspline'.")
+        weights = interpolation_matrix(x_data, method, scale)
+        y_plot = y_data @ weights.T
 
         # Replace non-finite values with zeros
         if np.any(~np.isfinite(y_plot)):
@@ -37,38 +38,124 @@ def interpolate(X, Y, scale=100, method='cubicspline', ret='XY'):
 
     except Exception as e:
         print(f"Interpolation failed: {e}")
-        y_plot = np.zeros_like(x_plot)
+        y_plot = np.zeros(y_data.shape[:-1] + x_plot.shape)
 
     if ret == 'Y':
         return y_plot
     return x_plot, y_plot
 
+def interpolation_matrix(X, method='cubicspline', scale=100):
+    """
+    Returns the (scale, len(X)) matrix W such that Y @ W.T interpolates every row of Y.
+
+    Spline interpolation is linear in the data, so W is fitted once per
+    (x grid, method, scale) and cached; later calls for any Y are a matrix product.
+
+    Parameters:
+        X (array-like): The x-coordinates of the data points.
+        method (str): The interpolation method to use. Currently supports 'cubicspline'.
+        scale (int): The number of points to interpolate between min and max of X.
+
+    Returns:
+        weights (np.ndarray): Read-only interpolation matrix.
+    """
+    x_data = np.asarray(X, dtype=np.float64)
+    return _interpolation_matrix(x_data.tobytes(), method, scale)
+
+@functools.lru_cache(maxsize=32)
+def _interpolation_matrix(x_key, method, scale):
+    x_data = np.frombuffer(x_key, dtype=np.float64)
+    x_plot = np.linspace(x_data.min(), x_data.max(), scale)
+    if method == 'cubicspline':
+        import scipy.interpolate  # Deferred with scipy.linalg below, importing scipy dominates start-up
+        weights = scipy.interpolate.CubicSpline(x_data, np.eye(x_data.size))(x_plot)
+    else:
+        raise ValueError("Unsupported interpolation method. Use 'cubicspline'.")
+    weights.setflags(write=False)
+    return weights
+
 def calculate_angles_with_complementary(Basis):
     """
     Calculates angles between each basis vector and its complementary subspace.
 
     Parameters:
-        Basis (np.ndarray): The basis matrix where each row is a basis vector.
+        Basis (np.ndarray): The basis matrix where each row is a basis vector,
+            or a stack of bases with shape (batch, n, d).
 
     Returns:
-        angles (np.ndarray): Array of angles in degrees between each basis vector and its complementary subspace.
+        angles (np.ndarray): Array of angles in degrees between each basis vector and its complementary subspace,
+            with shape (n,) or (batch, n).
     """
-    normal_vectors = calculateNormal(Basis)
+    # Only the direction of the normals matters here, so skip the determinant
+    # scaling that overflows float64 for large bases.
+    normal_vectors = calculateNormal(Basis, scaled=False)
     angles = calculateAngle(Basis, normal_vectors)
     return np.abs(angles - 90)
 
-def calculateNormal(Basis):
+def calculateNormal(Basis, scaled=True):
     """
     Calculates normal vectors for each basis vector with respect to its complementary subspace.
 
+    For a square, non-singular basis the cofactor matrix is det(Basis) * inv(Basis).T,
+    so a single LU factorization gives every normal at once. Singular square bases
+    fall back to explicit cofactors, and rectangular bases use the dual basis
+    (rows of pinv(Basis).T), which is orthogonal to all other basis vectors.
+
     Parameters:
-        Basis (np.ndarray): The basis matrix where each row is a basis vector.
+        Basis (np.ndarray): The basis matrix where each row is a basis vector,
+            or a stack of bases with shape (batch, n, d).
+        scaled (bool): If True, return the cofactor vectors (rounded). If False, return
+            the dual basis vectors, which point the same way up to the sign of det(Basis).
 
     Returns:
         normal_vectors (np.ndarray): Array of normal vectors corresponding to each basis vector.
     """
-    b = Basis.copy()
-    # print(b)
+    b = np.asarray(Basis, dtype=np.float64)
+    n_vectors, dimension = b.shape[-2:]
+    if n_vectors != dimension:
+        return np.swapaxes(np.linalg.pinv(b), -1, -2)
+    if b.ndim > 2:
+        return _stacked_normals(b, scaled)
+
+    import scipy.linalg
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', scipy.linalg.LinAlgWarning)
+        lu, piv = scipy.linalg.lu_factor(b, check_finite=False)
+    diag = np.diagonal(lu)
+    if np.abs(diag).min() <= n_vectors * np.finfo(np.float64).eps * np.abs(diag).max():
+        return _cofactor_normals(b)
+
+    # inv(Basis).T solves Basis.T @ X = I
+    dual = scipy.linalg.lu_solve((lu, piv), np.eye(n_vectors), trans=1, check_finite=False)
+    if not scaled:
+        return dual
+    n_swaps = np.count_nonzero(piv != np.arange(n_vectors))
+    det = (-1) ** n_swaps * np.prod(np.sign(diag)) * np.exp(np.sum(np.log(np.abs(diag))))
+    return np.round(det * dual)
+
+def _stacked_normals(Basis, scaled):
+    """
+    Normal vectors for a stack of square bases, using batched LAPACK calls.
+    Singular bases in the stack go through the cofactor fallback one by one.
+    """
+    sign, logdet = np.linalg.slogdet(Basis)
+    normal_vectors = np.empty_like(Basis)
+    regular = sign != 0
+    if regular.any():
+        dual = np.linalg.inv(np.swapaxes(Basis[regular], -1, -2))
+        if scaled:
+            det = sign[regular] * np.exp(logdet[regular])
+            dual = np.round(det[:, None, None] * dual)
+        normal_vectors[regular] = dual
+    for index in zip(*np.nonzero(~regular)):
+        normal_vectors[index] = _cofactor_normals(Basis[index])
+    return normal_vectors
+
+def _cofactor_normals(Basis):
+    """
+    Computes normal vectors from explicit (n-1) x (n-1) cofactors. Used for singular bases,
+    where the inverse does not exist.
+    """
     normal_vectors = []
     n_vectors = Basis.shape[0]
     dimension = Basis.shape[1]
@@ -76,8 +163,7 @@ def calculateNormal(Basis):
         n_vector = np.zeros(dimension)  # Initialize normal vector
         for j in range(dimension):
             # Create a submatrix by deleting current row and current column
-            sub_matrix = np.delete(np.delete(b, i, axis=0), j, axis=1)
-            # print(sub_matrix)
+            sub_matrix = np.delete(np.delete(Basis, i, axis=0), j, axis=1)
             n_vector[j] = (-1) ** (j + i) * np.linalg.det(sub_matrix)
         n_vector = np.round(n_vector)
         normal_vectors.append(n_vector)
@@ -87,6 +173,9 @@ def calculateAngle(Basis, normal_vectors):
     """
     Calculates the angles between each basis vector and its corresponding normal vector.
 
+    Both arrays may carry leading batch dimensions, e.g. (batch, n, d). Rows where
+    either vector has zero norm get an angle of 0.
+
     Parameters:
         Basis (np.ndarray): The basis matrix where each row is a basis vector.
         normal_vectors (np.ndarray): Array of normal vectors corresponding to each basis vector.
@@ -94,19 +183,111 @@ def calculateAngle(Basis, normal_vectors):
     Returns:
         angles (np.ndarray): Array of angles in degrees.
     """
-    angles = []
-    for i in range(Basis.shape[0]):
-        b = Basis[i]
-        n = normal_vectors[i]
-        norm_b = np.linalg.norm(b)
-        norm_n = np.linalg.norm(n)
-        if norm_b == 0 or norm_n == 0:
-            print(f"Zero norm encountered for basis vector {i}. Setting angle to 0.")
-            angles.append(0.0)
-            continue
-        cos_theta = np.dot(b, n) / (norm_b * norm_n)
-        # Ensure the cosine value is within valid range to avoid numerical errors
-        cos_theta = np.clip(cos_theta, -1.0, 1.0)
-        angle = np.degrees(np.arccos(cos_theta))
-        angles.append(angle)
-    return np.round(np.array(angles))
+    b = np.asarray(Basis, dtype=np.float64)
+    n = np.asarray(normal_vectors, dtype=np.float64)
+    norm_b = np.linalg.norm(b, axis=-1)
+    norm_n = np.linalg.norm(n, axis=-1)
+    dots = np.einsum('...ij,...ij->...i', b, n)
+
+    valid = (norm_b != 0) & (norm_n != 0)
+    cos_theta = np.divide(dots, norm_b * norm_n, out=np.zeros_like(dots), where=valid)
+    # Ensure the cosine value is within valid range to avoid numerical errors
+    cos_theta = np.clip(cos_theta, -1.0, 1.0)
+    angles = np.where(valid, np.degrees(np.arccos(cos_theta)), 0.0)
+    return np.round(angles)
+
+def _as_float(Y):
+    # Floating rows keep their precision, so float32 frames are not copied to float64
+    Y = np.asarray(Y)
+    return Y if Y.dtype.kind == 'f' else Y.astype(np.float64)
+
+def minmax_envelope(x, Y, start, stop, n_buckets):
+    """
+    Decimates rows to the minimum and maximum of each bucket of columns.
+
+    Columns start..stop are split into at most n_buckets equal buckets and each
+    keeps its min and max in x order, so a line through the result covers the
+    same vertical extent per bucket as the full row.
+
+    Parameters:
+        x (np.ndarray): (d,) x values of the columns.
+        Y (np.ndarray): (..., d) rows.
+        start, stop (int): Column range to decimate.
+        n_buckets (int): Maximum number of buckets.
+
+    Returns:
+        xs, ys (np.ndarray): (..., m) x and y values of the kept points, m <= 2 * n_buckets.
+    """
+    Y = _as_float(Y)
+    count = stop - start
+    size = -(-count // max(n_buckets, 1))
+    n_buckets = -(-count // size)
+    pad = [(0, 0)] * (Y.ndim - 1) + [(0, n_buckets * size - count)]
+    window = Y[..., start:stop]
+    shape = Y.shape[:-1] + (n_buckets, size)
+    low = np.pad(window, pad, constant_values=np.inf).reshape(shape).argmin(axis=-1)
+    high = np.pad(window, pad, constant_values=-np.inf).reshape(shape).argmax(axis=-1)
+    first = start + np.arange(n_buckets) * size
+    index = np.stack((first + np.minimum(low, high), first + np.maximum(low, high)), axis=-1)
+    index = index.reshape(Y.shape[:-1] + (2 * n_buckets,))
+    return np.asarray(x)[index], np.take_along_axis(Y, index, axis=-1)
+
+def lttb(x, Y, start, stop, n_out):
+    """
+    Largest-Triangle-Three-Buckets decimation of every row, vectorized over rows.
+
+    Keeps the first and last column and, from each of n_out - 2 buckets in
+    between, the point spanning the largest triangle with the previously kept
+    point and the mean of the next bucket.
+
+    Parameters:
+        x (np.ndarray): (d,) x values of the columns.
+        Y (np.ndarray): (n, d) rows.
+        start, stop (int): Column range to decimate.
+        n_out (int): Number of points kept per row, at least 3.
+
+    Returns:
+        xs, ys (np.ndarray): (n, m) x and y values of the kept points, m <= n_out.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    Y = _as_float(Y)
+    n_rows = Y.shape[0]
+    n_out = max(n_out, 3)
+    if stop - start <= n_out:
+        index = np.broadcast_to(np.arange(start, stop), (n_rows, stop - start))
+        return x[index], Y[:, start:stop]
+
+    edges = np.floor(np.linspace(start + 1, stop - 1, n_out - 1)).astype(int)
+    index = np.empty((n_rows, n_out), dtype=int)
+    index[:, 0] = start
+    index[:, -1] = stop - 1
+    rows = np.arange(n_rows)
+    previous = np.full(n_rows, start)
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (stop - 1, stop)
+        mean_x = x[next_lo:next_hi].mean()
+        mean_y = Y[:, next_lo:next_hi].mean(axis=1)
+        ax, ay = x[previous], Y[rows, previous]
+        area = np.abs((ax - mean_x)[:, None] * (Y[:, lo:hi] - ay[:, None])
+                      - (ax[:, None] - x[lo:hi]) * (mean_y - ay)[:, None])
+        previous = lo + area.argmax(axis=1)
+        index[:, i + 1] = previous
+    return x[index], np.take_along_axis(Y, index, axis=1)
+
+def aggregate_dimensions(Y, n_buckets, reduce=np.maximum):
+    """
+    Combines the columns of Y into at most n_buckets contiguous groups.
+
+    Parameters:
+        Y (np.ndarray): (..., d) rows.
+        n_buckets (int): Maximum number of groups.
+        reduce (np.ufunc): Reduction applied within each group, the maximum by default.
+
+    Returns:
+        aggregated (np.ndarray): (..., m) reduced rows.
+        edges (np.ndarray): (m + 1,) column boundaries of the groups.
+    """
+    d = np.shape(Y)[-1]
+    edges = np.unique(np.linspace(0, d, min(n_buckets, d) + 1).round().astype(int))
+    return reduce.reduceat(Y, edges[:-1], axis=-1), edges